@@ -162,3 +162,22 @@ def map_to_click_exceptions(f):
 map_to_click_exceptions._do_map = not bool(  # type: ignore[attr-defined]
     os.environ.get("DANDI_DEVEL", None)
 )
+
+
+def dump_request_stats(f):
+    """Dump the HTTP request statistics (if enabled) once the command finishes.
+
+    See `dandi.support.request_stats` for details.
+    """
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        # Avoid heavy import by importing within function:
+        from ..support.request_stats import request_stats
+
+        try:
+            return f(*args, **kwargs)
+        finally:
+            request_stats.dump()
+
+    return wrapper
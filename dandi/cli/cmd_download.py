@@ -9,6 +9,7 @@ from .base import (
     ChoiceList,
     EnumChoice,
     IntColonInt,
+    dump_request_stats,
     instance_option,
     map_to_click_exceptions,
 )
@@ -157,6 +158,7 @@ Download files or entire folders from DANDI.
 # )
 @click.argument("url", nargs=-1)
 @map_to_click_exceptions
+@dump_request_stats
 def download(
     url: Sequence[str],
     output_dir: str,
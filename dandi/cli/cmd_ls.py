@@ -5,7 +5,12 @@ import os.path as op
 import click
 from dandischema import models
 
-from .base import devel_option, lgr, map_to_click_exceptions
+from .base import (
+    devel_option,
+    dump_request_stats,
+    lgr,
+    map_to_click_exceptions,
+)
 from .formatter import JSONFormatter, JSONLinesFormatter, PYOUTFormatter, YAMLFormatter
 from ..consts import ZARR_EXTENSIONS, metadata_all_fields
 from ..dandiarchive import DandisetURL, _dandi_url_parser, parse_dandi_url
@@ -80,6 +85,7 @@ files/directories.
     "paths", nargs=-1, type=click.Path(exists=False, dir_okay=True), metavar="PATH|URL"
 )
 @map_to_click_exceptions
+@dump_request_stats
 def ls(
     paths,
     schema,
@@ -192,6 +198,8 @@ def ls(
                             flatten=format == "pyout",
                             schema=schema,
                             use_fake_digest=use_fake_digest,
+                            # Metadata is extracted in parallel only for pyout
+                            jobs=jobs if format == "pyout" else 1,
                         )
                         if format == "pyout":
                             rec[async_keys] = cb
@@ -319,14 +327,17 @@ def flatten_meta_to_pyout(meta):
 
 
 def get_metadata_ls(
-    path, keys, errors, flatten=False, schema=None, use_fake_digest=False
+    path, keys, errors, flatten=False, schema=None, use_fake_digest=False, jobs=1
 ):
     # Avoid heavy import by importing within function:
-    from ..metadata.nwb import get_metadata, nwb2asset
+    from ..metadata.service import MetadataService, get_metadata_service
     from ..pynwb_utils import get_nwb_version, ignore_benign_pynwb_warnings
     from ..support.digests import get_digest
 
     ignore_benign_pynwb_warnings()
+    # Metadata is extracted in worker processes, while the callback is run
+    # in one of pyout's threads
+    service = MetadataService(jobs=1) if jobs == 1 else get_metadata_service(jobs)
 
     def fn():
         rec = {}
@@ -343,11 +354,15 @@ def get_metadata_ls(
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="dandi-etag")
-                        rec = nwb2asset(
-                            path,
-                            schema_version=schema,
-                            digest=Digest.dandi_etag(digest),
-                        ).model_dump(mode="json", exclude_none=True)
+                        rec = (
+                            service.nwb2asset(
+                                path,
+                                schema_version=schema,
+                                digest=Digest.dandi_etag(digest),
+                            )
+                            .result()
+                            .model_dump(mode="json", exclude_none=True)
+                        )
                 else:
                     if path.endswith(tuple(ZARR_EXTENSIONS)):
                         if use_fake_digest:
@@ -355,14 +370,18 @@ def get_metadata_ls(
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="zarr-checksum")
-                        rec = get_metadata(path, Digest.dandi_zarr(digest))
+                        rec = service.get_metadata(
+                            path, Digest.dandi_zarr(digest)
+                        ).result()
                     else:
                         if use_fake_digest:
                             digest = "0" * 32 + "-1"
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="dandi-etag")
-                        rec = get_metadata(path, Digest.dandi_etag(digest))
+                        rec = service.get_metadata(
+                            path, Digest.dandi_etag(digest)
+                        ).result()
             except Exception as exc:
                 _add_exc_error(path, rec, errors, exc)
             if flatten:
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from copy import deepcopy
 from datetime import datetime
 from difflib import unified_diff
@@ -8,12 +15,14 @@ import json
 import os
 from pathlib import PurePosixPath
 from textwrap import indent
+from threading import Lock
 from typing import Any, TypeVar
 import urllib.parse
 from uuid import uuid4
 
 import click
 from dandischema.consts import DANDI_SCHEMA_VERSION
+from dandischema.models import BareAsset
 from packaging.version import Version
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import HTTPError
@@ -22,7 +31,13 @@ from dandi.consts import known_instances
 
 from .base import ChoiceList, instance_option, map_to_click_exceptions
 from .. import __version__, lgr
-from ..dandiapi import DandiAPIClient, RemoteBlobAsset, RESTFullAPIClient
+from ..dandiapi import (
+    BaseRemoteAsset,
+    DandiAPIClient,
+    RemoteBlobAsset,
+    RemoteDandiset,
+    RESTFullAPIClient,
+)
 from ..dandiarchive import parse_dandi_url
 from ..exceptions import NotFoundError
 from ..utils import yaml_dump
@@ -51,16 +66,36 @@ def service_scripts() -> None:
     help="When to re-extract an asset's metadata",
     show_default=True,
 )
+@click.option(
+    "-J",
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of assets to re-extract metadata for in parallel",
+    show_default=True,
+)
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False),
+    help=(
+        "File in which to record the assets whose metadata has been updated;"
+        " assets already recorded in it are skipped, so that an interrupted"
+        " run can be resumed"
+    ),
+)
 @click.argument("url")
 @map_to_click_exceptions
-def reextract_metadata(url: str, diff: bool, when: str) -> None:
+def reextract_metadata(
+    url: str, diff: bool, when: str, jobs: int, journal: str | None
+) -> None:
     """
     Recompute & update the metadata for NWB assets on a remote server.
 
     Running this command requires the fsspec library to be installed with the
     `http` extra (e.g., `pip install "fsspec[http]"`).
     """
-    from ..metadata.nwb import nwb2asset  # Avoid heavy import at top level
+    # Avoid heavy import at top level
+    from ..metadata.service import MetadataService, get_metadata_service
 
     parsed_url = parse_dandi_url(url)
     if parsed_url.dandiset_id is None:
@@ -69,71 +104,247 @@ def reextract_metadata(url: str, diff: bool, when: str) -> None:
         raise click.UsageError(
             "URL must explicitly point to a draft version of a Dandiset"
         )
-    current_schema_version = Version(DANDI_SCHEMA_VERSION)
-    with parsed_url.navigate(authenticate=True, strict=True) as (_, _, assets):
-        for asset in assets:
-            if PurePosixPath(asset.path).suffix.lower() != ".nwb":
+    if jobs < 1:
+        raise click.UsageError("--jobs must be at least 1")
+    jrnl = _ReextractJournal(journal) if journal is not None else None
+    service = MetadataService(jobs=1) if jobs == 1 else get_metadata_service(jobs)
+    with parsed_url.navigate(authenticate=True, strict=True) as (
+        _,
+        dandiset,
+        assets,
+    ):
+        assets = list(assets)
+        if jrnl is not None:
+            todo = [a for a in assets if a.identifier not in jrnl.completed]
+            if len(todo) < len(assets):
                 lgr.info(
-                    "Asset %s (%s) is not NWB; skipping", asset.identifier, asset.path
+                    "Skipping %d assets already recorded in journal %s",
+                    len(assets) - len(todo),
+                    journal,
                 )
-            assert isinstance(asset, RemoteBlobAsset)
-            lgr.info("Processing asset %s (%s)", asset.identifier, asset.path)
-            if when == "always":
-                do_reextract = True
-            else:
-                try:
-                    sv = asset.get_raw_metadata()["schemaVersion"]
-                except KeyError:
-                    do_reextract = True
-                else:
-                    schemaVersion = Version(sv)
-                    if schemaVersion < current_schema_version:
-                        lgr.info(
-                            "Asset's schemaVersion %r is out of date; will reextract",
-                            sv,
-                        )
-                        do_reextract = True
-                    elif schemaVersion == current_schema_version:
-                        lgr.info(
-                            "Asset's schemaVersion %r is up to date; not reextracting",
-                            sv,
-                        )
-                        do_reextract = False
-                    else:
-                        lgr.warning(
-                            "schemaVersion of asset %s (%s) is %r, higher than"
-                            " current schema version %r",
-                            asset.identifier,
-                            asset.path,
-                            sv,
-                            DANDI_SCHEMA_VERSION,
+            assets = todo
+        if dandiset is not None and len(assets) > 1:
+            assets = _with_bulk_metadata(dandiset, assets)
+        failed = 0
+
+        def save(fut: Future[BareAsset], asset: RemoteBlobAsset) -> None:
+            nonlocal failed
+            try:
+                metadata = fut.result()
+            except Exception as e:
+                lgr.error(
+                    "Failed to extract metadata for asset %s (%s): %s: %s",
+                    asset.identifier,
+                    asset.path,
+                    type(e).__name__,
+                    e,
+                )
+                failed += 1
+                return
+            metadata.path = asset.path
+            mddict = metadata.model_dump(mode="json", exclude_none=True)
+            if diff:
+                oldmd = asset.get_raw_metadata()
+                oldmd_str = yaml_dump(oldmd)
+                mddict_str = yaml_dump(mddict)
+                print(
+                    "".join(
+                        unified_diff(
+                            oldmd_str.splitlines(True),
+                            mddict_str.splitlines(True),
+                            fromfile=f"{asset.path}:old",
+                            tofile=f"{asset.path}:new",
                         )
-                        do_reextract = False
-            if do_reextract:
+                    )
+                )
+            saves.append(saver.submit(_save_metadata, asset, mddict, jrnl))
+
+        # The metadata is extracted in the service's worker processes, and the
+        # results are saved from a pool of threads as they become available.
+        # (The API has no endpoint for updating several assets at once.)  At
+        # most 2*jobs extractions are submitted ahead, so that saving (and
+        # recording in the journal) keeps up with the extraction.
+        futures: dict[Future[BareAsset], RemoteBlobAsset] = {}
+        saves: list[Future[bool]] = []
+        with ThreadPoolExecutor(max_workers=jobs) as saver:
+            for asset in assets:
+                if PurePosixPath(asset.path).suffix.lower() != ".nwb":
+                    lgr.info(
+                        "Asset %s (%s) is not NWB; skipping",
+                        asset.identifier,
+                        asset.path,
+                    )
+                    continue
+                assert isinstance(asset, RemoteBlobAsset)
+                lgr.info("Processing asset %s (%s)", asset.identifier, asset.path)
+                if not _needs_reextract(asset, when):
+                    continue
                 try:
                     digest = asset.get_digest()
                 except NotFoundError:
                     digest = None
-                lgr.info("Extracting new metadata for asset")
-                metadata = nwb2asset(asset.as_readable(), digest=digest)
-                metadata.path = asset.path
-                mddict = metadata.model_dump(mode="json", exclude_none=True)
-                if diff:
-                    oldmd = asset.get_raw_metadata()
-                    oldmd_str = yaml_dump(oldmd)
-                    mddict_str = yaml_dump(mddict)
-                    print(
-                        "".join(
-                            unified_diff(
-                                oldmd_str.splitlines(True),
-                                mddict_str.splitlines(True),
-                                fromfile=f"{asset.path}:old",
-                                tofile=f"{asset.path}:new",
-                            )
-                        )
-                    )
-                lgr.info("Saving new asset metadata")
-                asset.set_raw_metadata(mddict)
+                lgr.info("Extracting new metadata for asset %s", asset.identifier)
+                futures[service.nwb2asset(asset.as_readable(), digest=digest)] = asset
+                if len(futures) >= 2 * jobs:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        save(fut, futures.pop(fut))
+            for fut in as_completed(futures):
+                save(fut, futures[fut])
+            failed += sum(not sfut.result() for sfut in saves)
+    if failed:
+        raise click.ClickException(
+            f"Failed to re-extract metadata for {failed} asset(s)"
+            + (f"; rerun with --journal {journal} to resume" if journal else "")
+        )
+
+
+def _save_metadata(
+    asset: RemoteBlobAsset, mddict: dict[str, Any], jrnl: _ReextractJournal | None
+) -> bool:
+    old_id = asset.identifier
+    lgr.info("Saving new metadata for asset %s (%s)", old_id, asset.path)
+    try:
+        asset.set_raw_metadata(mddict)
+    except Exception as e:
+        lgr.error(
+            "Failed to save metadata for asset %s (%s): %s: %s",
+            old_id,
+            asset.path,
+            type(e).__name__,
+            e,
+        )
+        return False
+    if jrnl is not None:
+        # Updating an asset's metadata gives it a new ID
+        jrnl.record(asset.identifier, old_id, asset.path)
+    return True
+
+
+def _needs_reextract(asset: RemoteBlobAsset, when: str) -> bool:
+    if when == "always":
+        return True
+    try:
+        sv = asset.get_raw_metadata()["schemaVersion"]
+    except KeyError:
+        return True
+    schemaVersion = Version(sv)
+    current_schema_version = Version(DANDI_SCHEMA_VERSION)
+    if schemaVersion < current_schema_version:
+        lgr.info("Asset's schemaVersion %r is out of date; will reextract", sv)
+        return True
+    elif schemaVersion == current_schema_version:
+        lgr.info("Asset's schemaVersion %r is up to date; not reextracting", sv)
+        return False
+    else:
+        lgr.warning(
+            "schemaVersion of asset %s (%s) is %r, higher than"
+            " current schema version %r",
+            asset.identifier,
+            asset.path,
+            sv,
+            DANDI_SCHEMA_VERSION,
+        )
+        return False
+
+
+def _with_bulk_metadata(
+    dandiset: RemoteDandiset, assets: list[BaseRemoteAsset]
+) -> list[BaseRemoteAsset]:
+    """
+    Return ``assets`` with their metadata retrieved in bulk by paging through
+    the Dandiset's assets instead of with one request per asset
+    """
+    wanted = {a.identifier for a in assets}
+    with_md = {
+        a.identifier: a
+        for a in dandiset.get_assets(metadata=True)
+        if a.identifier in wanted
+    }
+    return [with_md.get(a.identifier, a) for a in assets]
+
+
+class _ReextractJournal:
+    """
+    A record of the assets whose metadata has been updated by
+    ``reextract-metadata``, as lines of JSON appended to a file as each
+    update is completed
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        #: The IDs of the updated assets, both before & after the update
+        self.completed: set[str] = set()
+        if os.path.exists(path):
+            with open(path) as fp:
+                for line in fp:
+                    if line.strip():
+                        rec = json.loads(line)
+                        self.completed.add(rec["asset_id"])
+                        self.completed.add(rec["previous_asset_id"])
+        self._lock = Lock()
+
+    def record(self, asset_id: str, previous_asset_id: str, path: str) -> None:
+        line = json.dumps(
+            {"asset_id": asset_id, "previous_asset_id": previous_asset_id, "path": path}
+        )
+        with self._lock:
+            with open(self.path, "a") as fp:
+                print(line, file=fp)
+            self.completed.update([asset_id, previous_asset_id])
+
+
+@service_scripts.command()
+@click.argument("dest", type=click.Path(dir_okay=False))
+@map_to_click_exceptions
+def export_content_cache(dest: str) -> None:
+    """
+    Export the metadata & validation results in the content cache.
+
+    The results in the database given by DANDI_CONTENT_CACHE are copied into
+    the SQLite database DEST (created if it does not exist), which can then
+    be imported elsewhere with `import-content-cache`.
+    """
+    from ..support.content_cache import export_content_cache as export_cache
+
+    n = export_cache(dest)
+    lgr.info("Exported %d cached results to %s", n, dest)
+
+
+@service_scripts.command()
+@click.argument("src", type=click.Path(exists=True, dir_okay=False))
+@map_to_click_exceptions
+def import_content_cache(src: str) -> None:
+    """
+    Import metadata & validation results into the content cache.
+
+    The results in the SQLite database SRC (as produced by
+    `export-content-cache`) are added to the database given by
+    DANDI_CONTENT_CACHE.
+    """
+    from ..support.content_cache import import_content_cache as import_cache
+
+    n = import_cache(src)
+    lgr.info("Imported %d cached results from %s", n, src)
+
+
+@service_scripts.command()
+@click.argument("src", type=click.Path(exists=True, dir_okay=False))
+@click.argument("dest", type=click.Path(dir_okay=False))
+@map_to_click_exceptions
+def convert_validation_log(src: str, dest: str) -> None:
+    """
+    Convert a validation log between JSONL & the indexed format.
+
+    A JSONL file SRC (e.g., as saved by `dandi validate`) is converted to an
+    indexed validation log DEST, which `dandi validate --load` can filter
+    without reading all of it; an indexed validation log SRC is converted
+    back to a JSONL file DEST.
+    """
+    from ..validate._io import convert_validation_log as convert_log
+
+    n = convert_log(src, dest)
+    lgr.info("Converted %d validation results from %s to %s", n, src, dest)
 
 
 @service_scripts.command()
@@ -7,6 +7,7 @@ from .base import (
     IntColonInt,
     devel_debug_option,
     devel_option,
+    dump_request_stats,
     instance_option,
     map_to_click_exceptions,
 )
@@ -77,6 +78,7 @@ from ..upload import UploadExisting, UploadValidation
 )
 @devel_debug_option()
 @map_to_click_exceptions
+@dump_request_stats
 def upload(
     paths: tuple[str, ...],
     jobs_pair: tuple[int, int] | None,
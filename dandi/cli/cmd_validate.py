@@ -1,26 +1,29 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
 import dataclasses
 import json as json_mod
 import logging
 import os
 import re
 import sys
+from types import TracebackType
 from typing import IO, Union, cast
 import warnings
 
 import click
 
-from .base import devel_debug_option, devel_option, map_to_click_exceptions
+from .base import (
+    devel_debug_option,
+    devel_option,
+    dump_request_stats,
+    map_to_click_exceptions,
+)
 from .formatter import JSONFormatter, JSONLinesFormatter, TextFormatter, YAMLFormatter
 from ..utils import pluralize
 from ..validate._core import validate as validate_
-from ..validate._io import (
-    load_validation_jsonl,
-    validation_companion_path,
-    write_validation_jsonl,
-)
+from ..validate._io import iter_validation_log, validation_companion_path
 from ..validate._types import MissingFileContent, Severity, ValidationResult
 
 lgr = logging.getLogger(__name__)
@@ -51,14 +54,15 @@ def _format_from_ext(path: str) -> str | None:
     return _EXT_TO_FORMAT.get(ext)
 
 
-def _collect_results(
+def _iter_results(
     paths: tuple[str, ...],
     schema: str | None,
     devel_debug: bool,
     allow_any_path: bool,
     missing_file_content: MissingFileContent = MissingFileContent.error,
-) -> list[ValidationResult]:
-    """Run validation and collect all results into a list."""
+    jobs: int = 1,
+) -> Iterator[ValidationResult]:
+    """Run validation, yielding results as they are produced."""
     # Avoid heavy import by importing within function:
     from ..pynwb_utils import ignore_benign_pynwb_warnings
 
@@ -76,32 +80,30 @@ def _collect_results(
     # way to get relevant warnings (not errors) from PyNWB
     ignore_benign_pynwb_warnings()
 
-    return list(
-        validate_(
-            *paths,
-            schema_version=schema,
-            devel_debug=devel_debug,
-            allow_any_path=allow_any_path,
-            missing_file_content=missing_file_content,
-        )
+    yield from validate_(
+        *paths,
+        schema_version=schema,
+        devel_debug=devel_debug,
+        allow_any_path=allow_any_path,
+        missing_file_content=missing_file_content,
+        jobs=jobs,
     )
 
 
 def _filter_results(
-    results: list[ValidationResult],
+    results: Iterable[ValidationResult],
     min_severity: str,
     ignore: str | None,
-) -> list[ValidationResult]:
+) -> Iterator[ValidationResult]:
     """Filter results by minimum severity and ignore pattern."""
     min_severity_value = Severity[min_severity].value
-    filtered = [
-        r
-        for r in results
-        if r.severity is not None and r.severity.value >= min_severity_value
-    ]
-    if ignore is not None:
-        filtered = [r for r in filtered if not re.search(ignore, r.id)]
-    return filtered
+    ignore_re = re.compile(ignore) if ignore is not None else None
+    for r in results:
+        if r.severity is None or r.severity.value < min_severity_value:
+            continue
+        if ignore_re is not None and ignore_re.search(r.id):
+            continue
+        yield r
 
 
 @click.command()
@@ -221,9 +223,18 @@ def validate_bids(
     type=click.Choice(["error", "only-non-data", "skip"], case_sensitive=True),
     default="error",
 )
+@click.option(
+    "-J",
+    "--jobs",
+    type=int,
+    default=1,
+    help="Number of files to validate in parallel (in separate processes).",
+    show_default=True,
+)
 @click.option(
     "--load",
-    help="Load validation results from JSONL file(s) instead of running validation.",
+    help="Load validation results from JSONL file(s) or indexed validation logs "
+    "instead of running validation.",
     type=click.Path(exists=True, dir_okay=False),
     multiple=True,
     default=(),
@@ -232,6 +243,7 @@ def validate_bids(
 @click.pass_context
 @devel_debug_option()
 @map_to_click_exceptions
+@dump_request_stats
 def validate(
     ctx: click.Context,
     paths: tuple[str, ...],
@@ -243,6 +255,7 @@ def validate(
     summary: bool = False,
     max_per_group: int | None = None,
     missing_file_content: str = "error",
+    jobs: int = 1,
     load: tuple[str, ...] = (),
     schema: str | None = None,
     devel_debug: bool = False,
@@ -252,6 +265,9 @@ def validate(
 
     Exits with non-0 exit code if any file is not compliant.
 
+    Results are printed as soon as they are produced, except for grouped
+    output, whose groups are printed once validation is complete.
+
     Validation results are automatically saved as a JSONL companion next to the
     dandi-cli log file (unless --output is used or --load is active).  Use
     ``dandi validate --load <path>`` to re-render saved results later with
@@ -281,80 +297,114 @@ def validate(
     if load and paths:
         raise click.UsageError("--load and positional paths are mutually exclusive.")
 
+    results: Iterable[ValidationResult]
     if load:
-        results = load_validation_jsonl(load)
+        # Indexed validation logs only read the results passing the filters
+        results = iter_validation_log(
+            load, min_severity=Severity[min_severity], ignore=ignore
+        )
     else:
         mfc = MissingFileContent(missing_file_content)
-        results = _collect_results(
-            paths, schema, devel_debug, allow_any_path, missing_file_content=mfc
+        results = _iter_results(
+            paths,
+            schema,
+            devel_debug,
+            allow_any_path,
+            missing_file_content=mfc,
+            jobs=jobs,
         )
-        # Auto-save companion right after collection, before filtering — so
+        # Auto-save companion as results are produced, before filtering — so
         # all results are preserved regardless of display filters.
         # Skip when writing to --output (user already gets structured output).
-        if (
-            not output_file
-            and results
-            and (obj := getattr(ctx, "obj", None)) is not None
-        ):
-            _auto_save_companion(results, obj.logfile)
+        if not output_file and (obj := getattr(ctx, "obj", None)) is not None:
+            results = _auto_save_companion(results, obj.logfile)
 
     filtered = _filter_results(results, min_severity, ignore)
 
     if output_file is not None:
         with open(output_file, "w") as fh:
-            _render(filtered, output_format, fh, grouping, max_per_group=max_per_group)
+            stats = _render(
+                filtered, output_format, fh, grouping, max_per_group=max_per_group
+            )
         lgr.info("Validation output written to %s", output_file)
         if summary:
-            _print_summary(filtered, sys.stderr)
+            _print_summary(stats, sys.stderr)
     else:
-        _render(
+        stats = _render(
             filtered, output_format, sys.stdout, grouping, max_per_group=max_per_group
         )
         if summary:
             summary_out = sys.stdout if output_format == "text" else sys.stderr
-            _print_summary(filtered, summary_out)
+            _print_summary(stats, summary_out)
 
-    _exit_if_errors(filtered)
+    if stats.has_errors:
+        raise SystemExit(1)
 
 
-def _auto_save_companion(results: list[ValidationResult], logfile: str) -> None:
-    """Write validation companion JSONL next to the logfile."""
+def _auto_save_companion(
+    results: Iterable[ValidationResult], logfile: str
+) -> Iterator[ValidationResult]:
+    """
+    Write validation companion JSONL next to the logfile as the results pass
+    through.  The companion is only created if there are any results.
+    """
     companion = validation_companion_path(logfile)
-    write_validation_jsonl(results, companion)
-    lgr.info("Validation companion saved to %s", companion)
+    fh: IO[str] | None = None
+    try:
+        for r in results:
+            if fh is None:
+                fh = companion.open("w")
+            fh.write(r.model_dump_json())
+            fh.write("\n")
+            yield r
+    finally:
+        if fh is not None:
+            fh.close()
+            lgr.info("Validation companion saved to %s", companion)
 
 
-def _print_summary(results: list[ValidationResult], out: IO[str]) -> None:
+@dataclasses.dataclass
+class _ResultStats:
+    """Online aggregates of validation results for the summary & exit code."""
+
+    total: int = 0
+    severity_counts: Counter[str] = dataclasses.field(default_factory=Counter)
+    validator_counts: Counter[str] = dataclasses.field(default_factory=Counter)
+    standard_counts: Counter[str] = dataclasses.field(default_factory=Counter)
+    #: Whether any result has severity >= ERROR
+    has_errors: bool = False
+
+    def add(self, r: ValidationResult) -> None:
+        self.total += 1
+        self.severity_counts[r.severity.name if r.severity is not None else "NONE"] += 1
+        self.validator_counts[r.origin.validator.value] += 1
+        self.standard_counts[
+            r.origin.standard.value if r.origin.standard is not None else "N/A"
+        ] += 1
+        if r.severity is not None and r.severity >= Severity.ERROR:
+            self.has_errors = True
+
+
+def _print_summary(stats: _ResultStats, out: IO[str]) -> None:
     """Print summary statistics about validation results."""
-    from collections import Counter
-
-    total = len(results)
     print("\n--- Validation Summary ---", file=out)
-    print(f"Total issues: {total}", file=out)
-    if not total:
+    print(f"Total issues: {stats.total}", file=out)
+    if not stats.total:
         return
 
-    severity_counts = Counter(
-        r.severity.name if r.severity is not None else "NONE" for r in results
-    )
     print("By severity:", file=out)
     for sev in ("CRITICAL", "ERROR", "WARNING", "HINT", "INFO"):
-        if sev in severity_counts:
-            print(f"  {sev}: {severity_counts[sev]}", file=out)
+        if sev in stats.severity_counts:
+            print(f"  {sev}: {stats.severity_counts[sev]}", file=out)
 
-    validator_counts = Counter(r.origin.validator.value for r in results)
-    if validator_counts:
+    if stats.validator_counts:
         print("By validator:", file=out)
-        for validator, count in validator_counts.most_common():
+        for validator, count in stats.validator_counts.most_common():
             print(f"  {validator}: {count}", file=out)
 
-    standard_counts = Counter(
-        r.origin.standard.value if r.origin.standard is not None else "N/A"
-        for r in results
-    )
-    if standard_counts:
+    if stats.standard_counts:
         print("By standard:", file=out)
-        for standard, count in standard_counts.most_common():
+        for standard, count in stats.standard_counts.most_common():
             print(f"  {standard}: {count}", file=out)
 
 
@@ -378,84 +428,130 @@ def _get_formatter(
 
 
 def _render(
-    results: list[ValidationResult],
+    results: Iterable[ValidationResult],
     output_format: str,
     out: IO[str],
     grouping: tuple[str, ...] = (),
     max_per_group: int | None = None,
-) -> None:
+) -> _ResultStats:
     """Render validation results in the given format.
 
     Handles both text and structured (JSON/JSONL/YAML) formats, with
-    optional grouping and truncation.
+    optional grouping and truncation.  Results are consumed lazily (see
+    `_StreamingRenderer`).  Returns aggregates of all results rendered.
     """
-    is_text = output_format == "text"
+    renderer = _StreamingRenderer(output_format, out, grouping, max_per_group)
+    with renderer:
+        for r in results:
+            renderer.add(r)
+    return renderer.stats
 
-    if grouping:
-        grouped: GroupedResults | TruncatedResults = _group_results(results, grouping)
-        if max_per_group is not None:
-            grouped = _truncate_leaves(grouped, max_per_group)
-        if is_text:
+
+class _StreamingRenderer:
+    """Render validation results one at a time, as they are produced.
+
+    Ungrouped results are passed to the formatter (and so, except for YAML,
+    printed) right away.  Grouped results are aggregated online in a
+    `_GroupAggregate`, which keeps only the counts of results in each group
+    and, with ``max_per_group``, at most that many results per group; the
+    groups are printed upon exiting the context.
+    """
+
+    def __init__(
+        self,
+        output_format: str,
+        out: IO[str],
+        grouping: tuple[str, ...] = (),
+        max_per_group: int | None = None,
+    ) -> None:
+        self.output_format = output_format
+        self.out = out
+        self.grouping = grouping
+        self.max_per_group = max_per_group
+        self.stats = _ResultStats()
+        self._groups = _GroupAggregate()
+        # Legacy path grouping displays all issues for each path
+        self._max_kept = None if grouping == ("path",) else max_per_group
+        self._formatter = _get_formatter(output_format, out=out)
+        self._omitted = 0
+
+    def __enter__(self) -> _StreamingRenderer:
+        if not self.grouping:
+            self._formatter.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.finish()
+
+    def add(self, r: ValidationResult) -> None:
+        self.stats.add(r)
+        if self.grouping:
+            self._groups.add(r, self.grouping, self._max_kept)
+        elif self.max_per_group is not None and self.stats.total > self.max_per_group:
+            self._omitted += 1
+        elif self.output_format == "text":
+            self._formatter(r)
+        else:
+            self._formatter(r.model_dump(mode="json"))
+
+    def finish(self) -> None:
+        if self.grouping:
+            self._finish_grouped()
+        elif self.output_format == "text":
+            self._formatter.__exit__(None, None, None)
+            if self._omitted:
+                click.secho(
+                    f"... and {pluralize(self._omitted, 'more issue')}", fg="cyan"
+                )
+        else:
+            if self._omitted:
+                self._formatter({"_truncated": True, "omitted_count": self._omitted})
+            self._formatter.__exit__(None, None, None)
+
+    def _finish_grouped(self) -> None:
+        grouped = self._groups.to_grouped(len(self.grouping))
+        if self.output_format == "text":
             # Text grouped output uses colored section headers
-            if grouping == ("path",):
+            if self.grouping == ("path",):
                 # Legacy path grouping: per-path display_errors
-                purviews = list(set(i.purview for i in results))
-                for purview in purviews:
-                    applies_to = [i for i in results if purview == i.purview]
+                assert isinstance(grouped, OrderedDict)
+                for applies_to in grouped.values():
+                    issues = cast("list[ValidationResult]", applies_to)
                     display_errors(
-                        [purview],
-                        [i.id for i in applies_to],
-                        cast("list[Severity]", [i.severity for i in applies_to]),
-                        [i.message for i in applies_to],
+                        [issues[0].purview],
+                        [i.id for i in issues],
+                        cast("list[Severity]", [i.severity for i in issues]),
+                        [i.message for i in issues],
                     )
             else:
                 _render_text_grouped(grouped, depth=0)
-            if not any(
-                r.severity is not None and r.severity >= Severity.ERROR for r in results
-            ):
+            if not self.stats.has_errors:
                 click.secho("No errors found.", fg="green")
         else:
             # Structured grouped output: nested dict
             data = _serialize_grouped(grouped)
-            if output_format in ("json", "json_pp"):
-                indent = 2 if output_format == "json_pp" else None
-                json_mod.dump(data, out, indent=indent, sort_keys=True, default=str)
-                out.write("\n")
-            elif output_format == "yaml":
+            if self.output_format in ("json", "json_pp"):
+                indent = 2 if self.output_format == "json_pp" else None
+                json_mod.dump(
+                    data, self.out, indent=indent, sort_keys=True, default=str
+                )
+                self.out.write("\n")
+            elif self.output_format == "yaml":
                 import ruamel.yaml
 
                 yaml = ruamel.yaml.YAML(typ="safe")
                 yaml.default_flow_style = False
-                yaml.dump(data, out)
+                yaml.dump(data, self.out)
             else:
                 raise ValueError(
-                    f"Unsupported format for grouped output: {output_format}"
-                )
-    else:
-        # Ungrouped: use formatter per-record
-        if is_text:
-            shown = results
-            omitted = 0
-            if max_per_group is not None and len(results) > max_per_group:
-                shown = results[:max_per_group]
-                omitted = len(results) - max_per_group
-            formatter = _get_formatter(output_format, out=out)
-            with formatter:
-                for r in shown:
-                    formatter(r)
-            if omitted:
-                click.secho(f"... and {pluralize(omitted, 'more issue')}", fg="cyan")
-        else:
-            items: list[dict] = [r.model_dump(mode="json") for r in results]
-            if max_per_group is not None and len(items) > max_per_group:
-                items = items[:max_per_group]
-                items.append(
-                    {"_truncated": True, "omitted_count": len(results) - max_per_group}
+                    f"Unsupported format for grouped output: {self.output_format}"
                 )
-            formatter = _get_formatter(output_format, out=out)
-            with formatter:
-                for item in items:
-                    formatter(item)
 
 
 def _exit_if_errors(results: list[ValidationResult]) -> None:
@@ -491,6 +587,53 @@ LeafItem = Union[ValidationResult, TruncationNotice]
 TruncatedResults = Union["OrderedDict[str, TruncatedResults]", list[LeafItem]]
 
 
+@dataclasses.dataclass
+class _GroupAggregate:
+    """Online aggregate of the validation results in a group.
+
+    Keeps the number of results in the group and either the aggregates of its
+    subgroups or, at the innermost grouping level, up to ``max_kept`` of the
+    results themselves, so that its size is proportional to the number of
+    groups rather than to the number of results.
+    """
+
+    #: Number of validation results in the group
+    count: int = 0
+    #: The first results in the group (at the innermost grouping level)
+    kept: list[ValidationResult] = dataclasses.field(default_factory=list)
+    #: Aggregates of subgroups, keyed by the next grouping level's keys
+    subgroups: OrderedDict[str, _GroupAggregate] = dataclasses.field(
+        default_factory=OrderedDict
+    )
+
+    def add(
+        self, r: ValidationResult, levels: tuple[str, ...], max_kept: int | None
+    ) -> None:
+        """Add a result to the group, which is grouped further by *levels*."""
+        self.count += 1
+        if levels:
+            k = _group_key(r, levels[0])
+            if (sub := self.subgroups.get(k)) is None:
+                sub = self.subgroups[k] = _GroupAggregate()
+            sub.add(r, levels[1:], max_kept)
+        elif max_kept is None or len(self.kept) < max_kept:
+            self.kept.append(r)
+
+    def to_grouped(self, depth: int) -> TruncatedResults:
+        """Convert to the nested structure rendered by ``_render_text_grouped``.
+
+        Results not kept are represented by a trailing TruncationNotice.
+        """
+        if depth:
+            return OrderedDict(
+                (k, sub.to_grouped(depth - 1)) for k, sub in self.subgroups.items()
+            )
+        leaf: list[LeafItem] = list(self.kept)
+        if self.count > len(self.kept):
+            leaf.append(TruncationNotice(self.count - len(self.kept)))
+        return leaf
+
+
 def _group_results(
     results: list[ValidationResult],
     levels: tuple[str, ...],
@@ -502,17 +645,11 @@ def _group_results(
     """
     if not levels:
         return results
-    key_fn = levels[0]
-    remaining = levels[1:]
-    groups: OrderedDict[str, list[ValidationResult]] = OrderedDict()
+    groups = _GroupAggregate()
     for r in results:
-        k = _group_key(r, key_fn)
-        groups.setdefault(k, []).append(r)
-    if remaining:
-        return OrderedDict((k, _group_results(v, remaining)) for k, v in groups.items())
-    # mypy can't resolve the recursive type alias, but this is correct:
-    # OrderedDict[str, list[VR]] is a valid GroupedResults
-    return cast("GroupedResults", groups)
+        groups.add(r, levels, None)
+    # No results are omitted, so there are no TruncationNotices:
+    return cast("GroupedResults", groups.to_grouped(len(levels)))
 
 
 def _truncate_leaves(
@@ -3,6 +3,7 @@ Commands definition for DANDI command line interface
 """
 
 from datetime import datetime, timezone
+import importlib
 import logging
 import os
 import os.path
@@ -10,6 +11,7 @@ import sys
 from types import SimpleNamespace
 
 import click
+from click.shell_completion import CompletionItem
 from click_didyoumean import DYMGroup
 import platformdirs
 
@@ -54,8 +56,113 @@ def print_version(ctx, param, value):
     ctx.exit()
 
 
+class LazyGroup(DYMGroup):
+    """A command group whose subcommands are imported only when run.
+
+    Subcommands are given as a mapping from command names to ``(module,
+    attribute, short help)`` triples, with module names relative to
+    ``dandi.cli``.  The short help is used when listing the commands (in
+    ``--help`` output and in shell completion), so that doing so does not
+    require importing any of the subcommands' modules (and whatever heavy
+    modules they import in turn).
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            modname, attr, _ = self.lazy_commands[cmd_name]
+            mod = importlib.import_module(modname, __package__)
+            self.add_command(getattr(mod, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _short_helps(self, ctx, incomplete="", limit=45):
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            if name in self.commands:
+                cmd = self.commands[name]
+                if not cmd.hidden:
+                    yield name, cmd.get_short_help_str(limit)
+            else:
+                short_help = self.lazy_commands[name][2]
+                yield name, click.Command(name, help=short_help).get_short_help_str(
+                    limit
+                )
+
+    def format_commands(self, ctx, formatter):
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(map(len, names))
+        rows = list(self._short_helps(ctx, limit=limit))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx, incomplete):
+        results = [
+            CompletionItem(name, help=help_)
+            for name, help_ in self._short_helps(ctx, incomplete)
+        ]
+        # Skip `Group.shell_complete()`, which would import all subcommands,
+        # and complete options as `Command` does:
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+#: Subcommands of the ``dandi`` command, imported only when run
+LAZY_COMMANDS = {
+    "delete": (".cmd_delete", "delete", "Delete dandisets and assets from the server."),
+    "digest": (".cmd_digest", "digest", "Calculate file digests"),
+    "download": (
+        ".cmd_download",
+        "download",
+        "Download files or entire folders from DANDI.",
+    ),
+    "instances": (
+        ".cmd_instances",
+        "instances",
+        "List known DANDI instances that the CLI can interact with",
+    ),
+    "ls": (".cmd_ls", "ls", "List .nwb files and dandisets metadata."),
+    "move": (
+        ".cmd_move",
+        "move",
+        "Move or rename assets in a local Dandiset and/or on the server.",
+    ),
+    "organize": (
+        ".cmd_organize",
+        "organize",
+        "(Re)organize NWB files according to their metadata.",
+    ),
+    "service-scripts": (
+        ".cmd_service_scripts",
+        "service_scripts",
+        "Various utility operations",
+    ),
+    "shell-completion": (
+        ".cmd_shell_completion",
+        "shell_completion",
+        "Emit shell script for enabling command completion.",
+    ),
+    "upload": (".cmd_upload", "upload", "Upload Dandiset files to DANDI Archive."),
+    "validate": (
+        ".cmd_validate",
+        "validate",
+        "Validate files for data standards compliance.",
+    ),
+    "validate-bids": (".cmd_validate", "validate_bids", "Validate BIDS paths."),
+}
+
+
 # group to provide commands
-@click.group(cls=DYMGroup)
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option(
     "--version", is_flag=True, callback=print_version, expose_value=False, is_eager=True
 )
@@ -68,8 +175,18 @@ def print_version(ctx, param, value):
     show_default=True,
 )
 @click.option("--pdb", help="Fall into pdb if errors out", is_flag=True)
+@click.option(
+    "--request-stats",
+    help="Record per-endpoint statistics (counts, latencies, retries, status"
+    " codes, bytes transferred) on the HTTP requests made, and save them as"
+    " JSON to the given file ('-' for stderr) at the end of the download,"
+    " upload, ls, or validate command",
+    metavar="FILE",
+    envvar="DANDI_REQUEST_STATS",
+    show_envvar=True,
+)
 @click.pass_context
-def main(ctx, log_level, pdb=False):
+def main(ctx, log_level, pdb=False, request_stats=None):
     """A client to support interactions with DANDI instances, such as the DANDI
     Archive (http://dandiarchive.org).
 
@@ -140,38 +257,9 @@ def main(ctx, log_level, pdb=False):
         map_to_click_exceptions._do_map = False
         setup_exceptionhook()
 
-    check_dandi_version()
-
+    if request_stats:
+        from ..support.request_stats import request_stats as stats
 
-#
-# Commands in the main group
-#
-from .cmd_delete import delete  # noqa: E402
-from .cmd_digest import digest  # noqa: E402
-from .cmd_download import download  # noqa: E402
-from .cmd_instances import instances  # noqa: E402
-from .cmd_ls import ls  # noqa: E402
-from .cmd_move import move  # noqa: E402
-from .cmd_organize import organize  # noqa: E402
-from .cmd_service_scripts import service_scripts  # noqa: E402
-from .cmd_shell_completion import shell_completion  # noqa: E402
-from .cmd_upload import upload  # noqa: E402
-from .cmd_validate import validate, validate_bids  # noqa: E402
-
-__all_commands__ = (
-    delete,
-    digest,
-    download,
-    instances,
-    ls,
-    move,
-    organize,
-    service_scripts,
-    shell_completion,
-    upload,
-    validate,
-    validate_bids,
-)
+        stats.enable(request_stats)
 
-for cmd in __all_commands__:
-    main.add_command(cmd)
+    check_dandi_version()
@@ -1,5 +1,7 @@
+from collections.abc import Iterator
 import json
 from pathlib import Path
+import sys
 from typing import cast
 
 from click.testing import CliRunner
@@ -10,7 +12,9 @@ from ..cmd_validate import (
     GroupedResults,
     TruncationNotice,
     _group_results,
+    _GroupAggregate,
     _process_issues,
+    _render,
     _render_text,
     _truncate_leaves,
     validate,
@@ -335,6 +339,27 @@ def test_validate_load_with_format(simple2_nwb: Path, tmp_path: Path) -> None:
     assert len(data) >= 1
 
 
+def test_validate_load_indexed(tmp_path: Path) -> None:
+    """--load reads indexed validation logs converted from JSONL."""
+    from ..cmd_service_scripts import service_scripts
+
+    jsonl = _make_jsonl(tmp_path, n=5)
+    index = tmp_path / "results.vlog"
+    r = CliRunner().invoke(
+        service_scripts, ["convert-validation-log", str(jsonl), str(index)]
+    )
+    assert r.exit_code == 0, r.output
+    r = CliRunner().invoke(
+        validate,
+        ["--load", str(index), "--min-severity", "ERROR", "--ignore", "issue_2$"],
+    )
+    assert r.exit_code == 1
+    assert "TEST.issue_0" in r.output
+    assert "TEST.issue_4" in r.output
+    for i in (1, 2, 3):
+        assert f"TEST.issue_{i}" not in r.output
+
+
 @pytest.mark.ai_generated
 def test_validate_load_mutual_exclusivity(simple2_nwb: Path, tmp_path: Path) -> None:
     """Test --load and paths are mutually exclusive."""
@@ -836,6 +861,52 @@ def test_truncate_leaves_unit() -> None:
     assert no_trunc is issues
 
 
+def _synthetic_issues(n: int) -> Iterator[ValidationResult]:
+    origin = Origin(
+        type=OriginType.VALIDATION,
+        validator=Validator.nwbinspector,
+        validator_version="",
+    )
+    for i in range(n):
+        yield ValidationResult(
+            id=f"T.{i % 3}",
+            origin=origin,
+            scope=Scope.FILE,
+            message=f"msg{i}",
+            path=Path(f"f{i}.nwb"),
+            severity=Severity.ERROR if i % 2 else Severity.WARNING,
+        )
+
+
+def test_render_streams_ungrouped(capsys: pytest.CaptureFixture) -> None:
+    """Ungrouped results are printed before the next one is produced."""
+
+    def results() -> Iterator[ValidationResult]:
+        for i, r in enumerate(_synthetic_issues(3)):
+            yield r
+            assert f"f{i}.nwb" in capsys.readouterr().out
+
+    stats = _render(results(), "text", sys.stdout)
+    assert stats.total == 3
+    assert stats.has_errors
+
+
+def test_group_aggregate_bounded() -> None:
+    """Grouping keeps counts of all results but only max_per_group of them."""
+    levels = ("severity", "id")
+    groups = _GroupAggregate()
+    for r in _synthetic_issues(600):
+        groups.add(r, levels, 2)
+    assert groups.count == 600
+    for by_id in groups.subgroups.values():
+        assert len(by_id.subgroups) == 3
+        for leaf in by_id.subgroups.values():
+            assert leaf.count == 100
+            assert len(leaf.kept) == 2
+    expected = _truncate_leaves(_group_results(list(_synthetic_issues(600)), levels), 2)
+    assert groups.to_grouped(len(levels)) == expected
+
+
 @pytest.mark.ai_generated
 def test_validate_auto_companion_text(
     simple2_nwb: Path, redirected_logdir: Path
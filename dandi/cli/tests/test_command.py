@@ -3,12 +3,13 @@ import re
 from subprocess import PIPE, Popen
 import sys
 
+import click
 from click.testing import CliRunner
 import pytest
 
 from ..cmd_ls import ls
 from ..cmd_validate import validate
-from ..command import __all_commands__
+from ..command import LAZY_COMMANDS, main
 
 
 @pytest.mark.parametrize("command", (ls, validate))
@@ -28,8 +29,10 @@ def test_smoke(organized_nwb_dir, command):
         assert r.exit_code == 0, f"Exited abnormally. out={r.stdout}"
 
 
-@pytest.mark.parametrize("command", __all_commands__)
-def test_smoke_help(command):
+@pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+def test_smoke_help(name):
+    command = main.get_command(click.Context(main), name)
+    assert isinstance(command, click.Command)
     runner = CliRunner()
     r = runner.invoke(command, ["--help"])
     assert r.exit_code == 0, f"Exited abnormally. out={r.stdout}"
@@ -38,6 +41,24 @@ def test_smoke_help(command):
     assert re.match("Usage: .*Options:.*--help", r.stdout, flags=re.DOTALL) is not None
 
 
+@pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+def test_lazy_command_short_help(name):
+    # The short help listed by `dandi --help` must be kept in sync with the
+    # command's own help
+    command = main.get_command(click.Context(main), name)
+    assert isinstance(command, click.Command)
+    assert command.get_short_help_str(80) == click.Command(
+        name, help=LAZY_COMMANDS[name][2]
+    ).get_short_help_str(80)
+
+
+def test_main_help_lists_commands():
+    r = CliRunner().invoke(main, ["--help"])
+    assert r.exit_code == 0, f"Exited abnormally. out={r.stdout}"
+    for name in LAZY_COMMANDS:
+        assert re.search(rf"^\s+{re.escape(name)}\s", r.stdout, flags=re.M)
+
+
 def test_no_heavy_imports():
     # Timing --version for being fast is unreliable, so we will verify that
     # no h5py or numpy (just in case) module is imported upon import of the
@@ -66,3 +87,31 @@ def test_no_heavy_imports():
     assert not loaded_heavy
     assert not stderr or b"Failed to check" in stderr or b"dandi version" in stderr
     assert not p.wait()
+
+
+def test_no_heavy_imports_main_help():
+    # Listing the commands must not import any of their modules
+    heavy_modules = {"pynwb", "h5py", "hdmf", "numpy", "zarr", "dandischema"}
+    env = os.environ.copy()
+    env["NO_ET"] = "1"
+    p = Popen(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; "
+                "from dandi.cli.command import main; "
+                "main(['--help'], standalone_mode=False); "
+                "print(','.join(sys.modules), file=sys.stderr);"
+            ),
+        ],
+        env=env,
+        stdout=PIPE,
+        stderr=PIPE,
+    )
+    stdout, stderr = p.communicate()
+    assert b"Commands:" in stdout
+    modules = stderr.decode().strip().splitlines()[-1].split(",")
+    assert not {m.split(".")[0] for m in modules}.intersection(heavy_modules)
+    assert not any(m.startswith("dandi.cli.cmd_") for m in modules)
+    assert not p.wait()
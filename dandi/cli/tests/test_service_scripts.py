@@ -16,7 +16,7 @@ import pytest
 from dandi import __version__
 from dandi.tests.fixtures import SampleDandiset
 
-from ..cmd_service_scripts import service_scripts
+from ..cmd_service_scripts import _ReextractJournal, service_scripts
 
 DATA_DIR = Path(__file__).with_name("data")
 
@@ -25,23 +25,56 @@ DATA_DIR = Path(__file__).with_name("data")
     "nfsmount" in os.environ.get("TMPDIR", ""),
     reason="https://github.com/dandi/dandi-cli/issues/1507",
 )
+@pytest.mark.parametrize("jobs", [1, 2])
 def test_reextract_metadata(
-    monkeypatch: pytest.MonkeyPatch, nwb_dandiset: SampleDandiset
+    monkeypatch: pytest.MonkeyPatch,
+    nwb_dandiset: SampleDandiset,
+    tmp_path: Path,
+    jobs: int,
 ) -> None:
     pytest.importorskip("fsspec")
     asset_id = nwb_dandiset.dandiset.get_asset_by_path(
         "sub-mouse001/sub-mouse001.nwb"
     ).identifier
     nwb_dandiset.api.monkeypatch_set_api_key_env(monkeypatch)
-    r = CliRunner().invoke(
-        service_scripts,
-        ["reextract-metadata", "--when=always", nwb_dandiset.dandiset.version_api_url],
-    )
+    journal = tmp_path / "journal.jsonl"
+    args = [
+        "reextract-metadata",
+        "--when=always",
+        f"--jobs={jobs}",
+        f"--journal={journal}",
+        nwb_dandiset.dandiset.version_api_url,
+    ]
+    r = CliRunner().invoke(service_scripts, args)
     assert r.exit_code == 0
     asset_id2 = nwb_dandiset.dandiset.get_asset_by_path(
         "sub-mouse001/sub-mouse001.nwb"
     ).identifier
     assert asset_id2 != asset_id
+    (rec,) = map(json.loads, journal.read_text().splitlines())
+    assert rec == {
+        "asset_id": asset_id2,
+        "previous_asset_id": asset_id,
+        "path": "sub-mouse001/sub-mouse001.nwb",
+    }
+    # Rerunning with the journal skips the already updated asset
+    r = CliRunner().invoke(service_scripts, args)
+    assert r.exit_code == 0
+    assert (
+        nwb_dandiset.dandiset.get_asset_by_path(
+            "sub-mouse001/sub-mouse001.nwb"
+        ).identifier
+        == asset_id2
+    )
+
+
+def test_reextract_journal(tmp_path: Path) -> None:
+    path = str(tmp_path / "journal.jsonl")
+    jrnl = _ReextractJournal(path)
+    assert jrnl.completed == set()
+    jrnl.record("new1", "old1", "a.nwb")
+    jrnl.record("new2", "old2", "b.nwb")
+    assert _ReextractJournal(path).completed == {"new1", "old1", "new2", "old2"}
 
 
 def record_only_doi_requests(request):
@@ -209,6 +209,19 @@ ZARR_UPLOAD_BATCH_SIZE = 255
 #: Maximum number of Zarr directory entries to delete at once
 ZARR_DELETE_BATCH_SIZE = 100
 
+#: Number of assets for which to resolve direct storage URLs at once when
+#: downloading
+STORAGE_URL_BATCH_SIZE = 50
+
+#: Maximum number of threads to use when resolving storage URLs via API
+#: download redirects
+STORAGE_URL_WORKERS = 5
+
+#: Default maximum number of connections kept open per host by a
+#: `~dandi.dandiapi.RESTFullAPIClient`; raised as needed to match the
+#: configured concurrency
+HTTP_POOL_MAXSIZE = 10
+
 BIDS_DATASET_DESCRIPTION = "dataset_description.json"
 
 BIDS_IGNORE_FILE = ".bidsignore"
@@ -244,6 +257,14 @@ assert {v.get("type", "additional") for v in dandi_layout_fields.values()} == {
 
 REQUEST_RETRIES = 12
 
+#: Number of consecutive failed requests to a host (across all threads) after
+#: which no more requests are sent to it for `CIRCUIT_BREAKER_RESET` seconds
+CIRCUIT_BREAKER_THRESHOLD = 50
+
+#: Number of seconds for which requests to a host are suspended after
+#: `CIRCUIT_BREAKER_THRESHOLD` consecutive failures
+CIRCUIT_BREAKER_RESET = 30
+
 DOWNLOAD_TIMEOUT = 30
 
 #: Per-request timeout (seconds) for HEAD requests issued by
@@ -24,6 +24,7 @@ import os.path
 from pathlib import Path, PurePosixPath
 import posixpath
 import re
+from threading import Lock
 from time import sleep, time
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -34,6 +35,7 @@ import dandischema.consts
 from packaging.version import Version as PackagingVersion
 from pydantic import BaseModel, Field, PrivateAttr
 import requests
+from requests.adapters import HTTPAdapter
 import tenacity
 from yarl import URL
 
@@ -41,6 +43,7 @@ from . import get_logger
 from .consts import (
     DOWNLOAD_TIMEOUT,
     DRAFT,
+    HTTP_POOL_MAXSIZE,
     MAX_CHUNK_SIZE,
     REQUEST_RETRIES,
     RETRY_STATUSES,
@@ -51,13 +54,14 @@ from .consts import (
 from .exceptions import HTTP404Error, NotFoundError, SchemaVersionError
 from .keyring_utils import keyring_lookup, keyring_save
 from .misctypes import Digest, RemoteReadableAsset
+from .support.request_stats import request_stats
+from .support.throttle import get_host_throttle
 from .utils import (
     USER_AGENT,
     check_dandi_version,
     chunked,
     ensure_datetime,
     get_instance,
-    get_retry_after,
     is_interactive,
     is_page2_url,
     joinurl,
@@ -105,6 +109,33 @@ class VersionStatus(Enum):
     PUBLISHED = "Published"
 
 
+@dataclass
+class ConnectionPoolStats:
+    """
+    Statistics on the use of a `RESTFullAPIClient`'s connection pool for a
+    single host
+    """
+
+    #: The scheme, host, and port that the pool connects to
+    host: str
+    #: Maximum number of connections the pool keeps open for reuse
+    maxsize: int
+    #: Number of requests made through the pool
+    requests: int
+    #: Number of new connections that the pool had to establish
+    connections: int
+
+    @property
+    def hits(self) -> int:
+        """Number of requests that reused an already-open connection"""
+        return max(self.requests - self.connections, 0)
+
+    @property
+    def misses(self) -> int:
+        """Number of requests that required establishing a new connection"""
+        return self.connections
+
+
 # Following class is loosely based on GirderClient, with authentication etc
 # being stripped.
 # TODO: add copyright/license info
@@ -120,6 +151,12 @@ class RESTFullAPIClient:
 
     `RESTFullAPIClient` instances are usable as context managers, in which case
     they will close their associated session on exit.
+
+    If no session is supplied, the client creates one whose connection pools
+    hold up to ``pool_maxsize`` connections per host; callers that issue
+    requests from many threads at once should size the pools to match via
+    `set_pool_maxsize()` in order to avoid connections being discarded and
+    re-established.
     """
 
     def __init__(
@@ -127,19 +164,28 @@ class RESTFullAPIClient:
         api_url: str,
         session: requests.Session | None = None,
         headers: dict | None = None,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
     ) -> None:
         """
         :param str api_url: The base HTTP(S) URL to prepend to request paths
         :param session: an optional `requests.Session` instance to use; if not
             specified, a new session is created
         :param headers: an optional `dict` of headers to send in every request
+        :param pool_maxsize: the maximum number of connections to keep open
+            per host if a new session is created
         """
         self.api_url = api_url
+        #: The maximum number of connections kept open per host, or `None` if
+        #: the session was supplied by the caller and is not managed by the
+        #: client
+        self.pool_maxsize: int | None = None
         if session is None:
             session = requests.Session()
+            self._mount_adapters(session, pool_maxsize)
         session.headers["User-Agent"] = USER_AGENT
         if headers is not None:
             session.headers.update(headers)
+        request_stats.instrument(session)
         self.session = session
         #: Default number of items to request per page when paginating (`None`
         #: means to use the server's default)
@@ -147,6 +193,72 @@ class RESTFullAPIClient:
         #: How many pages to fetch at once when parallelizing pagination
         self.page_workers: int = 5
 
+    def _mount_adapters(self, session: requests.Session, pool_maxsize: int) -> None:
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.pool_maxsize = pool_maxsize
+
+    def set_pool_maxsize(self, pool_maxsize: int) -> None:
+        """
+        Ensure that the client's connection pools can hold at least
+        ``pool_maxsize`` connections per host, e.g., so that they match the
+        number of threads that will be making requests through the client
+        concurrently.  Pools are only ever enlarged by this method.
+
+        Does nothing if the client was constructed with a caller-supplied
+        session.
+        """
+        if self.pool_maxsize is None or pool_maxsize <= self.pool_maxsize:
+            return
+        lgr.debug(
+            "Resizing connection pools for %s to %d connections per host",
+            self.api_url,
+            pool_maxsize,
+        )
+        for adapter in self.session.adapters.values():
+            adapter.close()
+        self._mount_adapters(self.session, pool_maxsize)
+
+    def get_pool_stats(self) -> list[ConnectionPoolStats]:
+        """
+        Return statistics on connection reuse for each host that the client's
+        session currently holds a connection pool for
+        """
+        stats: list[ConnectionPoolStats] = []
+        seen: set[int] = set()
+        for adapter in self.session.adapters.values():
+            if not isinstance(adapter, HTTPAdapter) or id(adapter) in seen:
+                continue
+            seen.add(id(adapter))
+            for key in adapter.poolmanager.pools.keys():
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                port = f":{pool.port}" if pool.port is not None else ""
+                stats.append(
+                    ConnectionPoolStats(
+                        host=f"{pool.scheme}://{pool.host}{port}",
+                        maxsize=pool.pool.maxsize if pool.pool is not None else 0,
+                        requests=pool.num_requests,
+                        connections=pool.num_connections,
+                    )
+                )
+        return stats
+
+    def log_pool_stats(self) -> None:
+        """Log the client's connection pool statistics at DEBUG level"""
+        for st in self.get_pool_stats():
+            lgr.debug(
+                "Connection pool for %s (max size %d): %d requests, %d reused"
+                " connections, %d new connections",
+                st.host,
+                st.maxsize,
+                st.requests,
+                st.hits,
+                st.misses,
+            )
+
     def __enter__(self) -> Self:
         return self
 
@@ -225,6 +337,7 @@ class RESTFullAPIClient:
             headers["accept"] = "application/json"
 
         lgr.debug("%s %s", method.upper(), url)
+        throttle = get_host_throttle(url)
 
         def _rewind_data(retry_state: tenacity.RetryCallState) -> None:
             # After a failed attempt (ConnectionError mid-upload, HTTPError,
@@ -250,8 +363,11 @@ class RESTFullAPIClient:
                     before_sleep=_rewind_data,
                 )
             ):
+                if i > 0:
+                    request_stats.record_retry(method, url)
                 with attempt:
-                    result = self.session.request(
+                    result = throttle.send(
+                        self.session.request,
                         method,
                         url,
                         params=params,
@@ -272,13 +388,9 @@ class RESTFullAPIClient:
                                 url,
                                 result.text,
                             )
-                        if retry_after := get_retry_after(result):
-                            lgr.debug(
-                                "Sleeping for %d seconds as instructed in response "
-                                "(in addition to tenacity imposed)",
-                                retry_after,
-                            )
-                            sleep(retry_after)
+                        # Any Retry-After has been recorded by `throttle`, which
+                        # will pause the next attempt (as well as all other
+                        # requests to the host) accordingly
                         result.raise_for_status()
         except Exception as e:
             if isinstance(e, requests.HTTPError):
@@ -477,9 +589,60 @@ class DandiAPIClient(RESTFullAPIClient):
             dandi_instance = get_instance(api_url)
         super().__init__(api_url)
         self.dandi_instance: DandiInstance = dandi_instance
+        self._storage: RESTFullAPIClient | None = None
+        self._storage_lock = Lock()
         if token is not None:
             self.authenticate(token)
 
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        super().__exit__(exc_type, exc_val, exc_tb)
+        if self._storage is not None:
+            self._storage.session.close()
+
+    @property
+    def storage(self) -> RESTFullAPIClient:
+        """
+        A client for making requests directly to the storage backend (e.g.,
+        for uploading or downloading blobs via presigned URLs).  It has its own
+        connection pools, separate from those used for the API host, and it
+        does not send the API token.  The same instance is returned on every
+        access so that connections are reused across all files of an upload or
+        download.
+        """
+        with self._storage_lock:
+            if self._storage is None:
+                self._storage = RESTFullAPIClient(
+                    "http://nil.nil",
+                    pool_maxsize=self.pool_maxsize or HTTP_POOL_MAXSIZE,
+                )
+            return self._storage
+
+    def set_pool_maxsize(self, pool_maxsize: int) -> None:
+        """
+        Ensure that the connection pools for both the API host and (via
+        `storage`) the storage hosts can hold at least ``pool_maxsize``
+        connections per host.  If the storage client has not been created yet,
+        it is sized accordingly when it is.
+        """
+        super().set_pool_maxsize(pool_maxsize)
+        with self._storage_lock:
+            if self._storage is not None:
+                self._storage.set_pool_maxsize(pool_maxsize)
+
+    def log_pool_stats(self) -> None:
+        """
+        Log the connection pool statistics for the API host and for the
+        storage hosts at DEBUG level
+        """
+        super().log_pool_stats()
+        if self._storage is not None:
+            self._storage.log_pool_stats()
+
     @classmethod
     def for_dandi_instance(
         cls,
@@ -1260,7 +1423,9 @@ class RemoteDandiset:
             f"No published versions found for Dandiset {self.identifier}"
         )
 
-    def get_assets(self, order: str | None = None) -> Iterator[RemoteAsset]:
+    def get_assets(
+        self, order: str | None = None, metadata: bool = False
+    ) -> Iterator[RemoteAsset]:
         """
         Returns an iterator of all assets in this version of the Dandiset.
 
@@ -1268,12 +1433,22 @@ class RemoteDandiset:
         as the ``order`` parameter.  The accepted field names are
         ``"created"``, ``"modified"``, and ``"path"``.  Prepend a hyphen to the
         field name to reverse the sort order.
+
+        .. versionchanged:: 0.77.0
+
+            ``metadata`` parameter added.  If it is true, the assets' metadata
+            is retrieved in the same requests as the assets, so that calling
+            `~RemoteAsset.get_raw_metadata()` on them does not require a
+            request per asset.
         """
+        params: dict[str, Any] = {"order": order}
+        if metadata:
+            params["metadata"] = "true"
         try:
             for a in self.client.paginate(
-                f"{self.version_api_path}assets/", params={"order": order}
+                f"{self.version_api_path}assets/", params=params
             ):
-                yield RemoteAsset.from_data(self, a)
+                yield RemoteAsset.from_data(self, a, a.pop("metadata", None))
         except HTTP404Error:
             raise NotFoundError(
                 f"No such version: {self.version_id!r} of Dandiset {self.identifier}"
@@ -1697,13 +1872,20 @@ class BaseRemoteAsset(ABC, APIBase):
         return url
 
     def get_download_file_iter(
-        self, chunk_size: int = MAX_CHUNK_SIZE
+        self, chunk_size: int = MAX_CHUNK_SIZE, storage_url: str | None = None
     ) -> Callable[[int], Iterator[bytes]]:
         """
         Returns a function that when called (optionally with an offset into the
         asset to start downloading at) returns a generator of chunks of the
         asset.
 
+        If ``storage_url`` is given (cf. `BaseRemoteBlobAsset.get_storage_url()`),
+        the asset is downloaded directly from that URL instead of via the API's
+        download endpoint, saving a request to the API server and a redirect.
+        Should the storage backend reject the URL (e.g., because a presigned
+        URL has expired), the download falls back to the API's download
+        endpoint.
+
         :raises ValueError: if the asset is not backed by a blob
         """
         if self.asset_type is not AssetType.BLOB:
@@ -1712,16 +1894,45 @@ class BaseRemoteAsset(ABC, APIBase):
                 f" {self.asset_type.name}, not BLOB"
             )
 
-        url = self.base_download_url
+        api_url = self.base_download_url
 
         def downloader(start_at: int = 0) -> Iterator[bytes]:
-            lgr.debug("Starting download from %s", url)
-            headers = None
+            nonlocal storage_url
+            headers: dict[str, str] = {}
             if start_at > 0:
-                headers = {"Range": f"bytes={start_at}-"}
-            result = self.client.session.get(
-                url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT
-            )
+                headers["Range"] = f"bytes={start_at}-"
+            result: requests.Response | None = None
+            if storage_url is not None:
+                url = storage_url
+                lgr.debug("Starting download from %s", url)
+                result = get_host_throttle(url).send(
+                    self.client.storage.session.get,
+                    url,
+                    stream=True,
+                    headers=headers,
+                    timeout=DOWNLOAD_TIMEOUT,
+                )
+                if result.status_code in (400, 401, 403, 404):
+                    lgr.debug(
+                        "Storage URL %s for asset %s was rejected with status %d;"
+                        " falling back to %s",
+                        url,
+                        self.identifier,
+                        result.status_code,
+                        api_url,
+                    )
+                    result.close()
+                    result = storage_url = None
+            if result is None:
+                url = api_url
+                lgr.debug("Starting download from %s", url)
+                result = get_host_throttle(url).send(
+                    self.client.session.get,
+                    url,
+                    stream=True,
+                    headers=headers,
+                    timeout=DOWNLOAD_TIMEOUT,
+                )
             # TODO: apparently we might need retries here as well etc
             # if result.status_code not in (200, 201):
             result.raise_for_status()
@@ -1809,25 +2020,64 @@ class BaseRemoteBlobAsset(BaseRemoteAsset):
         object for reading bytes directly from the asset on the server
         """
         md = self.get_raw_metadata()
+        if (url := self._find_storage_url(md)) is not None:
+            try:
+                size = int(md["contentSize"])
+            except (KeyError, TypeError, ValueError):
+                lgr.warning('"contentSize" not set for asset %s', self.identifier)
+                r = requests.head(url)
+                r.raise_for_status()
+                size = int(r.headers["Content-Length"])
+            mtime: datetime | None
+            try:
+                mtime = ensure_datetime(md["blobDateModified"])
+            except (KeyError, TypeError, ValueError):
+                mtime = None
+            name = PurePosixPath(md["path"]).name
+            return RemoteReadableAsset(
+                url=url, size=size, mtime=mtime, name=name, blob_id=self.blob
+            )
+        raise NotFoundError("S3 URL not found in asset's contentUrl metadata field")
+
+    def get_storage_url(
+        self,
+        metadata: dict[str, Any] | None = None,
+        follow_redirects: bool = True,
+    ) -> str:
+        """
+        Returns a URL from which the asset's blob can be downloaded directly
+        from storage (e.g., S3) without going through the API's download
+        endpoint.
+
+        The URL is looked up in the ``contentUrl`` field of the asset's
+        metadata (or of ``metadata``, if given, in order to avoid fetching the
+        metadata again).  If it is not found there and ``follow_redirects`` is
+        true, a ``HEAD`` request is made to the API's download endpoint, and
+        the URL that it redirects to is returned.
+
+        :raises NotFoundError: if no storage URL could be determined
+        """
+        if metadata is None:
+            metadata = self.get_raw_metadata()
+        if (url := self._find_storage_url(metadata)) is not None:
+            return url
+        if follow_redirects:
+            r = self.client.request(
+                "HEAD", self.base_download_url, json_resp=False, allow_redirects=False
+            )
+            if location := r.headers.get("Location"):
+                assert isinstance(location, str)
+                return location
+        raise NotFoundError(f"Could not determine storage URL for asset {self}")
+
+    def _find_storage_url(self, metadata: dict[str, Any]) -> str | None:
         local_prefix = self.client.api_url.lower()
-        for url in md.get("contentUrl", []):
+        for url in metadata.get("contentUrl", []):
             if not url.lower().startswith(local_prefix):
                 # This must be the S3 URL
-                try:
-                    size = int(md["contentSize"])
-                except (KeyError, TypeError, ValueError):
-                    lgr.warning('"contentSize" not set for asset %s', self.identifier)
-                    r = requests.head(url)
-                    r.raise_for_status()
-                    size = int(r.headers["Content-Length"])
-                mtime: datetime | None
-                try:
-                    mtime = ensure_datetime(md["blobDateModified"])
-                except (KeyError, TypeError, ValueError):
-                    mtime = None
-                name = PurePosixPath(md["path"]).name
-                return RemoteReadableAsset(url=url, size=size, mtime=mtime, name=name)
-        raise NotFoundError("S3 URL not found in asset's contentUrl metadata field")
+                assert isinstance(url, str)
+                return url
+        return None
 
 
 class BaseRemoteZarrAsset(BaseRemoteAsset):
@@ -2177,8 +2427,12 @@ class RemoteZarrEntry:
             headers = None
             if start_at > 0:
                 headers = {"Range": f"bytes={start_at}-"}
-            result = self.client.session.get(
-                url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            result = get_host_throttle(url).send(
+                self.client.session.get,
+                url,
+                stream=True,
+                headers=headers,
+                timeout=DOWNLOAD_TIMEOUT,
             )
             # TODO: apparently we might need retries here as well etc
             # if result.status_code not in (200, 201):
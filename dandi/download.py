@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from collections import Counter, deque
 from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum, StrEnum
@@ -28,7 +29,7 @@ import sys
 from threading import Lock
 import time
 from types import TracebackType
-from typing import IO, Any, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 
 from dandischema.digests.dandietag import ETagHashlike
 from dandischema.models import DigestType
@@ -38,8 +39,24 @@ from interleave import FINISH_CURRENT, lazy_interleave
 import requests
 
 from . import get_logger
-from .consts import DOWNLOAD_SUFFIX, RETRY_STATUSES, SyncMode, dandiset_metadata_file
-from .dandiapi import AssetType, BaseRemoteZarrAsset, RemoteDandiset
+from .consts import (
+    BIDS_DATASET_DESCRIPTION,
+    BIDS_IGNORE_FILE,
+    DOWNLOAD_SUFFIX,
+    RETRY_STATUSES,
+    STORAGE_URL_BATCH_SIZE,
+    STORAGE_URL_WORKERS,
+    ZARR_EXTENSIONS,
+    SyncMode,
+    dandiset_metadata_file,
+)
+from .dandiapi import (
+    AssetType,
+    BaseRemoteAsset,
+    BaseRemoteBlobAsset,
+    BaseRemoteZarrAsset,
+    RemoteDandiset,
+)
 from .dandiarchive import (
     AssetItemURL,
     DandisetURL,
@@ -49,13 +66,14 @@ from .dandiarchive import (
 )
 from .dandiset import Dandiset
 from .exceptions import NotFoundError
-from .files import LocalAsset, find_dandi_files
 from .support import pyout as pyouts
 from .support.iterators import IteratorWithAggregation
+from .support.local_state import LocalState
 from .support.pyout import naturalsize
 from .utils import (
     Hasher,
     abbrev_prompt,
+    chunked,
     ensure_datetime,
     exclude_from_zarr,
     flattened,
@@ -66,6 +84,9 @@ from .utils import (
     yaml_load,
 )
 
+if TYPE_CHECKING:
+    from zarr_checksum.tree import ZarrChecksumTree
+
 lgr = get_logger()
 
 
@@ -139,6 +160,7 @@ def download(
                 str(format),
             )
 
+    storage_urls = StorageURLCache()
     downloaders = [
         Downloader(
             url=purl,
@@ -149,6 +171,10 @@ def download(
             preserve_tree=preserve_tree,
             jobs_per_zarr=jobs_per_zarr,
             on_error="yield" if format is DownloadFormat.PYOUT else "raise",
+            storage_urls=storage_urls,
+            # Up to `jobs` assets are downloaded at once, with Zarrs being
+            # downloaded in up to `jobs_per_zarr` threads each
+            pool_maxsize=jobs * (jobs_per_zarr or 4),
             **kw,
         )
         for purl in parsed_urls
@@ -156,6 +182,15 @@ def download(
 
     gen_ = (r for dl in downloaders for r in dl.download_generator())
 
+    local_scans: list[Future[list[str]]] = []
+    if sync:
+        # List the local files to compare against the remote assets while the
+        # latter are being downloaded
+        scan_pool = ThreadPoolExecutor(thread_name_prefix="dandi-sync")
+        local_scans = [scan_pool.submit(dl.list_local_assets) for dl in downloaders]
+        # The submitted scans keep running
+        scan_pool.shutdown(wait=False)
+
     # Constructs to capture errors and handle them at the end
     errors = []
 
@@ -196,7 +231,11 @@ def download(
         # Normalize legacy bool True to SyncMode.ASK
         if sync is True:
             sync = SyncMode.ASK
-        to_delete = [p for dl in downloaders for p in dl.delete_for_sync()]
+        to_delete = [
+            p
+            for dl, scan in zip(downloaders, local_scans)
+            for p in dl.delete_for_sync(scan.result())
+        ]
         if to_delete:
             do_delete = False
             if sync is SyncMode.DO:
@@ -244,12 +283,18 @@ class Downloader:
     preserve_tree: bool
     jobs_per_zarr: int | None
     on_error: Literal["raise", "yield"]
+    #: Maximum number of concurrent requests that the downloads will make, to
+    #: which the client's connection pools are sized
+    pool_maxsize: int | None = None
     #: which will be set .gen to assets.  Purpose is to make it possible to get
     #: summary statistics while already downloading.  TODO: reimplement
     #: properly!
     assets_it: IteratorWithAggregation | None = None
     yield_generator_for_fields: tuple[str, ...] | None = None
     asset_download_paths: set[str] = field(init=False, default_factory=set)
+    #: Cache of direct storage URLs for blobs; can be shared among multiple
+    #: `Downloader` instances
+    storage_urls: StorageURLCache = field(default_factory=lambda: StorageURLCache())
 
     def __post_init__(self, output_dir: str | Path) -> None:
         # TODO: if we are ALREADY in a dandiset - we can validate that it is
@@ -279,6 +324,8 @@ class Downloader:
         """
 
         with self.url.navigate(strict=True) as (client, dandiset, assets):
+            if self.pool_maxsize is not None:
+                client.set_pool_maxsize(self.pool_maxsize)
             if (
                 (
                     isinstance(self.url, DandisetURL)
@@ -308,18 +355,18 @@ class Downloader:
             if self.assets_it:
                 assets = self.assets_it.feed(assets)
             lock = Lock()
-            for asset in assets:
+            state = LocalState.for_dandiset(self.output_path)
+            for asset, metadata in self.storage_urls.prefetch(assets):
                 path = self.url.get_asset_download_path(
                     asset, preserve_tree=self.preserve_tree
                 )
                 self.asset_download_paths.add(path)
+                relpath = path
                 download_path = Path(self.output_path, path)
                 path = str(self.output_prefix / path)
 
-                try:
-                    metadata = asset.get_raw_metadata()
-                except NotFoundError as e:
-                    yield {"path": path, "status": "error", "message": str(e)}
+                if isinstance(metadata, NotFoundError):
+                    yield {"path": path, "status": "error", "message": str(metadata)}
                     continue
                 d = metadata.get("digest", {})
 
@@ -344,8 +391,11 @@ class Downloader:
                             asset.path,
                         )
                         mtime = asset.modified
+                    fstate = state.get(relpath) if state is not None else None
                     _download_generator = _download_file(
-                        asset.get_download_file_iter(),
+                        asset.get_download_file_iter(
+                            storage_url=self.storage_urls.get(asset)
+                        ),
                         download_path,
                         toplevel_path=self.output_path,
                         # size and modified generally should be there but
@@ -355,7 +405,16 @@ class Downloader:
                         existing=self.existing,
                         digests=digests,
                         lock=lock,
+                        local_etag=fstate.dandi_etag if fstate is not None else None,
                     )
+                    if state is not None:
+                        _download_generator = _record_local_state(
+                            _download_generator,
+                            state,
+                            relpath,
+                            dandi_etag=digests["dandi-etag"],
+                            remote_asset_id=asset.identifier,
+                        )
 
                 else:
                     assert isinstance(
@@ -406,28 +465,220 @@ class Downloader:
                 else:
                     for resp in gen:
                         yield {**resp, "path": path}
+            client.log_pool_stats()
+
+    def list_local_assets(self) -> list[str]:
+        """
+        Returns the sorted ``/``-separated paths relative to `output_path` of
+        the local files & Zarrs that `delete_for_sync()` considers for
+        deletion.  This can be called while the assets are being downloaded.
+        """
+        if isinstance(self.url, SingleAssetURL):
+            return []
+        return list(_iter_local_asset_paths(str(self.output_path)))
 
-    def delete_for_sync(self) -> list[Path]:
+    def delete_for_sync(self, local_assets: Iterable[str] | None = None) -> list[Path]:
         """
         Returns the paths of local files that need to be deleted in order to
         sync the contents of `output_path` with the remote URL
+
+        The local files are compared against the paths of the assets
+        downloaded by `download_generator()` by merging both sorted listings.
+        ``local_assets`` may be given as the return value of an earlier call
+        to `list_local_assets()`; if it is not, `output_path` is listed now.
         """
         if isinstance(self.url, SingleAssetURL):
             return []
+        if local_assets is None:
+            local_assets = _iter_local_asset_paths(str(self.output_path))
+        remote = iter(sorted(self.asset_download_paths))
+        rpath = next(remote, None)
         to_delete = []
-        for df in find_dandi_files(
-            self.output_path, dandiset_path=self.output_path, allow_all=True
-        ):
-            if not isinstance(df, LocalAsset):
-                continue
-            if (
-                self.url.is_under_download_path(df.path)
-                and df.path not in self.asset_download_paths
-            ):
-                to_delete.append(df.filepath)
+        for path in local_assets:
+            while rpath is not None and rpath < path:
+                rpath = next(remote, None)
+            if rpath != path and self.url.is_under_download_path(path):
+                to_delete.append(self.output_path / path)
         return to_delete
 
 
+def _iter_local_asset_paths(
+    dirpath: str, prefix: str = "", in_bids: bool = False
+) -> Iterator[str]:
+    """
+    Yield the ``/``-separated paths (each prefixed with ``prefix``) of the
+    files & Zarrs under the directory ``dirpath`` that `find_dandi_files()`
+    would return as assets of a Dandiset rooted at ``dirpath``, in sorted
+    order, using only `os.scandir()`.  The temporary directories of downloads
+    in progress are skipped.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return
+    in_bids = in_bids or any(e.name == BIDS_DATASET_DESCRIPTION for e in entries)
+    # Directories to recurse into are sorted by their names plus a trailing
+    # slash so that the paths are yielded in lexicographic order
+    children: list[tuple[str, os.DirEntry[str]]] = []
+    for e in entries:
+        name = e.name
+        if (
+            name.startswith(".") and not (in_bids and name == BIDS_IGNORE_FILE)
+        ) or name.endswith(DOWNLOAD_SUFFIX):
+            continue
+        if e.is_dir():
+            if e.is_symlink():
+                continue
+            if op.splitext(name)[1] in ZARR_EXTENSIONS:
+                # Zarrs without any files are not assets (and, when traversed
+                # as regular directories, contain no assets either)
+                if _zarr_has_files(e.path):
+                    children.append((name, e))
+            else:
+                children.append((name + "/", e))
+        elif not (prefix == "" and name == dandiset_metadata_file):
+            children.append((name, e))
+    children.sort(key=lambda c: c[0])
+    for key, e in children:
+        if key.endswith("/"):
+            yield from _iter_local_asset_paths(e.path, prefix + key, in_bids)
+        else:
+            yield prefix + key
+
+
+def _zarr_has_files(dirpath: str) -> bool:
+    """
+    Returns whether the local Zarr at ``dirpath`` contains any files other
+    than those excluded by `exclude_from_zarr()`
+    """
+    dirs = [dirpath]
+    while dirs:
+        try:
+            with os.scandir(dirs.pop()) as it:
+                for e in it:
+                    if exclude_from_zarr(e):
+                        continue
+                    if e.is_dir():
+                        dirs.append(e.path)
+                    else:
+                        return True
+        except FileNotFoundError:
+            pass
+    return False
+
+
+class StorageURLCache:
+    """
+    Thread-safe cache mapping blob IDs to URLs from which the blobs can be
+    downloaded directly from storage (e.g., S3), so that each blob can be
+    fetched with a single request to storage rather than by going through the
+    API server's download endpoint and its redirect.
+
+    Storage URLs are primarily taken from the ``contentUrl`` field of asset
+    metadata; for assets whose metadata lacks such a URL, the redirects of the
+    API's download endpoint are resolved concurrently.
+
+    :meta private:
+    """
+
+    def __init__(
+        self,
+        batch_size: int = STORAGE_URL_BATCH_SIZE,
+        workers: int = STORAGE_URL_WORKERS,
+    ) -> None:
+        #: Number of assets to process at once in `prefetch()`
+        self.batch_size = batch_size
+        #: Number of threads for fetching metadata and resolving redirects
+        self.workers = workers
+        self._urls: dict[str, str] = {}
+        self._lock = Lock()
+
+    def get(self, asset: BaseRemoteAsset) -> str | None:
+        """
+        Return the cached storage URL for ``asset``, or `None` if there is none
+        """
+        if not isinstance(asset, BaseRemoteBlobAsset):
+            return None
+        with self._lock:
+            return self._urls.get(asset.blob)
+
+    def prefetch(
+        self, assets: Iterable[BaseRemoteAsset]
+    ) -> Iterator[tuple[BaseRemoteAsset, dict[str, Any] | NotFoundError]]:
+        """
+        Fetch the raw metadata for ``assets`` in concurrent batches, resolve &
+        cache the storage URLs for the blob assets among them, and yield each
+        asset (in the original order) paired with either its metadata or the
+        `NotFoundError` raised while fetching it
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for batch in chunked(assets, self.batch_size):
+                metadata = list(pool.map(_get_raw_metadata, batch))
+                unresolved = []
+                for asset, md in zip(batch, metadata):
+                    if not isinstance(asset, BaseRemoteBlobAsset) or isinstance(
+                        md, NotFoundError
+                    ):
+                        continue
+                    with self._lock:
+                        if asset.blob in self._urls:
+                            continue
+                    try:
+                        url = asset.get_storage_url(md, follow_redirects=False)
+                    except NotFoundError:
+                        unresolved.append((asset, md))
+                    else:
+                        self._add(asset, url)
+                for (asset, _), resolved in zip(
+                    unresolved, pool.map(self._follow_redirect, unresolved)
+                ):
+                    if resolved is not None:
+                        self._add(asset, resolved)
+                yield from zip(batch, metadata)
+
+    def _add(self, asset: BaseRemoteBlobAsset, url: str) -> None:
+        with self._lock:
+            self._urls[asset.blob] = url
+
+    @staticmethod
+    def _follow_redirect(
+        asset_md: tuple[BaseRemoteBlobAsset, dict[str, Any]],
+    ) -> str | None:
+        asset, md = asset_md
+        try:
+            return asset.get_storage_url(md, follow_redirects=True)
+        except (NotFoundError, requests.RequestException) as e:
+            lgr.debug(
+                "Could not resolve storage URL for asset %s: %s; will download"
+                " via the API",
+                asset.identifier,
+                e,
+            )
+            return None
+
+
+def _get_raw_metadata(asset: BaseRemoteAsset) -> dict[str, Any] | NotFoundError:
+    try:
+        return asset.get_raw_metadata()
+    except NotFoundError as e:
+        return e
+
+
+def _record_local_state(
+    generator: Iterator[dict], state: LocalState, path: str, **values: str | None
+) -> Iterator[dict]:
+    """
+    Pass through the records of a `_download_file()` generator, recording
+    ``values`` in the local state of the Dandiset for the file at ``path`` once
+    it has been downloaded
+    """
+    for rec in generator:
+        if rec.get("status") == "done":
+            state.update(path, **values)
+        yield rec
+
+
 def _download_generator_guard(path: str, generator: Iterator[dict]) -> Iterator[dict]:
     try:
         yield from generator
@@ -610,6 +861,7 @@ def _download_file(
     existing: DownloadExisting = DownloadExisting.ERROR,
     digests: dict[str, str] | None = None,
     digest_callback: Callable[[str, str], Any] | None = None,
+    local_etag: str | None = None,
 ) -> Iterator[dict]:
     """
     Common logic for downloading a single file.
@@ -637,6 +889,9 @@ def _download_file(
     digests: dict, optional
       possible checksums or other digests provided for the file. Only one
       will be used to verify download
+    local_etag: str, optional
+      the dandi-etag recorded for the existing file at path in the local state
+      of the Dandiset, if the file is unchanged since it was recorded
     """
     # Avoid heavy import by importing within function:
     from .support.digests import get_digest
@@ -676,7 +931,12 @@ def _download_file(
             elif (
                 digests is not None
                 and "dandi-etag" in digests
-                and get_digest(path, "dandi-etag") == digests["dandi-etag"]
+                and (
+                    local_etag
+                    if local_etag is not None
+                    else get_digest(path, "dandi-etag")
+                )
+                == digests["dandi-etag"]
             ):
                 yield _skip_file("already exists")
                 return
@@ -992,17 +1252,24 @@ def _download_zarr(
     jobs: int | None = None,
 ) -> Iterator[dict]:
     # Avoid heavy import by importing within function:
-    from .support.digests import get_zarr_checksum
+    from zarr_checksum.tree import ZarrChecksumTree
 
     # we will collect them all while starting the download
     # with the first page of entries received from the server.
     entries = []
-    digests = {}
+    # The Zarr checksum of the local copy is built from the digests of the
+    # files as they are downloaded; the digests of the files that are not
+    # downloaded are added by `_prune_zarr()`.
+    checksum_tree = ZarrChecksumTree()
+    checksum_lock = Lock()
+    digested: set[str] = set()
     pc = ProgressCombiner(zarr_size=asset.size)
 
-    def digest_callback(path: str, algoname: str, d: str) -> None:
+    def digest_callback(path: str, size: int, algoname: str, d: str) -> None:
         if algoname == "md5":
-            digests[path] = d
+            with checksum_lock:
+                checksum_tree.add_leaf(Path(path), size, d)
+                digested.add(path)
 
     def downloads_gen():
         for entry in asset.iterfiles():
@@ -1020,7 +1287,7 @@ def _download_zarr(
                     existing=existing,
                     digests={"md5": etag.value},
                     lock=lock,
-                    digest_callback=partial(digest_callback, str(entry)),
+                    digest_callback=partial(digest_callback, str(entry), entry.size),
                 ),
             )
         pc.file_qty = len(entries)
@@ -1042,50 +1309,19 @@ def _download_zarr(
         else:
             return
 
-    remote_paths = set(map(str, entries))
     zarr_basepath = Path(download_path)
+    verify = "skipped" not in final_out["message"]
+    yield from _prune_zarr(
+        zarr_basepath,
+        set(map(str, entries)),
+        checksum_tree if verify else None,
+        digested,
+        jobs=jobs or 4,
+    )
 
-    announced: bool = False
-    empty_dirs: deque[Path] = deque()
-    dirs: deque[Path] = deque([zarr_basepath])
-    while dirs:
-        d = dirs.popleft()
-        is_empty = True
-        for p in list(d.iterdir()):
-            if exclude_from_zarr(p):
-                is_empty = False
-            elif (
-                p.is_file()
-                and p.relative_to(zarr_basepath).as_posix() not in remote_paths
-            ):
-                if not announced:
-                    announced = True
-                    yield {"status": "deleting extra files"}
-                try:
-                    lgr.debug("Deleting extra Zarr file %s", p)
-                    p.unlink()
-                except OSError:
-                    is_empty = False
-            elif p.is_dir():
-                dirs.append(p)
-                is_empty = False
-            else:
-                is_empty = False
-        if is_empty and d != zarr_basepath:
-            empty_dirs.append(d)
-    while empty_dirs:
-        d = empty_dirs.popleft()
-        if not announced:
-            announced = True
-            yield {"status": "deleting extra files"}
-        lgr.debug("Removing now-empty Zarr directory %s", d)
-        d.rmdir()
-        if d.parent != zarr_basepath and not any(d.parent.iterdir()):
-            empty_dirs.append(d.parent)
-
-    if "skipped" not in final_out["message"]:
+    if verify:
         zarr_checksum = asset.get_digest().value
-        local_checksum = get_zarr_checksum(zarr_basepath, known=digests)
+        local_checksum = str(checksum_tree.process())
         if zarr_checksum != local_checksum:
             msg = f"Zarr checksum: downloaded {local_checksum} != {zarr_checksum}"
             yield {"checksum": "differs", "status": "error", "message": msg}
@@ -1102,6 +1338,92 @@ def _download_zarr(
     yield {"status": "done"}
 
 
+def _prune_zarr(
+    zarr_basepath: Path,
+    remote_paths: set[str],
+    checksum_tree: ZarrChecksumTree | None,
+    digested: set[str],
+    jobs: int,
+) -> Iterator[dict]:
+    """
+    Delete the files in the local Zarr at ``zarr_basepath`` whose
+    ``/``-separated paths relative to it are not in ``remote_paths``, along
+    with the directories left empty, in a single walk of the Zarr whose
+    directories are scanned in a pool of ``jobs`` threads.  If
+    ``checksum_tree`` is not `None`, the kept files not in ``digested`` are
+    digested in the same pool and added to it.  Yields ``{"status":
+    "deleting extra files"}`` before deleting anything.
+    """
+    # Avoid heavy import by importing within function:
+    from .support.digests import md5file_nocache
+
+    def scan(dirpath: str) -> list[os.DirEntry[str]]:
+        with os.scandir(dirpath) as it:
+            return list(it)
+
+    def digest(relpath: str, filepath: str) -> tuple[str, str, int]:
+        return (relpath, md5file_nocache(filepath), os.path.getsize(filepath))
+
+    announced = False
+    # Each directory walked, as a prefix for the relative paths of its
+    # entries, along with its path and the prefix of its parent
+    walked: list[tuple[str, str, str]] = []
+    # The number of entries in each walked directory that are kept
+    kept: dict[str, int] = {}
+    digests: list[Future[tuple[str, str, int]]] = []
+    with ThreadPoolExecutor(
+        max_workers=jobs, thread_name_prefix="dandi-zarr-prune"
+    ) as pool:
+        # Directories are scanned as soon as they are found, while their
+        # entries are processed in breadth-first order
+        queue: deque[tuple[str, str, str, Future[list[os.DirEntry[str]]]]] = deque(
+            [("", str(zarr_basepath), "", pool.submit(scan, str(zarr_basepath)))]
+        )
+        while queue:
+            prefix, dirpath, parent, entries = queue.popleft()
+            walked.append((prefix, dirpath, parent))
+            n = 0
+            for e in entries.result():
+                relpath = prefix + e.name
+                if exclude_from_zarr(e):
+                    n += 1
+                elif e.is_file():
+                    if relpath not in remote_paths:
+                        if not announced:
+                            announced = True
+                            yield {"status": "deleting extra files"}
+                        try:
+                            lgr.debug("Deleting extra Zarr file %s", e.path)
+                            os.unlink(e.path)
+                        except OSError:
+                            n += 1
+                    else:
+                        n += 1
+                        if checksum_tree is not None and relpath not in digested:
+                            digests.append(pool.submit(digest, relpath, e.path))
+                elif e.is_dir():
+                    n += 1
+                    queue.append(
+                        (relpath + "/", e.path, prefix, pool.submit(scan, e.path))
+                    )
+                else:
+                    n += 1
+            kept[prefix] = n
+        if checksum_tree is not None:
+            for f in digests:
+                relpath, md5, size = f.result()
+                checksum_tree.add_leaf(Path(relpath), size, md5)
+    # Subdirectories come after their parents in breadth-first order
+    for prefix, dirpath, parent in reversed(walked):
+        if prefix and not kept[prefix]:
+            if not announced:
+                announced = True
+                yield {"status": "deleting extra files"}
+            lgr.debug("Removing now-empty Zarr directory %s", dirpath)
+            os.rmdir(dirpath)
+            kept[parent] -= 1
+
+
 def _check_attempts_and_sleep(
     path: Path,
     exc: requests.RequestException,
@@ -89,5 +89,14 @@ class HTTP404Error(requests.HTTPError):
     pass
 
 
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Request was not sent because too many recent requests to the same host
+    failed (see `dandi.support.throttle`)
+    """
+
+    pass
+
+
 class UploadError(Exception):
     pass
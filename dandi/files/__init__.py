@@ -13,13 +13,16 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Iterator
-import os.path
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 from dandi import get_logger
 from dandi.consts import (
     BIDS_DATASET_DESCRIPTION,
     BIDS_IGNORE_FILE,
+    ZARR_EXTENSIONS,
     dandiset_metadata_file,
 )
 from dandi.exceptions import UnknownAssetError
@@ -68,6 +71,28 @@ __all__ = [
 
 lgr = get_logger()
 
+#: The number of threads in which `find_dandi_files()` scans directories
+_SCAN_THREADS = 8
+
+
+class _QueueItem(NamedTuple):
+    """A file or directory being considered by `find_dandi_files()`"""
+
+    filepath: Path
+    #: The path of the file relative to the Dandiset (or its name, if there is
+    #: no Dandiset)
+    path: str
+    #: The object via which the type of the file is queried: its `os.DirEntry`
+    #: if it was found by scanning its parent directory (so that the type
+    #: obtained by the scan is reused), or else ``filepath``
+    info: Path | os.DirEntry[str]
+    bids_dataset_description: BIDSDatasetDescriptionAsset | None
+    #: The scan of the directory, if started already
+    scan: Future[list[os.DirEntry[str]]] | None
+
+    def entries(self) -> list[os.DirEntry[str]]:
+        return _scandir(self.filepath) if self.scan is None else self.scan.result()
+
 
 def find_dandi_files(
     *paths: str | Path,
@@ -97,66 +122,136 @@ def find_dandi_files(
         (unless ``allow_all`` is true).
     """
 
-    # A pair of each file or directory being considered plus the most recent
+    # Each file or directory being considered, along with the most recent
     # BIDS dataset_description.json file at the path (if a directory) or in a
     # parent path
-    path_queue: deque[tuple[Path, BIDSDatasetDescriptionAsset | None]] = deque()
+    path_queue: deque[_QueueItem] = deque()
+    if dandiset_path is not None:
+        dandiset_path = Path(dandiset_path)
     for p in map(Path, paths):
+        if p.name.startswith("."):
+            continue
         if dandiset_path is not None:
             try:
-                p.relative_to(dandiset_path)
+                relpath = p.relative_to(dandiset_path).as_posix()
             except ValueError:
                 raise ValueError(
                     f"Path {str(p)!r} is not inside Dandiset path {str(dandiset_path)!r}"
                 )
-        path_queue.append((Path(p), None))
+        else:
+            relpath = p.name
+        path_queue.append(_QueueItem(p, relpath, p, None, None))
     bids_roots = []
-    while path_queue:
-        p, bidsdd = path_queue.popleft()
-        if p.name.startswith("."):
-            # Allow .bidsignore files within BIDS datasets to be uploaded
-            if not (p.name == BIDS_IGNORE_FILE and bidsdd is not None):
-                continue
-        if p.is_dir():
-            if p.is_symlink():
-                lgr.warning("%s: Ignoring unsupported symbolic link to directory", p)
-            elif dandiset_path is not None and p == Path(dandiset_path):
-                if os.path.lexists(p / BIDS_DATASET_DESCRIPTION):
-                    bids = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
-                    assert isinstance(bids, BIDSDatasetDescriptionAsset)
-                    bidsdd = bids
-                    bids_roots.append(p)
-                path_queue.extend((q, bidsdd) for q in p.iterdir())
-            elif any(p.iterdir()):
-                try:
-                    df = dandi_file(p, dandiset_path, bids_dataset_description=bidsdd)
-                except UnknownAssetError:
-                    # The directory does not have a recognized file extension
-                    # (ie., it's not a Zarr or any other directory asset type
-                    # we may add later), so traverse through it as a regular
-                    # directory.
-                    if os.path.lexists(p / BIDS_DATASET_DESCRIPTION) and not any(
-                        i in p.parents for i in bids_roots
-                    ):  # No nested BIDS
-                        bids2 = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
-                        assert isinstance(bids2, BIDSDatasetDescriptionAsset)
-                        bidsdd = bids2
+    # Directories are scanned in a pool of threads as soon as they are found,
+    # while their entries are processed in the same (breadth-first) order as
+    # if they were scanned one after another
+    pool = ThreadPoolExecutor(
+        max_workers=_SCAN_THREADS, thread_name_prefix="find_dandi_files"
+    )
+
+    def enqueue(
+        item: _QueueItem,
+        entries: list[os.DirEntry[str]],
+        bidsdd: BIDSDatasetDescriptionAsset | None,
+    ) -> None:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                # Allow .bidsignore files within BIDS datasets to be uploaded
+                if not (name == BIDS_IGNORE_FILE and bidsdd is not None):
+                    continue
+            q = item.filepath / name
+            if dandiset_path is None:
+                relpath = name
+            elif item.path == ".":
+                relpath = name
+            else:
+                relpath = f"{item.path}/{name}"
+            scan = (
+                pool.submit(_scandir, q)
+                if entry.is_dir()
+                and not entry.is_symlink()
+                and q.suffix not in ZARR_EXTENSIONS
+                else None
+            )
+            path_queue.append(_QueueItem(q, relpath, entry, bidsdd, scan))
+
+    try:
+        while path_queue:
+            item = path_queue.popleft()
+            p, bidsdd = item.filepath, item.bids_dataset_description
+            if item.info.is_dir():
+                if item.info.is_symlink():
+                    lgr.warning(
+                        "%s: Ignoring unsupported symbolic link to directory", p
+                    )
+                    continue
+                if dandiset_path is not None and item.path == ".":
+                    entries = item.entries()
+                    if _has_bids_dataset_description(entries):
+                        bids = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
+                        assert isinstance(bids, BIDSDatasetDescriptionAsset)
+                        bidsdd = bids
                         bids_roots.append(p)
-                    path_queue.extend((q, bidsdd) for q in p.iterdir())
+                    enqueue(item, entries, bidsdd)
+                    continue
+                if p.suffix in ZARR_EXTENSIONS:
+                    if not any(p.iterdir()):
+                        continue
+                    try:
+                        df = _dandi_file(item, dandiset_path)
+                    except UnknownAssetError:
+                        # A Zarr without any files is traversed as a regular
+                        # directory
+                        pass
+                    else:
+                        yield df
+                        continue
+                # The directory does not have a recognized file extension (ie.,
+                # it's not a Zarr or any other directory asset type we may add
+                # later), so traverse through it as a regular directory.
+                entries = item.entries()
+                if _has_bids_dataset_description(entries) and not any(
+                    i in p.parents for i in bids_roots
+                ):  # No nested BIDS
+                    bids2 = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
+                    assert isinstance(bids2, BIDSDatasetDescriptionAsset)
+                    bidsdd = bids2
+                    bids_roots.append(p)
+                enqueue(item, entries, bidsdd)
+            else:
+                df = _dandi_file(item, dandiset_path)
+                # Don't use isinstance() here, as GenericBIDSAsset's should
+                # still be returned
+                if type(df) is GenericAsset and not allow_all:
+                    pass
+                elif isinstance(df, DandisetMetadataFile) and not (
+                    allow_all or include_metadata
+                ):
+                    pass
                 else:
                     yield df
-        else:
-            df = dandi_file(p, dandiset_path, bids_dataset_description=bidsdd)
-            # Don't use isinstance() here, as GenericBIDSAsset's should still
-            # be returned
-            if type(df) is GenericAsset and not allow_all:
-                pass
-            elif isinstance(df, DandisetMetadataFile) and not (
-                allow_all or include_metadata
-            ):
-                pass
-            else:
-                yield df
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _scandir(path: Path) -> list[os.DirEntry[str]]:
+    """
+    Return the entries of the directory at ``path`` with the types of the
+    entries (whether they are directories and/or symlinks) already obtained
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    for e in entries:
+        # `DirEntry` caches the results, which only require a system call if
+        # the type of the entry is not reported by the scan
+        e.is_symlink()
+        e.is_dir()
+    return entries
+
+
+def _has_bids_dataset_description(entries: list[os.DirEntry[str]]) -> bool:
+    return any(e.name == BIDS_DATASET_DESCRIPTION for e in entries)
 
 
 def dandi_file(
@@ -188,17 +283,25 @@ def dandi_file(
     if dandiset_path is not None:
         dandiset_path = Path(dandiset_path)
         path = filepath.relative_to(dandiset_path).as_posix()
-        if path == ".":
-            raise ValueError("DANDI file path cannot equal Dandiset path")
     else:
         path = filepath.name
-    if filepath.is_file() and path == dandiset_metadata_file:
-        return DandisetMetadataFile(filepath=filepath, dandiset_path=dandiset_path)
-    if bids_dataset_description is None:
+    return _dandi_file(
+        _QueueItem(filepath, path, filepath, bids_dataset_description, None),
+        dandiset_path,
+    )
+
+
+def _dandi_file(item: _QueueItem, dandiset_path: Path | None) -> DandiFile:
+    if item.path == ".":
+        raise ValueError("DANDI file path cannot equal Dandiset path")
+    is_dir = item.info.is_dir()
+    if not is_dir and item.path == dandiset_metadata_file and item.info.is_file():
+        return DandisetMetadataFile(filepath=item.filepath, dandiset_path=dandiset_path)
+    if item.bids_dataset_description is None:
         factory = DandiFileFactory()
     else:
-        factory = BIDSFileFactory(bids_dataset_description)
-    return factory(filepath, path, dandiset_path)
+        factory = BIDSFileFactory(item.bids_dataset_description)
+    return factory(item.filepath, item.path, dandiset_path, is_dir=is_dir)
 
 
 def find_bids_dataset_description(
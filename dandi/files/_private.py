@@ -35,8 +35,8 @@ class DandiFileType(Enum):
     BIDS_DATASET_DESCRIPTION = 5
 
     @staticmethod
-    def classify(path: Path) -> DandiFileType:
-        if path.is_dir():
+    def classify(path: Path, is_dir: bool | None = None) -> DandiFileType:
+        if path.is_dir() if is_dir is None else is_dir:
             if path.suffix in ZARR_EXTENSIONS:
                 if is_empty_zarr(path):
                     raise UnknownAssetError("Empty directories cannot be Zarr assets")
@@ -66,9 +66,13 @@ class DandiFileFactory:
     }
 
     def __call__(
-        self, filepath: Path, path: str, dandiset_path: Path | None
+        self,
+        filepath: Path,
+        path: str,
+        dandiset_path: Path | None,
+        is_dir: bool | None = None,
     ) -> DandiFile:
-        return self.CLASSES[DandiFileType.classify(filepath)](
+        return self.CLASSES[DandiFileType.classify(filepath, is_dir)](
             filepath=filepath, path=path, dandiset_path=dandiset_path
         )
 
@@ -87,9 +91,13 @@ class BIDSFileFactory(DandiFileFactory):
     }
 
     def __call__(
-        self, filepath: Path, path: str, dandiset_path: Path | None
+        self,
+        filepath: Path,
+        path: str,
+        dandiset_path: Path | None,
+        is_dir: bool | None = None,
     ) -> DandiFile:
-        ftype = DandiFileType.classify(filepath)
+        ftype = DandiFileType.classify(filepath, is_dir)
         if ftype is DandiFileType.BIDS_DATASET_DESCRIPTION:
             if filepath == self.bids_dataset_description.filepath:
                 return self.bids_dataset_description
@@ -4,13 +4,14 @@ from abc import ABC, abstractmethod
 from collections import deque
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
 import os
 from pathlib import Path
 import re
 from threading import Lock
-from typing import IO, Any, Generic
+from typing import IO, TYPE_CHECKING, Any, Generic
 from xml.etree.ElementTree import fromstring
 
 import dandischema
@@ -34,6 +35,7 @@ from dandi.dandiapi import (
 from dandi.metadata.core import get_default_metadata
 from dandi.misctypes import DUMMY_DANDI_ETAG, Digest, LocalReadableFile, P
 from dandi.utils import post_upload_size_check, pre_upload_size_check, yaml_load
+from dandi.validate._store import file_fingerprint, stored_validation
 from dandi.validate._types import (
     ORIGIN_INTERNAL_DANDI,
     ORIGIN_VALIDATION_DANDI,
@@ -47,6 +49,10 @@ from dandi.validate._types import (
     Validator,
 )
 
+if TYPE_CHECKING:
+    from dandi.metadata.service import MetadataService
+    from dandi.pynwb_utils import NWBMetadataSession
+
 lgr = dandi.get_logger()
 
 # TODO -- should come from schema.  This is just a simplistic example for now
@@ -414,64 +420,64 @@ class LocalFileAsset(LocalAsset):
                 parts_out = []
                 bytes_uploaded = 0
                 lgr.debug("Uploading %s in %d parts", self.filepath, len(parts))
-                with RESTFullAPIClient("http://nil.nil") as storage:
-                    with self.filepath.open("rb") as fp:
-                        with ThreadPoolExecutor(max_workers=jobs or 5) as executor:
-                            lock = Lock()
-                            futures = [
-                                executor.submit(
-                                    _upload_blob_part,
-                                    storage_session=storage,
-                                    fp=fp,
-                                    lock=lock,
-                                    etagger=etagger,
-                                    asset_path=asset_path,
-                                    part=part,
-                                )
-                                for part in parts
-                            ]
-                            for fut in as_completed(futures):
-                                out_part = fut.result()
-                                bytes_uploaded += out_part["size"]
-                                yield {
-                                    "status": "uploading",
-                                    "progress": 100 * bytes_uploaded / total_size,
-                                    "current": bytes_uploaded,
-                                }
-                                parts_out.append(out_part)
-                    lgr.debug("%s: Completing upload", asset_path)
-                    resp = client.post(
-                        f"/uploads/{upload_id}/complete/",
-                        json={"parts": parts_out},
-                    )
-                    lgr.debug(
-                        "%s: Announcing completion to %s",
-                        asset_path,
-                        resp["complete_url"],
-                    )
-                    r = storage.post(
-                        resp["complete_url"], data=resp["body"], json_resp=False
-                    )
-                    lgr.debug(
-                        "%s: Upload completed. Response content: %s",
-                        asset_path,
-                        r.content,
-                    )
-                    rxml = fromstring(r.text)
-                    m = re.match(r"\{.+?\}", rxml.tag)
-                    ns = m.group(0) if m else ""
-                    final_etag = rxml.findtext(f"{ns}ETag")
-                    if final_etag is not None:
-                        final_etag = final_etag.strip('"')
-                        if final_etag != filetag:
-                            raise RuntimeError(
-                                "Server and client disagree on final ETag of"
-                                f" uploaded file; server says {final_etag},"
-                                f" client says {filetag}"
+                storage = client.storage
+                with self.filepath.open("rb") as fp:
+                    with ThreadPoolExecutor(max_workers=jobs or 5) as executor:
+                        lock = Lock()
+                        futures = [
+                            executor.submit(
+                                _upload_blob_part,
+                                storage_session=storage,
+                                fp=fp,
+                                lock=lock,
+                                etagger=etagger,
+                                asset_path=asset_path,
+                                part=part,
                             )
-                    # else: Error? Warning?
-                    resp = client.post(f"/uploads/{upload_id}/validate/")
-                    blob_id = resp["blob_id"]
+                            for part in parts
+                        ]
+                        for fut in as_completed(futures):
+                            out_part = fut.result()
+                            bytes_uploaded += out_part["size"]
+                            yield {
+                                "status": "uploading",
+                                "progress": 100 * bytes_uploaded / total_size,
+                                "current": bytes_uploaded,
+                            }
+                            parts_out.append(out_part)
+                lgr.debug("%s: Completing upload", asset_path)
+                resp = client.post(
+                    f"/uploads/{upload_id}/complete/",
+                    json={"parts": parts_out},
+                )
+                lgr.debug(
+                    "%s: Announcing completion to %s",
+                    asset_path,
+                    resp["complete_url"],
+                )
+                r = storage.post(
+                    resp["complete_url"], data=resp["body"], json_resp=False
+                )
+                lgr.debug(
+                    "%s: Upload completed. Response content: %s",
+                    asset_path,
+                    r.content,
+                )
+                rxml = fromstring(r.text)
+                m = re.match(r"\{.+?\}", rxml.tag)
+                ns = m.group(0) if m else ""
+                final_etag = rxml.findtext(f"{ns}ETag")
+                if final_etag is not None:
+                    final_etag = final_etag.strip('"')
+                    if final_etag != filetag:
+                        raise RuntimeError(
+                            "Server and client disagree on final ETag of"
+                            f" uploaded file; server says {final_etag},"
+                            f" client says {filetag}"
+                        )
+                # else: Error? Warning?
+                resp = client.post(f"/uploads/{upload_id}/validate/")
+                blob_id = resp["blob_id"]
             except Exception:
                 post_upload_size_check(self.filepath, total_size, True)
                 raise
@@ -510,12 +516,22 @@ class NWBAsset(LocalFileAsset):
         self,
         digest: Digest | None = None,
         ignore_errors: bool = True,
+        metadata_service: MetadataService | None = None,
     ) -> BareAsset:
+        """
+        If ``metadata_service`` is given, the metadata is extracted in one of
+        its worker processes.
+        """
         # Avoid heavy import by importing within function:
         from dandi.metadata.nwb import nwb2asset
 
         try:
-            metadata = nwb2asset(self.filepath, digest=digest)
+            if metadata_service is not None:
+                metadata = metadata_service.nwb2asset(
+                    self.filepath, digest=digest
+                ).result()
+            else:
+                metadata = nwb2asset(self.filepath, digest=digest)
         except Exception as e:
             lgr.warning(
                 "Failed to extract NWB metadata from %s: %s: %s",
@@ -530,7 +546,7 @@ class NWBAsset(LocalFileAsset):
         metadata.path = self.path
         return metadata
 
-    # TODO: @validate_cache.memoize_path
+    @stored_validation(file_fingerprint)
     def get_validation_errors(
         self,
         schema_version: str | None = None,
@@ -555,62 +571,71 @@ class NWBAsset(LocalFileAsset):
             pass
         else:
             # Avoid heavy import by importing within function:
-            from nwbinspector import Importance, inspect_nwbfile, load_config
-
-            # Avoid heavy import by importing within function:
+            from dandi.pynwb_utils import NWBMetadataSession
             from dandi.pynwb_utils import validate as pynwb_validate
 
-            errors.extend(pynwb_validate(self.filepath, devel_debug=devel_debug))
             if schema_version is not None:
+                errors.extend(pynwb_validate(self.filepath, devel_debug=devel_debug))
                 errors.extend(
                     super().get_validation_errors(
                         schema_version=schema_version, devel_debug=devel_debug
                     )
                 )
             else:
-                # make sure that we have some basic metadata fields we require
-                try:
-                    origin_validation_nwbinspector = Origin(
-                        type=OriginType.VALIDATION,
-                        validator=Validator.nwbinspector,
-                        validator_version=str(_get_nwb_inspector_version()),
+                # Open the file once for both PyNWB's validation and the
+                # nwbinspector checks, which inspect the NWBFile loaded from
+                # the data that PyNWB validated
+                with ExitStack() as stack:
+                    session: NWBMetadataSession | None
+                    try:
+                        session = stack.enter_context(NWBMetadataSession(self.filepath))
+                    except Exception:
+                        # Report the failure to open the file via the
+                        # validators
+                        session = None
+                    errors.extend(
+                        pynwb_validate(
+                            self.filepath, devel_debug=devel_debug, session=session
+                        )
                     )
+                    # make sure that we have some basic metadata fields we require
+                    try:
+                        origin_validation_nwbinspector = Origin(
+                            type=OriginType.VALIDATION,
+                            validator=Validator.nwbinspector,
+                            validator_version=str(_get_nwb_inspector_version()),
+                        )
 
-                    for error in inspect_nwbfile(
-                        nwbfile_path=self.filepath,
-                        skip_validate=True,
-                        config=load_config(filepath_or_keyword="dandi"),
-                        importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
-                    ):
-                        severity = NWBI_IMPORTANCE_TO_DANDI_SEVERITY[
-                            error.importance.name
-                        ]
-                        kw: Any = {}
-                        if error.location:
-                            kw["within_asset_paths"] = {
-                                error.file_path: error.location,
-                            }
-                        errors.append(
-                            ValidationResult(
-                                origin=origin_validation_nwbinspector,
-                                severity=severity,
-                                id=f"NWBI.{error.check_function_name}",
-                                scope=Scope.FILE,
-                                origin_result=error,
-                                path=Path(error.file_path),
-                                message=error.message,
-                                dataset_path=Path(error.file_path).parent.parent,
-                                dandiset_path=Path(error.file_path).parent,
-                                **kw,
+                        for error in _inspect_nwbfile(self.filepath, session):
+                            severity = NWBI_IMPORTANCE_TO_DANDI_SEVERITY[
+                                error.importance.name
+                            ]
+                            kw: Any = {}
+                            if error.location:
+                                kw["within_asset_paths"] = {
+                                    error.file_path: error.location,
+                                }
+                            errors.append(
+                                ValidationResult(
+                                    origin=origin_validation_nwbinspector,
+                                    severity=severity,
+                                    id=f"NWBI.{error.check_function_name}",
+                                    scope=Scope.FILE,
+                                    origin_result=error,
+                                    path=Path(error.file_path),
+                                    message=error.message,
+                                    dataset_path=Path(error.file_path).parent.parent,
+                                    dandiset_path=Path(error.file_path).parent,
+                                    **kw,
+                                )
                             )
+                    except Exception as e:
+                        if devel_debug:
+                            raise
+                        # TODO: might reraise instead of making it into an error
+                        return _pydantic_errors_to_validation_results(
+                            [e], self.filepath, scope=Scope.FILE
                         )
-                except Exception as e:
-                    if devel_debug:
-                        raise
-                    # TODO: might reraise instead of making it into an error
-                    return _pydantic_errors_to_validation_results(
-                        [e], self.filepath, scope=Scope.FILE
-                    )
 
         # Avoid circular imports by importing within function:
         from .bids import NWBBIDSAsset
@@ -798,6 +823,64 @@ def _get_nwb_inspector_version():
     return _current_nwbinspector_version
 
 
+# The nwbinspector checks as configured for DANDI, loaded once per process
+_nwbinspector_checks: list | None = None
+
+
+def _get_nwbinspector_checks() -> list:
+    # Avoid heavy import by importing within function:
+    from nwbinspector import Importance, configure_checks, load_config
+
+    global _nwbinspector_checks
+    if _nwbinspector_checks is None:
+        _nwbinspector_checks = configure_checks(
+            config=load_config(filepath_or_keyword="dandi"),
+            importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+        )
+    return _nwbinspector_checks
+
+
+def _inspect_nwbfile(filepath: Path, session: NWBMetadataSession | None) -> list:
+    """
+    Run the nwbinspector checks configured for DANDI on an NWB file, on the
+    `pynwb.NWBFile` loaded by ``session`` if given and possible
+    """
+    # Avoid heavy import by importing within function:
+    from nwbinspector import Importance, inspect_nwbfile, inspect_nwbfile_object
+
+    checks = _get_nwbinspector_checks()
+    if session is not None:
+        try:
+            messages = list(
+                inspect_nwbfile_object(
+                    nwbfile_object=session.read_nwb(),
+                    checks=checks,
+                    importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+                )
+            )
+        except Exception as e:
+            # Let nwbinspector load the file itself below, reporting any
+            # failure to do so in its own way
+            lgr.debug(
+                "Failed to inspect %s as loaded for validation: %s: %s",
+                filepath,
+                type(e).__name__,
+                e,
+            )
+        else:
+            for m in messages:
+                m.file_path = str(filepath)
+            return messages
+    return list(
+        inspect_nwbfile(
+            nwbfile_path=filepath,
+            skip_validate=True,
+            checks=checks,
+            importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+        )
+    )
+
+
 def _pydantic_errors_to_validation_results(
     errors: list[dict | Exception] | ValidationError,
     file_path: Path,
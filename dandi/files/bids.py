@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Container
 from dataclasses import dataclass, field
 from datetime import datetime
+import json
+import os
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from threading import Lock
+from typing import TYPE_CHECKING
 import weakref
 
 from dandischema.models import BareAsset
 
+from dandi import get_logger
 from dandi.bids_validator_deno import bids_validate
 
 from .bases import GenericAsset, LocalFileAsset, NWBAsset
@@ -16,6 +22,8 @@ from .zarr import ZarrAsset
 from ..consts import ZARR_MIME_TYPE, dandiset_metadata_file
 from ..metadata.core import add_common_metadata, prepare_metadata
 from ..misctypes import Digest
+from ..utils import find_parent_directory_containing
+from ..validate._store import ValidationStore, tree_fingerprint
 from ..validate._types import (
     ORIGIN_VALIDATION_DANDI_LAYOUT,
     MissingFileContent,
@@ -24,9 +32,18 @@ from ..validate._types import (
     ValidationResult,
 )
 
+if TYPE_CHECKING:
+    from ..metadata.service import MetadataService
+
+lgr = get_logger()
+
 BIDS_ASSET_ERRORS = ("BIDS.NON_BIDS_PATH_PLACEHOLDER",)
 BIDS_DATASET_ERRORS = ("BIDS.MANDATORY_FILE_MISSING_PLACEHOLDER",)
 
+#: Directories of a BIDS dataset that the BIDS validator does not validate
+#: (without ``--recursive``) and so are left out of partial validations
+_UNVALIDATED_DIRS = ("derivatives", "sourcedata")
+
 
 @dataclass
 class BIDSDatasetDescriptionAsset(LocalFileAsset):
@@ -116,44 +133,26 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
         with self._lock:
             if self._dataset_errors is None:
 
-                # Obtain BIDS validation results of the entire dataset through the
-                # deno-compiled BIDS validator
-                v_results = bids_validate(self.bids_root)
-
-                # Validation results from the deno BIDS validator with an additional
-                # hint, represented as a `ValidationResult` object, following
-                # each `dandiset.yaml` error, suggesting to add the `dandiset.yaml` file
-                # to `.bidsignore`.
-                v_results_extended: list[ValidationResult] = []
-
-                for result in v_results:
-                    v_results_extended.append(result)
-                    if (
-                        result.path is not None
-                        and result.dataset_path is not None
-                        and result.path.relative_to(result.dataset_path).as_posix()
-                        == dandiset_metadata_file
-                    ):
-                        hint = ValidationResult(
-                            id="DANDI.BIDSIGNORE_DANDISET_YAML",
-                            origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
-                            scope=Scope.DATASET,
-                            origin_result=result,
-                            severity=Severity.HINT,
-                            dandiset_path=result.dandiset_path,
-                            dataset_path=result.dataset_path,
-                            path=result.path,
-                            message=(
-                                f"Consider creating or updating a `.bidsignore` file "
-                                f"in the root of your BIDS dataset to ignore "
-                                f"`{dandiset_metadata_file}`. "
-                                f"Add the following line to `.bidsignore`:\n"
-                                f"{dandiset_metadata_file}"
-                            ),
+                # The results for the dataset as of its last validation are
+                # reused if no file in it has changed since, and otherwise
+                # only the subjects & sessions with changed files are
+                # validated anew where possible
+                store = ValidationStore.for_dandiset(self.dandiset_path)
+                fingerprints = (
+                    _unit_fingerprints(self.bids_root) if store is not None else None
+                )
+                if store is None or fingerprints is None:
+                    self._dataset_errors = self._run_bids_validator()
+                else:
+                    fingerprint = json.dumps(fingerprints, sort_keys=True)
+                    stored = store.get(self.filepath, "BIDSDataset", fingerprint)
+                    if stored is None:
+                        stored = self._revalidate(
+                            store.get_previous(self.filepath, "BIDSDataset"),
+                            fingerprints,
                         )
-                        v_results_extended.append(hint)
-
-                self._dataset_errors = v_results_extended
+                        store.set(self.filepath, "BIDSDataset", fingerprint, stored)
+                    self._dataset_errors = stored
 
                 # Categorized validation results related to individual assets by the
                 # path of the asset in the BIDS dataset
@@ -169,6 +168,128 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
                     bids_version = self._dataset_errors[0].origin.standard_version
                     self._bids_version = bids_version
 
+    def _revalidate(
+        self,
+        previous: tuple[str, list[ValidationResult]] | None,
+        fingerprints: dict[str, str],
+    ) -> list[ValidationResult]:
+        """
+        Validate the dataset anew, given its fingerprints (see
+        `_unit_fingerprints()`) and those as of its ``previous`` validation
+        along with the results thereof.
+
+        If neither the set of subjects & sessions nor any file outside of them
+        has changed since, only the subjects & sessions with changed files are
+        validated, by running the BIDS validator on a copy of the dataset
+        consisting of symlinks to those & to the top-level files, and their
+        results replace the previous ones.  Results pertaining to the dataset
+        as a whole are retained from the previous validation in that case.
+        Otherwise, the whole dataset is validated.
+        """
+        changed: set[str] | None = None
+        if previous is not None:
+            try:
+                old_fingerprints = json.loads(previous[0])
+            except ValueError:
+                old_fingerprints = None
+            if isinstance(old_fingerprints, dict):
+                changed = _changed_units(old_fingerprints, fingerprints)
+        if not changed:
+            return self._run_bids_validator()
+        assert previous is not None
+        lgr.debug(
+            "Validating %d changed subjects/sessions of BIDS dataset at %s anew",
+            len(changed),
+            self.bids_root,
+        )
+        with TemporaryDirectory(prefix="dandi-bids-") as tmpdir:
+            view = Path(tmpdir).resolve()
+            _link_tree(
+                self.bids_root,
+                view,
+                exclude=[u for u in fingerprints if u and "/" not in u]
+                + list(_UNVALIDATED_DIRS),
+            )
+            for sub in sorted({u.split("/")[0] for u in changed}):
+                _link_tree(
+                    self.bids_root / sub,
+                    view / sub,
+                    exclude=[
+                        u.split("/")[1] for u in fingerprints if u.startswith(sub + "/")
+                    ],
+                )
+            for unit in sorted(changed):
+                if "/" in unit:
+                    _link_tree(self.bids_root / unit, view / unit)
+            new_results = self._run_bids_validator(view)
+        if any(r.id == "BIDS.VALIDATOR_ERROR" for r in new_results):
+            return self._run_bids_validator()
+
+        # The paths in results of a whole-dataset validation are resolved
+        root = self.bids_root.resolve()
+        dandiset_path = find_parent_directory_containing(dandiset_metadata_file, root)
+        results = [
+            r
+            for r in previous[1]
+            if r.path is None
+            or _unit_of(_relpath(r.path, root), fingerprints) not in changed
+        ]
+        for r in new_results:
+            if r.path is None:
+                continue
+            rel = _relpath(r.path, view)
+            if _unit_of(rel, fingerprints) in changed:
+                results.append(
+                    r.model_copy(
+                        update={
+                            "path": root / rel,
+                            "dataset_path": root,
+                            "dandiset_path": dandiset_path,
+                        }
+                    )
+                )
+        return results
+
+    def _run_bids_validator(self, path: Path | None = None) -> list[ValidationResult]:
+        # Obtain BIDS validation results of the entire dataset (or of the
+        # partial copy thereof at `path`) through the deno-compiled BIDS
+        # validator
+        v_results = bids_validate(self.bids_root if path is None else path)
+
+        # Validation results from the deno BIDS validator with an additional
+        # hint, represented as a `ValidationResult` object, following
+        # each `dandiset.yaml` error, suggesting to add the `dandiset.yaml` file
+        # to `.bidsignore`.
+        v_results_extended: list[ValidationResult] = []
+
+        for result in v_results:
+            v_results_extended.append(result)
+            if (
+                result.path is not None
+                and result.dataset_path is not None
+                and result.path.relative_to(result.dataset_path).as_posix()
+                == dandiset_metadata_file
+            ):
+                hint = ValidationResult(
+                    id="DANDI.BIDSIGNORE_DANDISET_YAML",
+                    origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                    scope=Scope.DATASET,
+                    origin_result=result,
+                    severity=Severity.HINT,
+                    dandiset_path=result.dandiset_path,
+                    dataset_path=result.dataset_path,
+                    path=result.path,
+                    message=(
+                        f"Consider creating or updating a `.bidsignore` file "
+                        f"in the root of your BIDS dataset to ignore "
+                        f"`{dandiset_metadata_file}`. "
+                        f"Add the following line to `.bidsignore`:\n"
+                        f"{dandiset_metadata_file}"
+                    ),
+                )
+                v_results_extended.append(hint)
+        return v_results_extended
+
     def get_asset_errors(self, asset: BIDSAsset) -> list[ValidationResult]:
         """:meta private:"""
         self._validate()
@@ -197,6 +318,104 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
     # get_metadata(): inherit use of default metadata from LocalFileAsset
 
 
+def _unit_fingerprints(bids_root: Path) -> dict[str, str] | None:
+    """
+    Return fingerprints (see `tree_fingerprint()`) of the parts of the BIDS
+    dataset at ``bids_root`` that can be validated separately, keyed by their
+    ``/``-separated paths from ``bids_root``: each session directory, each
+    subject directory (sans its session directories), and, under the key
+    ``""``, the rest of the dataset.  Returns `None` if the dataset cannot be
+    walked.
+    """
+    units: dict[str, tuple[Path, list[str]]] = {}
+    try:
+        subjects = _subdirs(bids_root, "sub-")
+        units[""] = (bids_root, subjects)
+        for sub in subjects:
+            sessions = _subdirs(bids_root / sub, "ses-")
+            units[sub] = (bids_root / sub, sessions)
+            for ses in sessions:
+                units[f"{sub}/{ses}"] = (bids_root / sub / ses, [])
+    except OSError:
+        return None
+    fingerprints: dict[str, str] = {}
+    for unit, (path, exclude) in units.items():
+        fp = tree_fingerprint(path, exclude=exclude)
+        if fp is None:
+            return None
+        fingerprints[unit] = fp
+    return fingerprints
+
+
+def _subdirs(path: Path, prefix: str) -> list[str]:
+    with os.scandir(path) as entries:
+        return sorted(
+            e.name for e in entries if e.name.startswith(prefix) and e.is_dir()
+        )
+
+
+def _changed_units(old: dict[str, str], new: dict[str, str]) -> set[str] | None:
+    """
+    Return the subjects & sessions (as keys of `_unit_fingerprints()`) that
+    need to be validated anew given the fingerprints ``old`` of a dataset as
+    of its last validation & its current fingerprints ``new``, or `None` if
+    the whole dataset needs to be validated anew
+    """
+    if old.keys() != new.keys() or old.get("") != new[""]:
+        return None
+    changed = {u for u in new if u and old[u] != new[u]}
+    # The files of a subject outside of its sessions (e.g., sidecars
+    # inherited by the files in them) pertain to all of its sessions
+    for u in list(changed):
+        if "/" not in u:
+            changed.update(v for v in new if v.startswith(u + "/"))
+    if len(changed) == len(new) - 1:
+        return None
+    return changed
+
+
+def _unit_of(relpath: str, units: Container[str]) -> str:
+    """
+    Return the subject or session (as a key of `_unit_fingerprints()`) to
+    which the ``/``-separated path ``relpath`` from the root of a BIDS
+    dataset belongs, or ``""`` if it belongs to neither
+    """
+    parts = relpath.split("/", 2)
+    if len(parts) > 1 and f"{parts[0]}/{parts[1]}" in units:
+        return f"{parts[0]}/{parts[1]}"
+    if parts[0] and parts[0] in units:
+        return parts[0]
+    return ""
+
+
+def _relpath(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return ""
+
+
+def _link_tree(src: Path, dest: Path, exclude: Container[str] = ()) -> None:
+    """
+    Recreate the directory tree at ``src`` (without the entries of ``src``
+    named in ``exclude``) at ``dest``, with symlinks in place of files &
+    symlinks
+    """
+    for dirpath, dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        if rel == ".":
+            dirnames[:] = [n for n in dirnames if n not in exclude]
+            filenames = [n for n in filenames if n not in exclude]
+        target = os.path.join(dest, rel)
+        os.makedirs(target, exist_ok=True)
+        for n in list(dirnames):
+            if os.path.islink(os.path.join(dirpath, n)):
+                dirnames.remove(n)
+                filenames.append(n)
+        for n in filenames:
+            os.symlink(os.path.join(dirpath, n), os.path.join(target, n))
+
+
 @dataclass
 class BIDSAsset(LocalFileAsset):
     """
@@ -282,9 +501,12 @@ class NWBBIDSAsset(BIDSAsset, NWBAsset):
         self,
         digest: Digest | None = None,
         ignore_errors: bool = True,
+        metadata_service: MetadataService | None = None,
     ) -> BareAsset:
         bids_metadata = BIDSAsset.get_metadata(self, digest, ignore_errors)
-        nwb_metadata = NWBAsset.get_metadata(self, digest, ignore_errors)
+        nwb_metadata = NWBAsset.get_metadata(
+            self, digest, ignore_errors, metadata_service=metadata_service
+        )
         return BareAsset(
             **{
                 **bids_metadata.model_dump(),
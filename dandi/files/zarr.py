@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from base64 import b64encode
-from collections import Counter
+from collections import Counter, deque
 from collections.abc import Generator, Iterator
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import closing
@@ -52,6 +52,7 @@ from dandi.utils import (
 )
 
 from .bases import LocalDirectoryAsset
+from ..validate._store import stored_validation, tree_fingerprint
 from ..validate._types import (
     ORIGIN_VALIDATION_DANDI_ZARR,
     MissingFileContent,
@@ -123,7 +124,97 @@ def get_zarr_format_version(path: Path) -> Optional[str]:
     return None
 
 
-def _ts_validate_zarr3(path: Path, devel_debug: bool = False) -> list[ValidationResult]:
+@dataclass
+class _ZarrTreeScan:
+    """
+    The results of a single walk over the file tree of a Zarr asset, which
+    feed the detection of its format, the check of its depth, and (for Zarr
+    format V3) the validation of its groups & arrays
+    """
+
+    #: The Zarr format version of the root, as returned by
+    #: `get_zarr_format_version()`
+    format_version: Optional[str] = None
+
+    #: Whether there are files more than `MAX_ZARR_DEPTH` directories deep
+    too_deep: bool = False
+
+    #: The paths of the ``zarr.json`` files outside of arrays, each paired
+    #: with its parsed content or with the error from parsing it
+    zarr3_metadata: list[tuple[Path, _Zarr3Metadata | ValidationError]] = field(
+        default_factory=list
+    )
+
+    @property
+    def zarr3_arrays(self) -> list[Path]:
+        """The paths of the Zarr format V3 arrays in the tree"""
+        return [
+            meta_path.parent
+            for meta_path, meta in self.zarr3_metadata
+            if isinstance(meta, _Zarr3Metadata) and meta.node_type == "array"
+        ]
+
+
+def _scan_zarr_tree(
+    path: Path, read_zarr3_metadata: bool | None = None
+) -> _ZarrTreeScan:
+    """
+    Walk the file tree of the Zarr at ``path`` once, skipping the files &
+    directories excluded by `exclude_from_zarr()`.
+
+    Each ``zarr.json`` file outside of arrays is read & parsed once if
+    ``read_zarr3_metadata`` is true or (if it is `None`) if the root is in
+    Zarr format V3.  Once a file too deep in the tree has been found, the
+    contents of arrays are not walked any further.
+    """
+    scan = _ZarrTreeScan()
+    if not path.is_dir():
+        return scan
+    # Directories to walk, with their depths & whether they are within arrays
+    dirs: deque[tuple[str, int, bool]] = deque([(str(path), 0, False)])
+    while dirs:
+        dirpath, depth, in_array = dirs.popleft()
+        if in_array and scan.too_deep:
+            continue
+        subdirs: list[str] = []
+        with os.scandir(dirpath) as entries:
+            for e in entries:
+                if exclude_from_zarr(Path(e.path)):
+                    continue
+                if e.is_dir():
+                    subdirs.append(e.path)
+                elif depth >= MAX_ZARR_DEPTH:
+                    scan.too_deep = True
+                elif depth == 0 and scan.format_version != "3":
+                    if e.name == "zarr.json" and e.is_file():
+                        scan.format_version = "3"
+                    elif e.name in (".zgroup", ".zarray") and e.is_file():
+                        scan.format_version = "2"
+        if depth == 0 and read_zarr3_metadata is None:
+            read_zarr3_metadata = scan.format_version == "3"
+        is_array = in_array
+        if read_zarr3_metadata and not in_array:
+            meta_path = Path(dirpath, "zarr.json")
+            if meta_path.is_file():
+                try:
+                    meta: _Zarr3Metadata | ValidationError = (
+                        _Zarr3Metadata.model_validate_json(meta_path.read_text())
+                    )
+                except ValidationError as e:
+                    meta = e
+                scan.zarr3_metadata.append((meta_path, meta))
+                is_array = (
+                    isinstance(meta, _Zarr3Metadata) and meta.node_type == "array"
+                )
+        if scan.too_deep and not read_zarr3_metadata:
+            break
+        dirs.extend((d, depth + 1, is_array) for d in subdirs)
+    return scan
+
+
+def _ts_validate_zarr3(
+    path: Path, devel_debug: bool = False, scan: _ZarrTreeScan | None = None
+) -> list[ValidationResult]:
     """
     Validate a Zarr format V3 LocalStore with the tensorstore package
 
@@ -133,6 +224,9 @@ def _ts_validate_zarr3(path: Path, devel_debug: bool = False) -> list[Validation
     devel_debug : bool
         If True, re-raise an exception instead of returning it packaged in a
         `ValidationResult` object
+    scan : _ZarrTreeScan, optional
+        The result of ``_scan_zarr_tree(path, read_zarr3_metadata=True)``, if
+        already obtained
 
     Returns
     -------
@@ -149,7 +243,7 @@ def _ts_validate_zarr3(path: Path, devel_debug: bool = False) -> list[Validation
     ----
         Since tensorstore does not support the concept of a Zarr group, this function
         validates a Zarr format V3 LocalStore by opening all the contained arrays with
-        tensorstore individually.
+        tensorstore individually (and concurrently).
 
         This function will no longer be needed once the upgrade to zarr-python 3.x is
         done and should be removed.
@@ -158,12 +252,15 @@ def _ts_validate_zarr3(path: Path, devel_debug: bool = False) -> list[Validation
     if not path.is_dir():
         raise ValueError(f"Path {path} is not a directory")
 
+    if scan is None:
+        scan = _scan_zarr_tree(path, read_zarr3_metadata=True)
+
     meta_fname = "zarr.json"
 
     results: list[ValidationResult] = []
 
     root_meta_path = path / meta_fname
-    if not root_meta_path.is_file():
+    if not any(meta_path == root_meta_path for meta_path, _ in scan.zarr3_metadata):
         # meta file doesn't exist in the LocalStore
         results.append(
             ValidationResult(
@@ -183,50 +280,43 @@ def _ts_validate_zarr3(path: Path, devel_debug: bool = False) -> list[Validation
             )
         )
 
-    for root, dirs, files in os.walk(path):
-        if meta_fname in files:
-            meta_path = Path(root) / meta_fname
-            meta_text = meta_path.read_text()
-            try:
-                meta = _Zarr3Metadata.model_validate_json(meta_text)
-            except ValidationError as e:
-                if devel_debug:
-                    raise
-                results.append(
-                    ValidationResult(
-                        id="zarr.invalid_zarr_json",
-                        origin=Origin(
-                            type=OriginType.VALIDATION,
-                            validator=Validator.dandi_zarr,
-                            validator_version=dandi_version,
-                            standard=Standard.ZARR,
-                            standard_version="3",
-                        ),
-                        scope=Scope.FILE,
-                        origin_result=e,
-                        severity=Severity.ERROR,
-                        message="Invalid zarr.json file",
-                        path=meta_path,
-                    )
+    for meta_path, meta in scan.zarr3_metadata:
+        if isinstance(meta, ValidationError):
+            if devel_debug:
+                raise meta
+            results.append(
+                ValidationResult(
+                    id="zarr.invalid_zarr_json",
+                    origin=Origin(
+                        type=OriginType.VALIDATION,
+                        validator=Validator.dandi_zarr,
+                        validator_version=dandi_version,
+                        standard=Standard.ZARR,
+                        standard_version="3",
+                    ),
+                    scope=Scope.FILE,
+                    origin_result=meta,
+                    severity=Severity.ERROR,
+                    message="Invalid zarr.json file",
+                    path=meta_path,
                 )
-            else:
-                # Check if the directory is a Zarr array
-                if meta.node_type == "array":
-                    results.extend(_ts_validate_zarr3_array(Path(root), devel_debug))
-                    dirs.clear()  # Skip subdirectories
+            )
 
+    results.extend(_ts_validate_zarr3_arrays(scan.zarr3_arrays, devel_debug))
     return results
 
 
-def _ts_validate_zarr3_array(
-    path: Path, devel_debug: bool = False
+def _ts_validate_zarr3_arrays(
+    paths: list[Path], devel_debug: bool = False
 ) -> list[ValidationResult]:
     """
-    Validate a Zarr format V3 array in a LocalStore with the tensorstore package
+    Validate Zarr format V3 arrays in a LocalStore with the tensorstore package
+
+    The arrays are opened concurrently, by tensorstore's own thread pool.
 
     Parameters
     ----------
-    path : The path to the Zarr format V3 array in the filesystem
+    paths : The paths to the Zarr format V3 arrays in the filesystem
     devel_debug : bool
         If True, re-raise an exception instead of returning it packaged in a
         `ValidationResult` object
@@ -234,7 +324,8 @@ def _ts_validate_zarr3_array(
     Returns
     -------
     list[ValidationResult]
-        A list of validation results representing validation errors encountered
+        A list of validation results representing validation errors encountered,
+        in the order of ``paths``
 
     Note
     ----
@@ -248,31 +339,41 @@ def _ts_validate_zarr3_array(
 
     results: list[ValidationResult] = []
 
-    # TensorStore spec describing where and how to read the Zarr array
-    spec = {"driver": "zarr3", "kvstore": {"driver": "file", "path": str(path)}}
-
-    try:
-        ts.open(spec, read=True, write=False).result()
-    except Exception as e:
-        if devel_debug:
-            raise
-        results.append(
-            ValidationResult(
-                id="zarr.tensorstore_cannot_open",
-                origin=Origin(
-                    type=OriginType.INTERNAL,
-                    validator=Validator.tensorstore,
-                    validator_version=version("tensorstore"),
-                    standard=Standard.ZARR,
-                    standard_version="3",
-                ),
-                scope=Scope.FILE,
-                origin_result=e,
-                severity=Severity.ERROR,
-                message="Error opening Zarr array with tensorstore",
-                path=path,
+    # Start opening all arrays before waiting for any of them:
+    opened: list[tuple[Path, Any]] = []
+    for path in paths:
+        # TensorStore spec describing where and how to read the Zarr array
+        spec = {"driver": "zarr3", "kvstore": {"driver": "file", "path": str(path)}}
+        try:
+            opened.append((path, ts.open(spec, read=True, write=False)))
+        except Exception as e:
+            opened.append((path, e))
+
+    for path, future in opened:
+        try:
+            if isinstance(future, Exception):
+                raise future
+            future.result()
+        except Exception as e:
+            if devel_debug:
+                raise
+            results.append(
+                ValidationResult(
+                    id="zarr.tensorstore_cannot_open",
+                    origin=Origin(
+                        type=OriginType.INTERNAL,
+                        validator=Validator.tensorstore,
+                        validator_version=version("tensorstore"),
+                        standard=Standard.ZARR,
+                        standard_version="3",
+                    ),
+                    scope=Scope.FILE,
+                    origin_result=e,
+                    severity=Severity.ERROR,
+                    message="Error opening Zarr array with tensorstore",
+                    path=path,
+                )
             )
-        )
 
     return results
 
@@ -464,6 +565,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         metadata.path = self.path
         return metadata
 
+    @stored_validation(tree_fingerprint)
     def get_validation_errors(
         self,
         schema_version: str | None = None,
@@ -488,9 +590,13 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         # root metadata, bad child metadata), which would cause us to miss
         # the `_ts_validate_zarr3` path. Detecting the format up front keeps
         # the validation behaviour consistent across versions.
-        format_version = get_zarr_format_version(self.filepath)
+        #
+        # The format, the depth of the tree, and the metadata of V3 stores are
+        # all obtained from a single walk of the tree.
+        scan = _scan_zarr_tree(self.filepath)
+        format_version = scan.format_version
         if format_version == "3":
-            errors.extend(_ts_validate_zarr3(self.filepath, devel_debug))
+            errors.extend(_ts_validate_zarr3(self.filepath, devel_debug, scan))
             data = None
         else:
             try:
@@ -526,7 +632,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
                         message="Zarr group is empty.",
                     )
                 )
-        if self._is_too_deep():
+        if scan.too_deep:
             msg = f"Zarr directory tree more than {MAX_ZARR_DEPTH} directories deep"
             if devel_debug:
                 raise ValueError(msg)
@@ -547,10 +653,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         )
 
     def _is_too_deep(self) -> bool:
-        for e in self.iterfiles():
-            if len(e.parts) >= MAX_ZARR_DEPTH + 1:
-                return True
-        return False
+        return _scan_zarr_tree(self.filepath, read_zarr3_metadata=False).too_deep
 
     def iter_upload(
         self,
@@ -737,10 +840,8 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
             yield {"status": "initiating upload", "size": total_size}
             lgr.debug("%s: Beginning upload", asset_path)
             changed = False
-            with (
-                RESTFullAPIClient("http://nil.nil") as storage,
-                closing(to_upload.get_items()) as upload_items,
-            ):
+            storage = client.storage
+            with closing(to_upload.get_items()) as upload_items:
                 bytes_uploaded = 0
                 for i, items in enumerate(
                     chunked(upload_items, ZARR_UPLOAD_BATCH_SIZE), start=1
@@ -3,7 +3,6 @@ from __future__ import annotations
 from datetime import datetime
 import os.path
 from pathlib import Path
-import re
 from typing import Any
 
 from dandischema import models
@@ -15,12 +14,10 @@ from ..consts import metadata_all_fields
 from ..files import bids, dandi_file, find_bids_dataset_description
 from ..misctypes import DUMMY_DANDI_ETAG, Digest, LocalReadableFile, Readable
 from ..pynwb_utils import (
-    _get_pynwb_metadata,
-    get_neurodata_types,
-    get_nwb_version,
+    NWBMetadataSession,
     ignore_benign_pynwb_warnings,
     metadata_cache,
-    nwb_has_external_links,
+    metadata_content_cache,
 )
 from ..utils import find_parent_directory_containing
 
@@ -67,9 +64,7 @@ def get_metadata(
                 bids_dataset_description=bids_dataset_description,
             )
             assert isinstance(df, bids.BIDSAsset)
-            if not digest:
-                digest = DUMMY_DANDI_ETAG
-            path_metadata = df.get_metadata(digest=digest)
+            path_metadata = df.get_metadata(digest=digest or DUMMY_DANDI_ETAG)
             meta["bids_version"] = df.get_validation_bids_version()
             # there might be a more elegant way to do this:
             if path_metadata.wasAttributedTo:
@@ -83,50 +78,7 @@ def get_metadata(
                         meta[key] = value
 
     if r.get_filename().endswith((".NWB", ".nwb")):
-        if nwb_has_external_links(r):
-            raise NotImplementedError(
-                f"NWB files with external links are not supported: {r}"
-            )
-
-        # First read out possibly available versions of specifications for NWB(:N)
-        meta["nwb_version"] = get_nwb_version(r)
-
-        # PyNWB might fail to load because of missing extensions.
-        # There is a new initiative of establishing registry of such extensions.
-        # Not yet sure if PyNWB is going to provide "native" support for needed
-        # functionality: https://github.com/NeurodataWithoutBorders/pynwb/issues/1143
-        # So meanwhile, hard-coded workaround for data types we care about
-        ndtypes_registry = {
-            "AIBS_ecephys": "allensdk.brain_observatory.ecephys.nwb",
-            "ndx-labmetadata-abf": "ndx_dandi_icephys",
-        }
-        tried_imports = set()
-        while True:
-            try:
-                meta.update(_get_pynwb_metadata(r))
-                break
-            except KeyError as exc:  # ATM there is
-                lgr.debug("Failed to read %s: %s", r, exc)
-                res = re.match(r"^['\"\\]+(\S+). not a namespace", str(exc))
-                if not res:
-                    raise
-                ndtype = res.groups()[0]
-                if ndtype not in ndtypes_registry:
-                    raise ValueError(
-                        "We do not know which extension provides %s. "
-                        "Original exception was: %s. " % (ndtype, exc)
-                    )
-                import_mod = ndtypes_registry[ndtype]
-                lgr.debug("Importing %r which should provide %r", import_mod, ndtype)
-                if import_mod in tried_imports:
-                    raise RuntimeError(
-                        "We already tried importing %s to provide %s, but it seems it didn't help"
-                        % (import_mod, ndtype)
-                    )
-                tried_imports.add(import_mod)
-                __import__(import_mod)
-
-        meta["nd_types"] = get_neurodata_types(r)
+        meta.update(_get_nwb_metadata(r, digest))
     if not meta:
         raise RuntimeError(
             f"Unable to get metadata from non-BIDS, non-NWB asset: `{path}`."
@@ -134,6 +86,23 @@ def get_metadata(
     return meta
 
 
+def _get_nwb_metadata(r: Readable, digest: Digest | None = None) -> dict[str, Any]:
+    content_digest = metadata_content_cache.get_digest(r, digest)
+    if content_digest is not None:
+        try:
+            nwb_meta: dict[str, Any] = metadata_content_cache.get(content_digest)
+        except KeyError:
+            pass
+        else:
+            lgr.debug("Using cached metadata for %s", r)
+            return nwb_meta
+    with NWBMetadataSession(r) as session:
+        nwb_meta = session.get_metadata()
+    if content_digest is not None:
+        metadata_content_cache.set(content_digest, nwb_meta)
+    return nwb_meta
+
+
 def nwb2asset(
     nwb_path: str | Path | Readable,
     digest: Digest | None = None,
@@ -146,7 +115,7 @@ def nwb2asset(
                 f"Unsupported schema version: {schema_version}; expected {current_version}"
             )
     start_time = datetime.now().astimezone()
-    metadata = get_metadata(nwb_path)
+    metadata = get_metadata(nwb_path, digest)
     asset_md = prepare_metadata(metadata)
     process_ndtypes(asset_md, metadata["nd_types"])
     end_time = datetime.now().astimezone()
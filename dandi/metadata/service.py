@@ -0,0 +1,197 @@
+"""
+A pool of warm worker processes for extracting metadata from local and
+remote files.
+
+Extracting metadata from NWB files is CPU-bound (and so does not benefit from
+threads) and requires importing pynwb & hdmf and loading the NWB namespaces,
+which takes a while in every new process.  A `MetadataService` therefore
+keeps a pool of worker processes in which all of that has been done up front,
+and to which metadata extraction for any number of files can be submitted,
+with the results streamed back as they become available.
+
+Most code should use the process-wide service returned by
+`get_metadata_service()` rather than creating its own.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, TypeVar
+
+from dandischema import models
+
+from .. import get_logger
+from ..misctypes import Digest, Readable
+
+lgr = get_logger()
+
+T = TypeVar("T")
+
+PathLike = TypeVar("PathLike", bound="str | Path | Readable")
+
+
+def _init_worker() -> None:
+    """Import the heavy modules & load the NWB namespaces in a new worker"""
+    import pynwb
+
+    from . import nwb  # noqa: F401
+    from ..pynwb_utils import ignore_benign_pynwb_warnings
+
+    ignore_benign_pynwb_warnings()
+    pynwb.get_type_map()
+
+
+def _get_metadata(
+    path: str | Path | Readable, digest: Digest | None = None
+) -> dict | None:
+    from .nwb import get_metadata
+
+    metadata: dict | None = get_metadata(path, digest)
+    return metadata
+
+
+def _nwb2asset(
+    path: str | Path | Readable,
+    digest: Digest | None = None,
+    schema_version: str | None = None,
+) -> models.BareAsset:
+    from .nwb import nwb2asset
+
+    return nwb2asset(path, digest=digest, schema_version=schema_version)
+
+
+class _InlineExecutor(Executor):
+    """An `Executor` that runs everything synchronously upon submission"""
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        fut: Future[T] = Future()
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            fut.set_exception(e)
+        return fut
+
+
+class MetadataService:
+    """
+    A pool of worker processes, created on first use, with pynwb imported and
+    the NWB namespaces loaded, for extracting metadata from files
+
+    With ``jobs=1``, everything is run synchronously in the current process
+    instead (e.g., for debugging).
+    """
+
+    def __init__(self, jobs: int | None = None) -> None:
+        #: Number of worker processes
+        self.jobs = jobs or os.cpu_count() or 1
+        self._executor: Executor | None = None
+        self._lock = Lock()
+
+    def __enter__(self) -> MetadataService:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.jobs == 1:
+                    self._executor = _InlineExecutor()
+                else:
+                    lgr.debug(
+                        "Starting %d metadata extraction worker processes", self.jobs
+                    )
+                    # Forking a process with running threads (e.g., pyout's)
+                    # can deadlock, so always spawn fresh workers:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.jobs,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                    )
+            return self._executor
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """
+        Run ``fn(*args, **kwargs)`` in a worker process.  ``fn`` and its
+        arguments must be picklable.
+        """
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def get_metadata(
+        self, path: str | Path | Readable, digest: Digest | None = None
+    ) -> Future[dict | None]:
+        """Submit `dandi.metadata.nwb.get_metadata()` for ``path``"""
+        return self.submit(_get_metadata, path, digest)
+
+    def nwb2asset(
+        self,
+        path: str | Path | Readable,
+        digest: Digest | None = None,
+        schema_version: str | None = None,
+    ) -> Future[models.BareAsset]:
+        """Submit `dandi.metadata.nwb.nwb2asset()` for ``path``"""
+        return self.submit(_nwb2asset, path, digest, schema_version)
+
+    def iter_metadata(
+        self, paths: Iterable[PathLike]
+    ) -> Iterator[tuple[PathLike, dict | None | Exception]]:
+        """
+        Extract the "flatdata" metadata for each of ``paths`` and yield
+        ``(path, metadata)`` pairs in order of completion.  If extraction for
+        a path fails, the exception is yielded in place of its metadata.
+        """
+        futures = {self.get_metadata(p): p for p in paths}
+        for fut in as_completed(futures):
+            yield (futures[fut], _result_or_exception(fut))
+
+    def iter_assets(
+        self, paths_digests: Iterable[tuple[PathLike, Digest | None]]
+    ) -> Iterator[tuple[PathLike, models.BareAsset | Exception]]:
+        """
+        Extract the `~dandischema.models.BareAsset` metadata for each of the
+        given NWB files (paired with their digests) and yield ``(path,
+        metadata)`` pairs in order of completion.  If extraction for a path
+        fails, the exception is yielded in place of its metadata.
+        """
+        futures = {self.nwb2asset(p, digest): p for p, digest in paths_digests}
+        for fut in as_completed(futures):
+            yield (futures[fut], _result_or_exception(fut))
+
+
+def _result_or_exception(fut: Future[Any]) -> Any:
+    try:
+        return fut.result()
+    except Exception as e:
+        return e
+
+
+_service: MetadataService | None = None
+_service_lock = Lock()
+
+
+def get_metadata_service(jobs: int | None = None) -> MetadataService:
+    """
+    Return the process-wide `MetadataService`, creating it with ``jobs``
+    worker processes if it does not exist yet.  The service is shut down when
+    the process exits.
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = MetadataService(jobs)
+            atexit.register(_service.close)
+        return _service
@@ -341,30 +341,43 @@ class RemoteReadableAsset(Readable):
     #: :meta private:
     name: str
 
+    #: The ID of the asset's blob on the server, if known.  If it is set and
+    #: the block cache is enabled (see `dandi.support.block_cache`), the data
+    #: read by `.open()` is cached locally under this ID.
+    #:
+    #: .. versionadded:: 0.77.0
+    blob_id: str | None = None
+
     def open(self) -> IO[bytes]:
         # Optional dependency:
         import fsspec
 
         from aiohttp import ClientTimeout
 
-        # We need to call open() on the return value of fsspec.open() because
-        # otherwise the filehandle will only be opened when used to enter a
-        # context manager.
-        #
+        from .support.block_cache import BlockCache
+
         # Pass explicit timeouts to aiohttp to prevent indefinite hangs in
         # fsspec's sync() wrapper.  Without these, a stalled connection to S3
         # (or minio in tests) causes fsspec's background IO thread to block
         # forever, which in turn blocks the calling thread in
         # threading.Event.wait() — see https://github.com/fsspec/filesystem_spec/issues/1666
+        client_kwargs = {
+            "timeout": ClientTimeout(total=120, sock_read=60, sock_connect=30)
+        }
+        if self.blob_id is not None and (cache := BlockCache.from_environ()):
+            fs = fsspec.filesystem("http", client_kwargs=client_kwargs)
+
+            def fetch(start: int, end: int) -> bytes:
+                data: bytes = fs.cat_file(self.url, start=start, end=end)
+                return data
+
+            return cache.open(self.blob_id, self.size, fetch)
+        # We need to call open() on the return value of fsspec.open() because
+        # otherwise the filehandle will only be opened when used to enter a
+        # context manager.
         return cast(
             IO[bytes],
-            fsspec.open(
-                self.url,
-                mode="rb",
-                client_kwargs={
-                    "timeout": ClientTimeout(total=120, sock_read=60, sock_connect=30)
-                },
-            ).open(),
+            fsspec.open(self.url, mode="rb", client_kwargs=client_kwargs).open(),
         )
 
     def get_size(self) -> int:
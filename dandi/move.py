@@ -31,6 +31,7 @@ from .dandiset import Dandiset
 from .exceptions import NotFoundError
 from .files import DandisetMetadataFile, LocalAsset, find_dandi_files
 from .support import pyout as pyouts
+from .support.local_state import LocalState
 
 lgr = get_logger()
 
@@ -543,6 +544,8 @@ class LocalMover(LocalizedMover):
                 e,
             )
             raise
+        if (state := LocalState.for_dandiset(self.dandiset_path)) is not None:
+            state.rename(src, dest)
         # Remove residual empty directories up to subpath
         d = (self.dandiset_path / src).parent
         while d != (self.dandiset_path / self.subpath) and not any(d.iterdir()):
@@ -562,6 +565,8 @@ class LocalMover(LocalizedMover):
                 "Failed to delete local file %r: %s: %s", path, type(e).__name__, e
             )
             raise
+        if (state := LocalState.for_dandiset(self.dandiset_path)) is not None:
+            state.remove(path)
 
 
 @dataclass
@@ -22,6 +22,7 @@ from pathlib import Path, PurePosixPath
 import posixpath
 import re
 import traceback
+from typing import Any
 import uuid
 
 import ruamel.yaml
@@ -30,11 +31,10 @@ from . import get_logger
 from .consts import dandi_layout_fields
 from .dandiset import Dandiset
 from .exceptions import OrganizeImpossibleError
+from .support.local_state import LocalState
 from .utils import (
     AnyPath,
-    Parallel,
     copy_file,
-    delayed,
     ensure_datetime,
     find_files,
     flattened,
@@ -322,7 +322,13 @@ def _assign_obj_id(metadata, non_unique):
     for r in metadata:
         if r["dandi_path"] in non_unique:
             try:
-                object_id = get_object_id(r["path"])
+                # Extracted along with the rest of the metadata, if available
+                if "object_id" in r:
+                    object_id = r["object_id"]
+                    if object_id is None:
+                        raise KeyError("object_id")
+                else:
+                    object_id = get_object_id(r["path"])
             except KeyError:
                 raise OrganizeImpossibleError(
                     msg
@@ -859,36 +865,37 @@ def organize(
         # Doesn't play nice with Parallel
         # with tqdm.tqdm(desc="Files", total=len(paths), unit="file", unit_scale=False) as pbar:
 
-        def _get_metadata(path):
-            # Avoid heavy import by importing within function:
-            from .metadata.nwb import get_metadata
-
-            meta, exc = {}, None
-            try:
-                meta = get_metadata(path)
-            except Exception as e:
-                exc = (
-                    e.__class__,
-                    str(e),
-                    traceback.TracebackException.from_exception(e),
-                )
-            # pbar.update(1)
-            meta["path"] = path
-            return meta, exc
+        # Avoid heavy import by importing within function:
+        from .metadata.service import MetadataService, get_metadata_service
 
         if (
             not devel_debug and jobs != 1 and not len(paths) == 1
-        ):  # Do not use joblib at all if number_of_jobs=1
-            # Note: It is Python (pynwb) intensive, not IO, so ATM there is little
-            # to no benefit from Parallel without using multiproc!  But that would
-            # complicate progress bar indication... TODO
-            metadata_excs = list(
-                Parallel(n_jobs=jobs, verbose=10)(
-                    delayed(_get_metadata)(path) for path in paths
-                )
-            )
+        ):  # Do not use worker processes at all if number_of_jobs=1
+            # It is Python (pynwb) intensive, not IO, so we use the pool of
+            # worker processes with pynwb already loaded
+            service = get_metadata_service(jobs if jobs > 0 else None)
         else:
-            metadata_excs = list(map(_get_metadata, paths))
+            service = MetadataService(jobs=1)
+        results = dict(service.iter_metadata(paths))
+        metadata_excs: list[tuple[dict, Any]] = []
+        for path in paths:
+            meta: dict = {}
+            md_or_exc = results[path]
+            if isinstance(md_or_exc, Exception):
+                metadata_excs.append(
+                    (
+                        {"path": path},
+                        (
+                            md_or_exc.__class__,
+                            str(md_or_exc),
+                            traceback.TracebackException.from_exception(md_or_exc),
+                        ),
+                    )
+                )
+            else:
+                meta = md_or_exc or {}
+                meta["path"] = path
+                metadata_excs.append((meta, None))
         exceptions = [e for _, e in metadata_excs if e]
         if exceptions:
             lgr.warning(
@@ -1019,6 +1026,12 @@ def organize(
     )
     skip_same = []
     acted_upon = []
+    # Files moved within a Dandiset keep their recorded local state
+    state = (
+        LocalState.for_dandiset(dandiset_path)
+        if in_place and files_mode is FileOperationMode.MOVE
+        else None
+    )
     for e in metadata:
         dandi_path = e["dandi_path"]
         dandi_fullpath = op.join(dandiset_path, dandi_path)
@@ -1067,6 +1080,13 @@ def organize(
             else:
                 files_mode.as_copy_mode().copy(e_path, dandi_fullpath)
                 acted_upon.append(e)
+                if state is not None:
+                    state.rename(
+                        Path(
+                            op.relpath(e_abs_path, op.abspath(dandiset_path))
+                        ).as_posix(),
+                        dandi_path,
+                    )
 
     if acted_upon and in_place:
         # We might need to cleanup a bit - e.g. prune empty directories left
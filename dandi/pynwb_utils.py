@@ -11,25 +11,34 @@ metadata from NWB files using PyNWB. Features include:
 
 from __future__ import annotations
 
-from collections import Counter
-from collections.abc import Callable
-from datetime import timedelta
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import hashlib
 import inspect
 import os
 import os.path as op
 from pathlib import Path, PurePosixPath
 import re
+from threading import Lock
 from typing import IO, Any, TypeVar, cast
 import warnings
 
 import dandischema
+import dateutil.parser
 from fscacher import PersistentCache
 import h5py
 import hdmf
+from hdmf.build import BuildManager, TypeMap
+from hdmf.spec import NamespaceCatalog
+from hdmf.validate import ValidatorMap
 import numpy as np
 from packaging.version import Version
 import pynwb
 from pynwb import NWBHDF5IO
+from pynwb.spec import NWBDatasetSpec, NWBGroupSpec, NWBNamespace
 import semantic_version
 
 from . import __version__, get_logger
@@ -41,6 +50,7 @@ from .consts import (
     metadata_nwb_subject_fields,
 )
 from .misctypes import Readable
+from .support.content_cache import ContentCache
 from .utils import get_module_version, is_url
 from .validate._types import (
     Origin,
@@ -70,6 +80,26 @@ validate_cache = PersistentCache(
     tokens=dandi_cache_tokens + [get_module_version(dandischema)],
     envvar="DANDI_CACHE",
 )
+# Caches of the same results keyed by the files' contents instead of their
+# paths; used only if DANDI_CONTENT_CACHE is set
+metadata_content_cache = ContentCache(name="dandi-metadata", tokens=dandi_cache_tokens)
+
+
+def _dump_validation_results(results: list[ValidationResult]) -> str:
+    # As JSON Lines, like validation logs (see `dandi.validate._io`)
+    return "".join(f"{r.model_dump_json()}\n" for r in results)
+
+
+def _load_validation_results(text: str) -> list[ValidationResult]:
+    return [ValidationResult.model_validate_json(line) for line in text.splitlines()]
+
+
+validate_content_cache = ContentCache(
+    name="dandi-validate",
+    tokens=dandi_cache_tokens + [get_module_version(dandischema)],
+    dumps=_dump_validation_results,
+    loads=_load_validation_results,
+)
 
 
 def _sanitize_nwb_version(
@@ -127,6 +157,15 @@ def get_nwb_version(
     str or None
        None if there is no version detected
     """
+    with open_readable(filepath) as fp, h5py.File(fp, "r") as h5file:
+        return _get_nwb_version(h5file, sanitize=sanitize, filepath=filepath)
+
+
+def _get_nwb_version(
+    h5file: h5py.File,
+    sanitize: bool = False,
+    filepath: str | Path | Readable | None = None,
+) -> str | None:
     if sanitize:
 
         def _sanitize(v: Any) -> str:
@@ -137,18 +176,17 @@ def get_nwb_version(
         def _sanitize(v: Any) -> str:
             return str(v)
 
-    with open_readable(filepath) as fp, h5py.File(fp, "r") as h5file:
-        # 2.x stored it as an attribute
-        try:
-            return _sanitize(h5file.attrs["nwb_version"])
-        except KeyError:
-            pass
+    # 2.x stored it as an attribute
+    try:
+        return _sanitize(h5file.attrs["nwb_version"])
+    except KeyError:
+        pass
 
-        # 1.x stored it as a dataset
-        try:
-            return _sanitize(h5file["nwb_version"][...].tostring().decode())
-        except Exception:
-            lgr.debug("%s has no nwb_version", filepath)
+    # 1.x stored it as a dataset
+    try:
+        return _sanitize(h5file["nwb_version"][...].tostring().decode())
+    except Exception:
+        lgr.debug("%s has no nwb_version", filepath)
     return None
 
 
@@ -196,13 +234,18 @@ def get_neurodata_types_to_modalities_map() -> dict[str, str]:
 @metadata_cache.memoize_path
 def get_neurodata_types(filepath: str | Path | Readable) -> list[str]:
     with open_readable(filepath) as fp, h5py.File(fp, "r") as h5file:
-        all_pairs = _scan_neurodata_types(h5file)
+        return _get_neurodata_types(h5file)
 
+
+def _get_neurodata_types(
+    h5file: h5py.File, hierarchy: _NWBHierarchy | None = None
+) -> list[str]:
+    if hierarchy is None:
+        hierarchy = _scan_hierarchy(h5file)
+    counts = Counter(hierarchy.type_counts)
+    counts.pop("NWBFile", None)
     # so far descriptions are useless so let's just output actual names only
     # with a count if there is multiple
-    # return [': '.join(filter(bool, p)) for p in all_pairs]
-    names = [p[0] for p in all_pairs if p[0] not in {"NWBFile"}]
-    counts = Counter(names)
     out = []
     for name, count in sorted(counts.items()):
         if count > 1:
@@ -212,79 +255,540 @@ def get_neurodata_types(filepath: str | Path | Readable) -> list[str]:
     return out
 
 
-def _scan_neurodata_types(grp: h5py.File) -> list[tuple[Any, Any]]:
-    out = []
-    if "neurodata_type" in grp.attrs:
-        out.append((grp.attrs["neurodata_type"], grp.attrs.get("description", None)))
-    for v in list(grp.values()):
-        if isinstance(v, h5py._hl.group.Group):
-            out += _scan_neurodata_types(v)
-    return out
+def _scan_neurodata_types(h5file: h5py.File) -> Counter[Any]:
+    """
+    Count the values of the ``neurodata_type`` attributes of all groups in
+    the file (including the root group).  A group reachable via several
+    links (e.g., soft links to a Device) is counted once per link.
+    """
+    return _scan_hierarchy(h5file).type_counts
+
+
+@dataclass
+class _NWBHierarchy:
+    """What a single walk over the hierarchy of an NWB file found in it"""
+
+    #: Number of links to groups with each ``neurodata_type`` (including the
+    #: root group), counting a group reachable via several links once per
+    #: link
+    type_counts: Counter[Any] = field(default_factory=Counter)
+    #: The ``neurodata_type`` & ``namespace`` attributes of each group and
+    #: dataset that has them, keyed by the path at which the object was
+    #: first reached (one path per object)
+    groups: dict[str, tuple[Any, str | None]] = field(default_factory=dict)
+    datasets: dict[str, tuple[Any, str | None]] = field(default_factory=dict)
+    #: Whether the file contains any external links
+    has_external_links: bool = False
+
+
+def _scan_hierarchy(h5file: h5py.File) -> _NWBHierarchy:
+    """
+    Walk the hierarchy of an NWB file once, following soft (and external)
+    links, and collect everything that metadata extraction needs to know
+    about its structure; see `_NWBHierarchy`.
+
+    The hierarchy is walked with h5py's low-level API (H5Literate), so no
+    high-level h5py objects are created for the (possibly tens of thousands
+    of) groups & datasets in the file, only objects that have attributes are
+    checked for a ``neurodata_type``, and the counts for a group reachable
+    via several links are only computed once.  Links back to a group's
+    ancestors are not followed.
+    """
+    result = _NWBHierarchy()
+    memo: dict[tuple[int, int], Counter[Any]] = {}
+    # Groups currently being scanned, for skipping links to their ancestors
+    active: set[tuple[int, int]] = set()
+    seen_datasets: set[tuple[int, int]] = set()
+
+    def typed(obj: h5py.Group | h5py.Dataset) -> tuple[Any, str | None]:
+        return (obj.attrs["neurodata_type"], _h5py_attr_text(obj, "namespace"))
+
+    def scan(gid: h5py.h5g.GroupID, info: h5py.h5o.ObjInfo, path: str) -> Counter[Any]:
+        key = (info.fileno, info.addr)
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        if key in active:
+            return Counter()
+        active.add(key)
+        counts: Counter[Any] = Counter()
+        if info.num_attrs and h5py.h5a.exists(gid, b"neurodata_type"):
+            ndtype, namespace = result.groups[path] = typed(h5py.Group(gid))
+            counts[ndtype] += 1
+        links: list[tuple[bytes, int]] = []
+        gid.links.iterate(lambda n, li: links.append((n, li.type)), info=True)
+        for name, link_type in links:
+            if link_type == h5py.h5l.TYPE_EXTERNAL:
+                result.has_external_links = True
+            try:
+                # Unlike opening the object, this does not require reading
+                # the headers of datasets or of groups scanned already
+                child_info = h5py.h5o.get_info(gid, name)
+            except (KeyError, RuntimeError):
+                # Dangling soft or external link
+                continue
+            child_path = path.rstrip("/") + "/" + name.decode("utf-8")
+            if child_info.type == h5py.h5o.TYPE_GROUP:
+                counts.update(scan(h5py.h5o.open(gid, name), child_info, child_path))
+            elif (
+                child_info.type == h5py.h5o.TYPE_DATASET
+                and child_info.num_attrs
+                and (child_info.fileno, child_info.addr) not in seen_datasets
+            ):
+                seen_datasets.add((child_info.fileno, child_info.addr))
+                if h5py.h5a.exists(gid, b"neurodata_type", obj_name=name):
+                    result.datasets[child_path] = typed(
+                        h5py.Dataset(h5py.h5o.open(gid, name))
+                    )
+        active.discard(key)
+        memo[key] = counts
+        return counts
+
+    result.type_counts.update(scan(h5file.id, h5py.h5o.get_info(h5file.id), "/"))
+    return result
+
+
+# Building a `TypeMap` from the namespaces cached in an NWB file involves
+# parsing all of the specifications and (for extensions) generating classes
+# for their types, which can take longer than reading the metadata itself.
+# As most files in a Dandiset embed the very same namespaces, the results are
+# cached in-process, keyed by a digest of the files' /specifications groups.
+# Only the most recently used entries are kept, so that processing files with
+# many different extensions (or versions thereof) does not accumulate TypeMaps
+# without bound.
+T = TypeVar("T")
+
+_NAMESPACE_CACHE_SIZE = 16
+
+_namespace_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_namespace_cache_lock = Lock()
+
+
+def _specifications_digest(h5file: h5py.File) -> str:
+    """
+    Return a digest of the contents of the /specifications group of an NWB
+    file (the namespaces cached in it)
+    """
+    hasher = hashlib.sha256()
+    specs = h5file.get("specifications")
+    if isinstance(specs, h5py.Group):
+
+        def visit(name: str, obj: h5py.Group | h5py.Dataset) -> None:
+            hasher.update(name.encode("utf-8") + b"\0")
+            if isinstance(obj, h5py.Dataset):
+                value = obj[()]
+                if isinstance(value, str):
+                    value = value.encode("utf-8")
+                elif not isinstance(value, bytes):
+                    value = np.asarray(value).tobytes()
+                hasher.update(value + b"\0")
+
+        specs.visititems(visit)
+    return hasher.hexdigest()
+
+
+def _cached_by_specifications(
+    key: tuple[Any, ...], h5file: h5py.File, build: Callable[[], T]
+) -> T:
+    key = (*key, _specifications_digest(h5file))
+    with _namespace_cache_lock:
+        try:
+            value: T = _namespace_cache[key]
+        except KeyError:
+            value = _namespace_cache[key] = build()
+            while len(_namespace_cache) > _NAMESPACE_CACHE_SIZE:
+                _namespace_cache.popitem(last=False)
+        else:
+            _namespace_cache.move_to_end(key)
+        return value
+
+
+def _get_type_map(h5file: h5py.File) -> TypeMap:
+    """
+    Return a `TypeMap` of PyNWB's namespaces plus those cached in
+    ``h5file``, for reading the file with PyNWB.  The `TypeMap` is shared by
+    all files with the same cached namespaces, so only a fresh `BuildManager`
+    should be created from it for each file.
+    """
+
+    def build() -> TypeMap:
+        tm = pynwb.get_type_map()
+        NWBHDF5IO.load_namespaces(tm, file=h5file)
+        return tm
+
+    # Importing an extension (see `NWBMetadataSession.ndtypes_registry`)
+    # changes the namespaces known to PyNWB, so they are a part of the key:
+    return _cached_by_specifications(
+        ("type_map", tuple(pynwb.available_namespaces())), h5file, build
+    )
+
+
+def _get_validator_maps(h5file: h5py.File) -> dict[str, ValidatorMap]:
+    """
+    Return a `ValidatorMap` for each of the namespaces that ``h5file`` should
+    be validated against, determined the same way as by `pynwb.validate()`:
+    the most specific of the namespaces cached in the file, or PyNWB's core
+    namespace if there are none
+    """
+
+    def build() -> dict[str, ValidatorMap]:
+        catalog = NamespaceCatalog(
+            group_spec_cls=NWBGroupSpec,
+            dataset_spec_cls=NWBDatasetSpec,
+            spec_namespace_cls=NWBNamespace,
+        )
+        dependencies = NWBHDF5IO.load_namespaces(catalog, file=h5file)
+        candidates = set(dependencies)
+        for deps in dependencies.values():
+            candidates -= deps.keys()
+        # pynwb does not validate against hdmf-experimental (see
+        # https://github.com/NeurodataWithoutBorders/pynwb/issues/1357)
+        candidates.discard("hdmf-experimental")
+        if not candidates:
+            catalog = pynwb.get_type_map().namespace_catalog
+            candidates = {pynwb.CORE_NAMESPACE}
+        return {
+            ns: ValidatorMap(catalog.get_namespace(name=ns))
+            for ns in sorted(candidates)
+        }
+
+    return _cached_by_specifications(("validator_maps",), h5file, build)
 
 
 def _get_pynwb_metadata(path: str | Path | Readable) -> dict[str, Any]:
-    out = {}
     with open_readable(path) as fp, h5py.File(fp, "r") as h5, NWBHDF5IO(
-        file=h5, load_namespaces=True
+        file=h5, manager=BuildManager(_get_type_map(h5))
     ) as io:
-        nwb = io.read()
-        for key in metadata_nwb_file_fields:
-            value = getattr(nwb, key)
-            if isinstance(value, h5py.Dataset):
-                # serialize into a basic container (list), since otherwise
-                # it would be a closed Dataset upon return
-                value = list(value)
-            if isinstance(value, (list, tuple)) and all(
-                isinstance(v, bytes) for v in value
+        return _extract_pynwb_metadata(io.read())
+
+
+def _extract_pynwb_metadata(nwb: pynwb.NWBFile) -> dict[str, Any]:
+    out = {}
+    for key in metadata_nwb_file_fields:
+        value = getattr(nwb, key)
+        if isinstance(value, h5py.Dataset):
+            # serialize into a basic container (list), since otherwise
+            # it would be a closed Dataset upon return
+            value = list(value)
+        if isinstance(value, (list, tuple)) and all(
+            isinstance(v, bytes) for v in value
+        ):
+            value = type(value)(v.decode("utf-8") for v in value)
+        out[key] = value
+
+    # .subject can be None as the test shows
+    for subject_feature in metadata_nwb_subject_fields:
+        out[subject_feature] = getattr(nwb.subject, subject_feature, None)
+    # Add a few additional useful fields
+
+    # "Custom" DANDI extension by Ben for now to contain additional metadata
+    # not present in nwb-schema
+    dandi_icephys = getattr(nwb, "lab_meta_data", {}).get("DandiIcephysMetadata", None)
+    if dandi_icephys:
+        out.update(dandi_icephys.fields)
+    # Go through devices and see if there any probes used to record this file
+    probe_ids = [
+        v.probe_id.item()  # .item to avoid numpy types
+        for v in getattr(nwb, "devices", {}).values()
+        if hasattr(v, "probe_id")  # duck typing
+    ]
+    if probe_ids:
+        out["probe_ids"] = probe_ids
+
+    # Counts
+    for f in metadata_nwb_computed_fields:
+        if f in ("nwb_version", "nd_types"):
+            continue
+        if not f.startswith("number_of_"):
+            raise NotImplementedError(
+                f"ATM can only compute number_of_ fields. Got {f}"
+            )
+        key = f[len("number_of_") :]
+        out[f] = len(getattr(nwb, key, []) or [])
+
+    # get external_file data:
+    out["external_file_objects"] = _get_image_series(nwb)
+
+    # Calculate session duration for metadata
+    session_duration = _get_session_duration(nwb)
+    if session_duration is not None and out.get("session_start_time") is not None:
+        # Convert to absolute datetime by adding duration to session_start_time
+        start_time = out["session_start_time"]
+        out["session_end_time"] = start_time + timedelta(seconds=session_duration)
+
+    return out
+
+
+class _H5pyMetadataUnsupported(Exception):
+    """
+    Raised by `_get_h5py_metadata()` for file contents that it cannot
+    interpret without PyNWB
+    """
+
+
+#: Namespaces whose neurodata types `_get_h5py_metadata()` can interpret
+_H5PY_METADATA_NAMESPACES = frozenset({"core", "hdmf-common", "hdmf-experimental"})
+
+
+def _get_h5py_metadata(
+    h5file: h5py.File, hierarchy: _NWBHierarchy | None = None
+) -> dict[str, Any]:
+    """
+    Extract the same metadata as `_extract_pynwb_metadata()` by reading the
+    relevant HDF5 datasets & attributes directly, without having PyNWB
+    construct the whole container hierarchy of the file.
+
+    Only NWB 2.x files with no neurodata types from extensions are supported,
+    as interpreting the latter (e.g., `DandiIcephysMetadata` or devices with
+    probe IDs) requires PyNWB's object mapping.
+
+    :raises _H5pyMetadataUnsupported: if the file contains anything that
+        requires PyNWB to interpret, in which case the caller should fall back
+        to `_extract_pynwb_metadata()`
+    """
+    if (
+        h5file.attrs.get("neurodata_type") != "NWBFile"
+        or h5file.attrs.get("namespace") != "core"
+    ):
+        raise _H5pyMetadataUnsupported("not an NWB 2.x file")
+    if hierarchy is None:
+        hierarchy = _scan_hierarchy(h5file)
+    objects = _h5py_neurodata_objects(hierarchy)
+
+    out: dict[str, Any] = {}
+    for key in metadata_nwb_file_fields:
+        path = key if key in _NWB_ROOT_FIELDS else f"general/{key}"
+        value: Any = _h5py_read_text(h5file, path)
+        if key in ("experimenter", "related_publications"):
+            # PyNWB returns these as tuples even when stored as a scalar
+            if isinstance(value, str):
+                value = (value,)
+            elif isinstance(value, list):
+                value = tuple(value)
+        elif key != "keywords" and isinstance(value, list):
+            raise _H5pyMetadataUnsupported(f"{path} is not a scalar")
+        if key == "session_start_time" and value is not None:
+            value = _h5py_parse_date(value, path)
+        out[key] = value
+
+    subject = h5file.get("general/subject")
+    for subject_feature in metadata_nwb_subject_fields:
+        value = None
+        if subject is not None:
+            path = f"general/subject/{subject_feature}"
+            value = _h5py_read_text(h5file, path)
+            if isinstance(value, list):
+                raise _H5pyMetadataUnsupported(f"{path} is not a scalar")
+            if subject_feature == "date_of_birth" and value is not None:
+                value = _h5py_parse_date(value, path)
+        out[subject_feature] = value
+
+    # Counts
+    for f in metadata_nwb_computed_fields:
+        if f in ("nwb_version", "nd_types"):
+            continue
+        if f == "number_of_electrodes":
+            table_path = "general/extracellular_ephys/electrodes"
+        elif f == "number_of_units":
+            table_path = "units"
+        else:
+            raise NotImplementedError(f"Cannot compute {f} without PyNWB")
+        ids = h5file.get(f"{table_path}/id")
+        out[f] = len(ids) if isinstance(ids, h5py.Dataset) else 0
+
+    external_file_objects = []
+    for module_name in VIDEO_FILE_MODULES:
+        module = h5file.get(module_name)
+        if not isinstance(module, h5py.Group):
+            continue
+        for name, ob in module.items():
+            # Looked up by the object's own attributes rather than by its path
+            # in `objects`, as the walk may have reached it via another path
+            ndtype = ob.attrs.get("neurodata_type")
+            cls = (
+                None
+                if ndtype is None
+                else _h5py_neurodata_class(
+                    ob.name, ndtype, _h5py_attr_text(ob, "namespace")
+                )
+            )
+            if (
+                cls is not None
+                and issubclass(cls, pynwb.image.ImageSeries)
+                and "external_file" in ob
             ):
-                value = type(value)(v.decode("utf-8") for v in value)
-            out[key] = value
-
-        # .subject can be None as the test shows
-        for subject_feature in metadata_nwb_subject_fields:
-            out[subject_feature] = getattr(nwb.subject, subject_feature, None)
-        # Add a few additional useful fields
-
-        # "Custom" DANDI extension by Ben for now to contain additional metadata
-        # not present in nwb-schema
-        dandi_icephys = getattr(nwb, "lab_meta_data", {}).get(
-            "DandiIcephysMetadata", None
-        )
-        if dandi_icephys:
-            out.update(dandi_icephys.fields)
-        # Go through devices and see if there any probes used to record this file
-        probe_ids = [
-            v.probe_id.item()  # .item to avoid numpy types
-            for v in getattr(nwb, "devices", {}).values()
-            if hasattr(v, "probe_id")  # duck typing
-        ]
-        if probe_ids:
-            out["probe_ids"] = probe_ids
-
-        # Counts
-        for f in metadata_nwb_computed_fields:
-            if f in ("nwb_version", "nd_types"):
-                continue
-            if not f.startswith("number_of_"):
-                raise NotImplementedError(
-                    f"ATM can only compute number_of_ fields. Got {f}"
+                external_file = _h5py_read_text(h5file, ob["external_file"].name)
+                if not isinstance(external_file, list):
+                    raise _H5pyMetadataUnsupported(
+                        f"{ob.name}/external_file is not a list"
+                    )
+                external_file_objects.append(
+                    dict(
+                        id=_h5py_attr_text(ob, "object_id"),
+                        name=name,
+                        external_files=_video_files(external_file),
+                    )
                 )
-            key = f[len("number_of_") :]
-            out[f] = len(getattr(nwb, key, []) or [])
-
-        # get external_file data:
-        out["external_file_objects"] = _get_image_series(nwb)
+    out["external_file_objects"] = external_file_objects
 
-        # Calculate session duration for metadata
-        session_duration = _get_session_duration(nwb)
-        if session_duration is not None and out.get("session_start_time") is not None:
-            # Convert to absolute datetime by adding duration to session_start_time
-            start_time = out["session_start_time"]
-            out["session_end_time"] = start_time + timedelta(seconds=session_duration)
+    # Calculate session duration for metadata
+    session_duration = _h5py_session_duration(h5file, objects)
+    if session_duration is not None and out.get("session_start_time") is not None:
+        start_time = out["session_start_time"]
+        out["session_end_time"] = start_time + timedelta(seconds=session_duration)
 
     return out
 
 
+#: Fields of `metadata_nwb_file_fields` stored at the root of an NWB file
+#: rather than in ``/general``
+_NWB_ROOT_FIELDS = frozenset(
+    {"identifier", "session_description", "session_start_time"}
+)
+
+
+def _h5py_neurodata_objects(hierarchy: _NWBHierarchy) -> dict[str, type]:
+    """
+    Return a mapping from the paths of all groups in the file that represent
+    neurodata types to the PyNWB classes for those types
+    """
+    for path, (ndtype, namespace) in hierarchy.datasets.items():
+        if namespace not in _H5PY_METADATA_NAMESPACES:
+            raise _H5pyMetadataUnsupported(
+                f"{path} is of extension type {namespace}:{ndtype!s}"
+            )
+    objects: dict[str, type] = {}
+    for path, (ndtype, namespace) in hierarchy.groups.items():
+        objects[path] = _h5py_neurodata_class(path, ndtype, namespace)
+    return objects
+
+
+def _h5py_neurodata_class(path: str, ndtype: Any, namespace: str | None) -> type:
+    if namespace not in _H5PY_METADATA_NAMESPACES:
+        raise _H5pyMetadataUnsupported(
+            f"{path} is of extension type {namespace}:{ndtype!s}"
+        )
+    try:
+        cls: type = pynwb.get_class(str(ndtype), namespace)
+    except Exception as e:
+        raise _H5pyMetadataUnsupported(
+            f"{path} is of unknown type {namespace}:{ndtype!s}: {e}"
+        )
+    return cls
+
+
+def _h5py_session_duration(h5file: h5py.File, objects: dict[str, type]) -> float | None:
+    """
+    Counterpart of `_get_session_duration()` that reads the time information
+    of TimeSeries and DynamicTables directly from the file
+    """
+    start_times: list[float] = []
+    end_times: list[float] = []
+    for path, cls in objects.items():
+        grp = h5file[path]
+        if issubclass(cls, pynwb.base.TimeSeries):
+            timestamps = grp.get("timestamps")
+            starting_time = grp.get("starting_time")
+            data = grp.get("data")
+            if timestamps is not None and len(timestamps) > 0:
+                start_times.append(float(timestamps[0]))
+                end_times.append(float(timestamps[-1]))
+            elif (
+                starting_time is not None
+                and starting_time.attrs.get("rate") is not None
+                and data is not None
+            ):
+                if data.shape == ():
+                    raise _H5pyMetadataUnsupported(f"{path}/data is a scalar")
+                start_times.append(float(starting_time[()]))
+                rate = starting_time.attrs["rate"]
+                if rate == 0:
+                    continue
+                end_times.append(float(starting_time[()] + (len(data) / rate)))
+        elif issubclass(cls, hdmf.common.DynamicTable):
+            colnames = [
+                c.decode("utf-8") if isinstance(c, bytes) else str(c)
+                for c in grp.attrs.get("colnames", [])
+            ]
+
+            def column(name: str) -> h5py.Dataset | None:
+                if name not in colnames:
+                    return None
+                if f"{name}_index" in grp:
+                    raise _H5pyMetadataUnsupported(f"{path}/{name} is ragged")
+                return grp[name]
+
+            if (start_time := column("start_time")) is not None and len(start_time):
+                start_times.append(float(start_time[0]))
+            if (stop_time := column("stop_time")) is not None and len(stop_time):
+                end_times.append(float(stop_time[-1]))
+            if "spike_times" in colnames:
+                if "spike_times_index" not in grp:
+                    raise _H5pyMetadataUnsupported(f"{path}/spike_times is not ragged")
+                idxs = grp["spike_times_index"][:]
+                if len(idxs):
+                    # Same as in `_get_session_duration()`
+                    unit_end_idxs = idxs[np.diff(np.r_[0, idxs]) > 0]
+                    if len(unit_end_idxs) == 0:
+                        continue
+                    st_data = grp["spike_times"]
+                    if len(unit_end_idxs) > 1:
+                        start = float(
+                            np.min(np.r_[st_data[0], st_data[unit_end_idxs[:-1]]])
+                        )
+                    else:
+                        start = float(st_data[0])
+                    end = float(np.max(st_data[unit_end_idxs - 1]))
+                    start_times.append(start)
+                    end_times.append(end)
+            if (timestamp := column("timestamp")) is not None and len(timestamp):
+                start_times.append(float(timestamp[0]))
+                if (duration := column("duration")) is not None:
+                    end_times.append(float(timestamp[-1] + duration[-1]))
+                else:
+                    end_times.append(float(timestamp[-1]))
+    return _bounds_to_duration(start_times, end_times)
+
+
+def _h5py_attr_text(obj: h5py.Group | h5py.Dataset, name: str) -> str | None:
+    value = obj.attrs.get(name)
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    return None if value is None else str(value)
+
+
+def _h5py_read_text(h5file: h5py.File, path: str) -> str | list[str] | None:
+    """
+    Read a (scalar or 1-D) text dataset, returning `None` if it does not
+    exist
+    """
+    ds = h5file.get(path)
+    if ds is None:
+        return None
+    if not isinstance(ds, h5py.Dataset) or ds.dtype.kind not in "OSU":
+        raise _H5pyMetadataUnsupported(f"{path} is not a text dataset")
+    if ds.shape == ():
+        return str(ds.asstr()[()])
+    elif len(ds.shape) == 1:
+        return [str(v) for v in ds.asstr()[()]]
+    else:
+        raise _H5pyMetadataUnsupported(f"{path} has {len(ds.shape)} dimensions")
+
+
+def _h5py_parse_date(value: Any, path: str) -> datetime:
+    if not isinstance(value, str):
+        raise _H5pyMetadataUnsupported(f"{path} is not a scalar")
+    try:
+        date = dateutil.parser.parse(value)
+    except (ValueError, OverflowError):
+        raise _H5pyMetadataUnsupported(f"{path} is not a date: {value!r}")
+    if date.tzinfo is None:
+        # PyNWB assigns the local timezone to naive datetimes (with a warning)
+        raise _H5pyMetadataUnsupported(f"{path} has no timezone")
+    return date
+
+
 def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
     """Calculate the duration of a recording session from NWB file contents.
 
@@ -369,6 +873,12 @@ def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
                     # No duration, use max timestamp as end
                     end_times.append(float(timestamp_data[-1]))
 
+    return _bounds_to_duration(start_times, end_times)
+
+
+def _bounds_to_duration(
+    start_times: list[float], end_times: list[float]
+) -> float | None:
     # Return duration as max - min
     if start_times and end_times:
         duration = max(end_times) - min(start_times)
@@ -408,17 +918,27 @@ def _get_image_series(nwb: pynwb.NWBFile) -> list[dict]:
         module_cont = getattr(nwb, module_name)
         for name, ob in module_cont.items():
             if isinstance(ob, pynwb.image.ImageSeries) and ob.external_file is not None:
-                out_dict = dict(id=ob.object_id, name=ob.name, external_files=[])
-                for ext_file in ob.external_file:
-                    if (path := PurePosixPath(ext_file)).suffix in VIDEO_FILE_EXTENSIONS:
-                        out_dict["external_files"].append(path)
-                    else:
-                        lgr.warning(
-                            "external file %s should be one of: %s",
-                            ext_file,
-                            ", ".join(VIDEO_FILE_EXTENSIONS),
-                        )
-                out.append(out_dict)
+                out.append(
+                    dict(
+                        id=ob.object_id,
+                        name=ob.name,
+                        external_files=_video_files(ob.external_file),
+                    )
+                )
+    return out
+
+
+def _video_files(external_file: Iterable[str]) -> list[PurePosixPath]:
+    out = []
+    for ext_file in external_file:
+        if (path := PurePosixPath(ext_file)).suffix in VIDEO_FILE_EXTENSIONS:
+            out.append(path)
+        else:
+            lgr.warning(
+                "external file %s should be one of: %s",
+                ext_file,
+                ", ".join(VIDEO_FILE_EXTENSIONS),
+            )
     return out
 
 
@@ -467,8 +987,12 @@ def rename_nwb_external_files(metadata: list[dict], dandiset_path: str) -> None:
                         container.external_file[no] = str(name_new)
 
 
-@validate_cache.memoize_path
-def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResult]:
+@validate_cache.memoize_path(exclude_kwargs=["session"])
+def validate(
+    path: str | Path,
+    devel_debug: bool = False,
+    session: NWBMetadataSession | None = None,
+) -> list[ValidationResult]:
     """Run validation on a file and return errors
 
     In case of an exception being thrown, an error message added to the
@@ -477,8 +1001,43 @@ def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResu
     Parameters
     ----------
     path: str or Path
+    session: NWBMetadataSession, optional
+      An entered session for the file at ``path``.  If given, the file is read
+      via the session, and the data read for validation is reused by the
+      session's `~NWBMetadataSession.read_nwb()`.
     """
     path = str(path)  # Might come in as pathlib's PATH
+    content_digest = validate_content_cache.get_digest(path)
+    if content_digest is not None:
+        try:
+            cached: list[ValidationResult] = validate_content_cache.get(content_digest)
+        except KeyError:
+            pass
+        else:
+            lgr.debug("Using cached validation results for %s", path)
+            return [_relocate_validation_result(r, path) for r in cached]
+    errors = _validate(path, devel_debug, session)
+    if content_digest is not None:
+        validate_content_cache.set(content_digest, errors)
+    return errors
+
+
+def _relocate_validation_result(r: ValidationResult, path: str) -> ValidationResult:
+    """
+    Make a validation result obtained for an identical file elsewhere refer to
+    ``path``
+    """
+    update: dict[str, Any] = {"path": Path(path)}
+    if r.within_asset_paths:
+        update["within_asset_paths"] = {
+            path: loc for loc in r.within_asset_paths.values()
+        }
+    return r.model_copy(update=update)
+
+
+def _validate(
+    path: str, devel_debug: bool, session: NWBMetadataSession | None = None
+) -> list[ValidationResult]:
     errors: list[ValidationResult] = []
 
     # To overcome
@@ -490,7 +1049,10 @@ def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResu
     )
     version = None
     try:
-        version = get_nwb_version(path, sanitize=False)
+        if session is not None:
+            version = session.get_nwb_version(sanitize=False)
+        else:
+            version = get_nwb_version(path, sanitize=False)
     except Exception:
         # we just will not remove any errors, it is required so should be some
         pass
@@ -537,7 +1099,7 @@ def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResu
 
     try:
         if Version(pynwb.__version__) >= Version("3.0.0"):
-            error_outputs = pynwb.validate(path=path)
+            error_outputs = _validate_with_cached_namespaces(path, session)
         elif Version(pynwb.__version__) >= Version(
             "2.2.0"
         ):  # Use cached namespace feature
@@ -588,6 +1150,30 @@ def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResu
     return errors
 
 
+def _validate_with_cached_namespaces(
+    path: str, session: NWBMetadataSession | None = None
+) -> list:
+    """
+    Equivalent of ``pynwb.validate(path=path)`` that reuses the namespaces
+    (and validators built from them) of any previously validated file with
+    the same cached namespaces
+    """
+    errors: list = []
+    if session is not None:
+        validators = _get_validator_maps(session.h5file)
+        builder = session.read_builder()
+        for vmap in validators.values():
+            errors += vmap.validate(builder)
+        return errors
+    with h5py.File(path, "r") as h5:
+        validators = _get_validator_maps(h5)
+        with NWBHDF5IO(file=h5, manager=BuildManager(_get_type_map(h5))) as io:
+            builder = io.read_builder()
+            for vmap in validators.values():
+                errors += vmap.validate(builder)
+    return errors
+
+
 # Many commands might be using load_namespaces but it causes HDMF to whine if there
 # is no cached name spaces in the file.  It is benign but not really useful
 # at this point, so we ignore it although ideally there should be a formal
@@ -678,25 +1264,228 @@ def copy_nwb_file(src: str | Path, dest: str | Path) -> str:
 @metadata_cache.memoize_path
 def nwb_has_external_links(filepath: str | Path | Readable) -> bool:
     with open_readable(filepath) as f, h5py.File(f, "r") as fp:
-        visited = set()
-
-        # cannot use `file.visititems` because it skips external links
-        # (https://github.com/h5py/h5py/issues/671)
-        def visit(path: str = "/") -> bool:
-            if isinstance(fp[path], h5py.Group):
-                for key in fp[path].keys():
-                    key_path = path + "/" + key
-                    if key_path not in visited:
-                        visited.add(key_path)
-                        if isinstance(
-                            fp.get(key_path, getlink=True), h5py.ExternalLink
-                        ) or visit(key_path):
-                            return True
-            elif isinstance(fp.get(path, getlink=True), h5py.ExternalLink):
-                return True
-            return False
-
-        return visit()
+        return _has_external_links(fp)
+
+
+def _has_external_links(fp: h5py.File) -> bool:
+    # cannot use `file.visititems` because it skips external links
+    # (https://github.com/h5py/h5py/issues/671)
+    return _scan_hierarchy(fp).has_external_links
+
+
+class NWBMetadataSession:
+    """
+    A single opening of an NWB file from which all of its metadata is
+    extracted.
+
+    Extracting the metadata of an NWB file involves checking for external
+    links, reading the NWB version, loading the file with PyNWB, and scanning
+    for neurodata types.  Done via the respective standalone functions, each
+    step opens the file (and, for remote files, starts a new HTTP session) and
+    parses the HDF5 superblock anew; a session instead opens the file once
+    and shares the `h5py.File` (and the `NWBHDF5IO` reading from it) among
+    all the steps.  The file's hierarchy is likewise walked only once, with
+    the results shared by the checks for external links, neurodata types,
+    and (for the fast path) the PyNWB classes of the file's objects.
+
+    Unless ``fast=False`` is given, the fields that would be obtained via
+    PyNWB are read directly from the HDF5 datasets & attributes instead, and
+    the file is only loaded with PyNWB if it contains something that requires
+    PyNWB's object mapping to interpret (e.g., types from extensions).
+
+    Use as a context manager::
+
+        with NWBMetadataSession(path) as session:
+            metadata = session.get_metadata()
+    """
+
+    #: Extensions known to provide neurodata types that PyNWB cannot load
+    #: without them, as a mapping from namespace names to module names
+    ndtypes_registry = {
+        "AIBS_ecephys": "allensdk.brain_observatory.ecephys.nwb",
+        "ndx-labmetadata-abf": "ndx_dandi_icephys",
+    }
+
+    def __init__(self, path: str | Path | Readable, fast: bool = True) -> None:
+        self.path = path
+        #: Whether to read the metadata directly with h5py where possible
+        #: instead of loading the file with PyNWB; see `_get_h5py_metadata()`
+        self.fast = fast
+        self._stack = ExitStack()
+        self._fp: IO[bytes] | None = None
+        self._h5file: h5py.File | None = None
+        self._hierarchy: _NWBHierarchy | None = None
+        self._io: NWBHDF5IO | None = None
+        self._nwb: pynwb.NWBFile | None = None
+
+    def __enter__(self) -> NWBMetadataSession:
+        try:
+            self._h5file = self._open_h5file()
+        except BaseException:
+            self._stack.close()
+            raise
+        return self
+
+    def _open_h5file(self) -> h5py.File:
+        if isinstance(self.path, Readable):
+            if self._fp is None:
+                self._fp = self._stack.enter_context(open_readable(self.path))
+            return self._stack.enter_context(h5py.File(self._fp, "r"))
+        else:
+            # Let HDF5 read local files directly rather than through a Python
+            # file object
+            return self._stack.enter_context(h5py.File(self.path, "r"))
+
+    def __exit__(self, *_exc: Any) -> None:
+        try:
+            if self._io is not None:
+                # This also closes the h5py.File
+                self._io.close()
+        finally:
+            self._io = None
+            self._nwb = None
+            self._h5file = None
+            self._hierarchy = None
+            self._fp = None
+            self._stack.close()
+
+    @property
+    def h5file(self) -> h5py.File:
+        if self._h5file is None:
+            raise RuntimeError("NWBMetadataSession has not been entered")
+        return self._h5file
+
+    @property
+    def hierarchy(self) -> _NWBHierarchy:
+        """
+        The results of walking the file's hierarchy (once per session), shared
+        by the checks for external links & neurodata types
+        """
+        if self._hierarchy is None:
+            self._hierarchy = _scan_hierarchy(self.h5file)
+        return self._hierarchy
+
+    def has_external_links(self) -> bool:
+        return self.hierarchy.has_external_links
+
+    def get_nwb_version(self, sanitize: bool = False) -> str | None:
+        return _get_nwb_version(self.h5file, sanitize=sanitize, filepath=self.path)
+
+    def get_neurodata_types(self) -> list[str]:
+        return _get_neurodata_types(self.h5file, self.hierarchy)
+
+    def get_object_id(self) -> Any:
+        return self.h5file.attrs["object_id"]
+
+    def _get_io(self) -> NWBHDF5IO:
+        if self._io is None:
+            self._io = NWBHDF5IO(
+                file=self.h5file, manager=BuildManager(_get_type_map(self.h5file))
+            )
+        return self._io
+
+    def read_builder(self) -> Any:
+        """
+        Read the file's HDF5 hierarchy into HDMF builders (once per session),
+        as validated by `validate()` and then loaded by `read_nwb()`
+        """
+        try:
+            return self._get_io().read_builder()
+        except BaseException:
+            self._reset_io()
+            raise
+
+    def read_nwb(self) -> pynwb.NWBFile:
+        """Load the file with PyNWB (once per session)"""
+        if self._nwb is None:
+            try:
+                self._nwb = self._get_io().read()
+            except BaseException:
+                self._reset_io()
+                raise
+        return self._nwb
+
+    def _reset_io(self) -> None:
+        # Closing the io also closes the h5py.File, so reopen the latter for
+        # any further steps (e.g., a retry after importing an extension)
+        if self._io is not None:
+            self._io.close()
+            self._io = None
+            self._h5file = self._open_h5file()
+
+    def validate(self, devel_debug: bool = False) -> list[ValidationResult]:
+        """
+        Validate the file with PyNWB like `validate()`, sharing the data read
+        with `read_nwb()`
+        """
+        if isinstance(self.path, Readable):
+            raise TypeError("Only local NWB files can be validated")
+        errors: list[ValidationResult] = validate(
+            self.path, devel_debug=devel_debug, session=self
+        )
+        return errors
+
+    def get_pynwb_metadata(self) -> dict[str, Any]:
+        """
+        Extract the metadata loaded by PyNWB, importing the extensions in
+        `ndtypes_registry` as needed to load the file
+        """
+        # PyNWB might fail to load because of missing extensions.
+        # There is a new initiative of establishing registry of such extensions.
+        # Not yet sure if PyNWB is going to provide "native" support for needed
+        # functionality: https://github.com/NeurodataWithoutBorders/pynwb/issues/1143
+        # So meanwhile, hard-coded workaround for data types we care about
+        tried_imports = set()
+        while True:
+            try:
+                return _extract_pynwb_metadata(self.read_nwb())
+            except KeyError as exc:  # ATM there is
+                lgr.debug("Failed to read %s: %s", self.path, exc)
+                res = re.match(r"^['\"\\]+(\S+). not a namespace", str(exc))
+                if not res:
+                    raise
+                ndtype = res.groups()[0]
+                if ndtype not in self.ndtypes_registry:
+                    raise ValueError(
+                        "We do not know which extension provides %s. "
+                        "Original exception was: %s. " % (ndtype, exc)
+                    )
+                import_mod = self.ndtypes_registry[ndtype]
+                lgr.debug("Importing %r which should provide %r", import_mod, ndtype)
+                if import_mod in tried_imports:
+                    raise RuntimeError(
+                        "We already tried importing %s to provide %s, but it seems it didn't help"
+                        % (import_mod, ndtype)
+                    )
+                tried_imports.add(import_mod)
+                __import__(import_mod)
+
+    def get_metadata(self) -> dict[str, Any]:
+        """
+        Return the complete metadata of the NWB file: its NWB version, the
+        metadata loaded by PyNWB, its neurodata types, and its ``object_id``
+        (`None` if absent)
+
+        :raises NotImplementedError: if the file contains external links
+        """
+        if self.has_external_links():
+            raise NotImplementedError(
+                f"NWB files with external links are not supported: {self.path}"
+            )
+        meta: dict[str, Any] = {}
+        # First read out possibly available versions of specifications for NWB(:N)
+        meta["nwb_version"] = self.get_nwb_version()
+        if self.fast:
+            try:
+                meta.update(_get_h5py_metadata(self.h5file, self.hierarchy))
+            except _H5pyMetadataUnsupported as e:
+                lgr.debug("Loading %s with PyNWB to get its metadata: %s", self.path, e)
+                meta.update(self.get_pynwb_metadata())
+        else:
+            meta.update(self.get_pynwb_metadata())
+        meta["nd_types"] = self.get_neurodata_types()
+        meta["object_id"] = self.h5file.attrs.get("object_id")
+        return meta
 
 
 def open_readable(r: str | Path | Readable) -> IO[bytes]:
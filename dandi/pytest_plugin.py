@@ -4,7 +4,7 @@ from importlib.metadata import PackageNotFoundError, requires, version
 
 from dandischema.models import DandiBaseModel
 from packaging.requirements import Requirement
-from pytest import Config, Item, Parser
+from pytest import Config, Item, Parser, mark
 
 from .tests.fixtures import *  # noqa: F401, F403  # lgtm [py/polluting-import]
 
@@ -22,6 +22,12 @@ def pytest_addoption(parser: Parser) -> None:
         default=False,
         help="Use configuration for a scheduled daily test run",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Also run benchmarks (tests marked with 'benchmark')",
+    )
 
 
 def pytest_configure(config):
@@ -30,6 +36,7 @@ def pytest_configure(config):
         "obolibrary",
         "flaky",
         "ai_generated",
+        "benchmark: slow performance comparison; only run with --benchmark",
     ]
     for marker in markers:
         config.addinivalue_line("markers", marker)
@@ -71,6 +78,11 @@ def pytest_collection_modifyitems(items: list[Item], config: Config) -> None:
                 deselected_items.append(item)
         config.hook.pytest_deselected(items=deselected_items)
         items[:] = selected_items
+    if not config.getoption("--benchmark"):
+        skip_benchmark = mark.skip(reason="benchmarks are only run with --benchmark")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
 
 
 def pytest_assertrepr_compare(op, left, right):
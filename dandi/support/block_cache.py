@@ -0,0 +1,290 @@
+"""
+A persistent on-disk cache of fixed-size blocks of remote blobs.
+
+Reading an HDF5 file remotely (e.g., to extract metadata from or validate an
+NWB asset on the Archive) involves many small reads scattered throughout the
+file, each of which costs an HTTP range request, and repeating the operation
+repeats all of them.  When the ``DANDI_BLOCK_CACHE`` environment variable is
+set to the path of an SQLite database, `RemoteReadableAsset.open()
+<dandi.misctypes.RemoteReadableAsset.open>` instead returns a file whose reads
+are served from fixed-size blocks of the blob stored in that database, and
+only blocks that are not stored yet are fetched from the server (runs of
+consecutive missing blocks in a single request).
+
+Blocks are keyed by the ID of the asset's blob (which identifies its content)
+and are evicted in least-recently-used order once the total size of the
+stored blocks exceeds the maximum size.  As the cache is an SQLite database,
+it can be used by several processes at once.
+
+The block size (default: 512 KiB) and the maximum size of the cache (default:
+10 GiB) can be set in bytes via the ``DANDI_BLOCK_CACHE_BLOCK_SIZE`` and
+``DANDI_BLOCK_CACHE_MAX_SIZE`` environment variables.  The number of block
+hits & misses for each file is logged at DEBUG level when it is closed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import io
+import os
+from pathlib import Path
+import sqlite3
+from threading import Lock
+import time
+from typing import IO
+
+from .. import get_logger
+
+lgr = get_logger()
+
+#: The environment variable giving the path to the block cache database
+DB_ENVVAR = "DANDI_BLOCK_CACHE"
+
+DEFAULT_BLOCK_SIZE = 512 * 1024
+
+DEFAULT_MAX_SIZE = 10 * 1024**3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    blob TEXT NOT NULL,
+    block_size INTEGER NOT NULL,
+    idx INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (blob, block_size, idx)
+);
+CREATE INDEX IF NOT EXISTS blocks_last_used ON blocks (last_used);
+"""
+
+
+@dataclass
+class BlockCacheStats:
+    """Numbers of blocks read from the cache & fetched from the server"""
+
+    block_size: int
+    hits: int = 0
+    misses: int = 0
+    bytes_fetched: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} block hits, {self.misses} block misses"
+            f" ({self.bytes_fetched} bytes fetched; block size {self.block_size})"
+        )
+
+
+class BlockCache:
+    """
+    Fixed-size blocks of remote blobs, stored in the SQLite database at
+    ``db_path``, which is created if it does not exist yet
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError(f"Invalid block size: {block_size}")
+        self.db_path = Path(db_path)
+        self.block_size = block_size
+        #: Maximum total size in bytes of the stored blocks
+        self.max_size = max_size
+        self._initialized = False
+        self._init_lock = Lock()
+
+    @classmethod
+    def from_environ(cls) -> BlockCache | None:
+        """
+        Return a `BlockCache` configured by the ``DANDI_BLOCK_CACHE*``
+        environment variables, or `None` if ``DANDI_BLOCK_CACHE`` is not set
+        """
+        db_path = os.environ.get(DB_ENVVAR)
+        if not db_path:
+            return None
+        return cls(
+            db_path,
+            block_size=int(
+                os.environ.get("DANDI_BLOCK_CACHE_BLOCK_SIZE", DEFAULT_BLOCK_SIZE)
+            ),
+            max_size=int(
+                os.environ.get("DANDI_BLOCK_CACHE_MAX_SIZE", DEFAULT_MAX_SIZE)
+            ),
+        )
+
+    def connect(self) -> sqlite3.Connection:
+        # Long timeout, as the database may be written to by several processes
+        # (e.g., metadata extraction workers) at once.  A file is read by one
+        # thread at a time, but not necessarily by the thread that opened it.
+        conn = sqlite3.connect(self.db_path, timeout=60, check_same_thread=False)
+        with self._init_lock:
+            if not self._initialized:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                # WAL mode lets readers proceed while another process writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+        return conn
+
+    def open(
+        self, blob: str, size: int, fetch: Callable[[int, int], bytes]
+    ) -> IO[bytes]:
+        """
+        Return a readable binary filehandle for the blob with ID ``blob`` and
+        size ``size``.  ``fetch(start, end)`` is called to obtain the bytes
+        of the blob in the range ``[start, end)`` that are not in the cache.
+        """
+        return io.BufferedReader(
+            _BlockCacheFile(self, blob, size, fetch), buffer_size=self.block_size
+        )
+
+    def get_blocks(
+        self, conn: sqlite3.Connection, blob: str, first: int, last: int
+    ) -> dict[int, bytes]:
+        """
+        Return the stored blocks of ``blob`` with indices from ``first`` to
+        ``last`` (inclusive), marking them as used
+        """
+        rows = conn.execute(
+            "SELECT idx, data FROM blocks"
+            " WHERE blob = ? AND block_size = ? AND idx BETWEEN ? AND ?",
+            (blob, self.block_size, first, last),
+        ).fetchall()
+        if rows:
+            with conn:
+                conn.executemany(
+                    "UPDATE blocks SET last_used = ?"
+                    " WHERE blob = ? AND block_size = ? AND idx = ?",
+                    [(time.time(), blob, self.block_size, i) for i, _ in rows],
+                )
+        return {i: data for i, data in rows}
+
+    def put_blocks(
+        self, conn: sqlite3.Connection, blob: str, blocks: dict[int, bytes]
+    ) -> None:
+        """Store blocks of ``blob`` and evict any blocks over the maximum size"""
+        now = time.time()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (blob, self.block_size, i, data, len(data), now)
+                    for i, data in blocks.items()
+                ],
+            )
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM blocks"
+            ).fetchone()
+            excess = total - self.max_size
+            if excess > 0:
+                evicted = []
+                for rowid, size in conn.execute(
+                    "SELECT rowid, size FROM blocks ORDER BY last_used"
+                ):
+                    if excess <= 0:
+                        break
+                    evicted.append((rowid,))
+                    excess -= size
+                conn.executemany("DELETE FROM blocks WHERE rowid = ?", evicted)
+                lgr.debug("Evicted %d blocks from block cache", len(evicted))
+
+
+class _BlockCacheFile(io.RawIOBase):
+    """
+    A raw binary file reading a remote blob through a `BlockCache`; wrapped in
+    an `io.BufferedReader` by `BlockCache.open()`
+    """
+
+    def __init__(
+        self,
+        cache: BlockCache,
+        blob: str,
+        size: int,
+        fetch: Callable[[int, int], bytes],
+    ) -> None:
+        super().__init__()
+        self.cache = cache
+        self.blob = blob
+        self.size = size
+        self.fetch = fetch
+        self.stats = BlockCacheStats(block_size=cache.block_size)
+        self._pos = 0
+        self._conn = cache.connect()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        start = self._pos
+        end = min(start + len(buffer), self.size)
+        if end <= start:
+            return 0
+        bs = self.cache.block_size
+        first, last = start // bs, (end - 1) // bs
+        blocks = self.cache.get_blocks(self._conn, self.blob, first, last)
+        self.stats.hits += len(blocks)
+        missing = [i for i in range(first, last + 1) if i not in blocks]
+        if missing:
+            self.stats.misses += len(missing)
+            # Fetch each run of consecutive missing blocks with one request
+            runs: list[list[int]] = []
+            for i in missing:
+                if runs and runs[-1][1] == i - 1:
+                    runs[-1][1] = i
+                else:
+                    runs.append([i, i])
+            fetched: dict[int, bytes] = {}
+            for run_first, run_last in runs:
+                run_start = run_first * bs
+                run_end = min((run_last + 1) * bs, self.size)
+                data = self.fetch(run_start, run_end)
+                if len(data) != run_end - run_start:
+                    raise OSError(
+                        f"Expected {run_end - run_start} bytes of blob {self.blob}"
+                        f" at offset {run_start}, got {len(data)}"
+                    )
+                self.stats.bytes_fetched += len(data)
+                for j in range(run_first, run_last + 1):
+                    offset = (j - run_first) * bs
+                    fetched[j] = data[offset : offset + bs]
+            self.cache.put_blocks(self._conn, self.blob, fetched)
+            blocks.update(fetched)
+        view = memoryview(buffer)
+        n = 0
+        for i in range(first, last + 1):
+            block = blocks[i]
+            lo = max(start - i * bs, 0)
+            hi = min(end - i * bs, len(block))
+            view[n : n + hi - lo] = block[lo:hi]
+            n += hi - lo
+        self._pos = start + n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._conn.close()
+            lgr.debug("Block cache for blob %s: %s", self.blob, self.stats)
+        super().close()
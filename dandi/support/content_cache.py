@@ -0,0 +1,293 @@
+"""
+A persistent cache of results computed from the contents of files, keyed by
+the files' content digests instead of their paths.
+
+fscacher's `~fscacher.PersistentCache.memoize_path()` keys the cached results
+on a file's path and ``stat`` fingerprint, so they are lost once the file is
+moved (e.g., by ``dandi organize``), copied, or downloaded again to another
+location.  A `ContentCache` instead keys them on the file's dandi-etag (plus
+the versions of the tools that computed them), so they can be reused for any
+copy of the same content, and they can be exported from one machine and
+imported on another.
+
+A `ContentCache` is only used if the ``DANDI_CONTENT_CACHE``
+environment variable is set to the path of the SQLite database in which to
+store the results.  Setting ``DANDI_CACHE`` to ``ignore`` or ``clear``
+applies to it as it does to the other caches.
+
+The results are stored as JSON text, so importing a cache never executes any
+code from it.  By default, values are encoded with `dumps_json()`, which also
+supports the `~datetime.datetime`, `~pathlib.PurePosixPath`, and `tuple`
+values found in NWB metadata; caches of other objects supply their own
+``dumps`` & ``loads`` functions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from contextlib import closing
+from datetime import datetime
+import json
+import os
+from pathlib import Path, PurePosixPath
+import re
+import sqlite3
+from threading import Lock
+from typing import Any
+
+from dandischema.models import DigestType
+
+from .. import get_logger
+from ..misctypes import Digest, LocalReadableFile, Readable
+
+lgr = get_logger()
+
+#: The environment variable giving the path to the content cache database
+DB_ENVVAR = "DANDI_CONTENT_CACHE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    cache TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    args TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (cache, tokens, digest, args)
+)
+"""
+
+
+def get_db_path() -> Path | None:
+    """
+    Return the path to the content cache database, or `None` if the content
+    cache is not in use
+    """
+    p = os.environ.get(DB_ENVVAR)
+    return Path(p) if p else None
+
+
+# Placeholder etags (e.g., ``DUMMY_DANDI_ETAG`` or those used by ``dandi ls
+# --use-fake-digest``) consist of a single repeated hex digit:
+_PLACEHOLDER_ETAG = re.compile(r"([0-9a-f])\1{31}-\d+")
+
+
+def _tag(value: Any) -> Any:
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("Only dicts with str keys can be cached")
+        return {k: _tag(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_tag(v) for v in value]
+    elif isinstance(value, tuple):
+        return {"__tuple__": [_tag(v) for v in value]}
+    elif isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    elif isinstance(value, PurePosixPath):
+        return {"__posixpath__": str(value)}
+    elif value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    else:
+        raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _untag(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        ((key, value),) = obj.items()
+        if key == "__tuple__":
+            return tuple(value)
+        elif key == "__datetime__":
+            return datetime.fromisoformat(value)
+        elif key == "__posixpath__":
+            return PurePosixPath(value)
+    return obj
+
+
+def dumps_json(value: Any) -> str:
+    """
+    Encode a value built from JSON types, tuples, and `~datetime.datetime` &
+    `~pathlib.PurePosixPath` instances as JSON in a way that `loads_json()`
+    restores exactly
+
+    :raises TypeError: if the value contains anything else
+    """
+    return json.dumps(_tag(value))
+
+
+def loads_json(s: str) -> Any:
+    """Decode a value encoded by `dumps_json()`"""
+    return json.loads(s, object_hook=_untag)
+
+
+def _require_db_path(db_path: str | Path | None) -> Path:
+    if db_path is not None:
+        return Path(db_path)
+    p = get_db_path()
+    if p is None:
+        raise ValueError(
+            f"Content cache is not in use; set {DB_ENVVAR} to the path of its database"
+        )
+    return p
+
+
+def _connect(db_path: str | Path) -> sqlite3.Connection:
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    # Long timeout, as the database may be written to by several processes
+    # (e.g., metadata extraction workers) at once
+    conn = sqlite3.connect(db_path, timeout=60)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+class ContentCache:
+    """
+    A named collection of results, each computed from the contents of a file
+    by some function, keyed by the file's dandi-etag, the values of the
+    ``tokens`` (e.g., the versions of the libraries used to compute the
+    results), and any additional arguments the result depends on
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tokens: Sequence[str] = (),
+        db_path: str | Path | None = None,
+        dumps: Callable[[Any], str] = dumps_json,
+        loads: Callable[[str], Any] = loads_json,
+    ) -> None:
+        self.name = name
+        self.tokens = json.dumps(list(tokens))
+        #: Path to the database; if not set, the path is taken from
+        #: ``DANDI_CONTENT_CACHE``
+        self.db_path = None if db_path is None else Path(db_path)
+        #: Functions for converting the results to & from JSON text
+        self.dumps = dumps
+        self.loads = loads
+        self._cleared = False
+        self._lock = Lock()
+
+    def _get_db_path(self) -> Path | None:
+        return self.db_path if self.db_path is not None else get_db_path()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self._get_db_path() is not None
+            and os.environ.get("DANDI_CACHE") != "ignore"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        db_path = self._get_db_path()
+        assert db_path is not None
+        conn = _connect(db_path)
+        with self._lock:
+            if not self._cleared and os.environ.get("DANDI_CACHE") == "clear":
+                with conn:
+                    conn.execute("DELETE FROM results WHERE cache = ?", (self.name,))
+                self._cleared = True
+        return conn
+
+    def get_digest(
+        self, path: str | Path | Readable, digest: Digest | None = None
+    ) -> str | None:
+        """
+        Return the dandi-etag of the given file for use as a key, or `None` if
+        the cache is disabled or the etag is not known.
+
+        If ``digest`` is a (real) dandi-etag already computed for the file
+        (e.g., one reported by the Archive for a remote asset), it is used
+        as-is; otherwise, the etag is computed for local files only.
+        """
+        if not self.enabled:
+            return None
+        if (
+            digest is not None
+            and digest.algorithm is DigestType.dandi_etag
+            and not _PLACEHOLDER_ETAG.fullmatch(digest.value)
+        ):
+            return digest.value
+        if isinstance(path, LocalReadableFile):
+            path = path.filepath
+        elif isinstance(path, Readable):
+            return None
+        # Avoid heavy import by importing within function:
+        from .digests import get_digest
+
+        etag: str = get_digest(path, digest="dandi-etag")
+        return etag
+
+    def get(self, digest: str, args: Sequence[Any] = ()) -> Any:
+        """
+        Return the result stored for the file with dandi-etag ``digest`` &
+        the additional arguments ``args``
+
+        :raises KeyError: if there is no such result
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM results"
+                " WHERE cache = ? AND tokens = ? AND digest = ? AND args = ?",
+                (self.name, self.tokens, digest, json.dumps(list(args))),
+            ).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        try:
+            return self.loads(row[0])
+        except Exception as e:
+            # E.g., a result stored in an older format
+            lgr.debug("Ignoring unreadable %s result for %s: %s", self.name, digest, e)
+            raise KeyError(digest) from e
+
+    def set(self, digest: str, value: Any, args: Sequence[Any] = ()) -> None:
+        """
+        Store the result for the file with dandi-etag ``digest`` & the
+        additional arguments ``args``.  Results that cannot be encoded are not
+        stored.
+        """
+        try:
+            text = self.dumps(value)
+        except Exception as e:
+            lgr.debug("Not caching %s result for %s: %s", self.name, digest, e)
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (self.name, self.tokens, digest, json.dumps(list(args)), text),
+            )
+
+
+def _copy_results(src: str | Path, dest: str | Path) -> int:
+    with closing(_connect(dest)) as conn:
+        with conn:
+            conn.execute("ATTACH DATABASE ? AS src", (str(src),))
+            cur = conn.execute(
+                "INSERT OR REPLACE INTO results SELECT * FROM src.results"
+            )
+            n = cur.rowcount
+        conn.execute("DETACH DATABASE src")
+    return n
+
+
+def export_content_cache(dest: str | Path, db_path: str | Path | None = None) -> int:
+    """
+    Copy all results in the content cache database ``db_path`` (default: the
+    one given by ``DANDI_CONTENT_CACHE``) into the database at
+    ``dest``, which is created if it does not exist yet.  Returns the number
+    of results copied.
+    """
+    src = _require_db_path(db_path)
+    # Ensure the source has the table even if nothing was cached yet
+    with closing(_connect(src)):
+        pass
+    return _copy_results(src, dest)
+
+
+def import_content_cache(src: str | Path, db_path: str | Path | None = None) -> int:
+    """
+    Add all results from the exported content cache at ``src`` to the
+    content cache database ``db_path`` (default: the one given by
+    ``DANDI_CONTENT_CACHE``), replacing any stored results for the same
+    keys.  Returns the number of results imported.
+    """
+    if not Path(src).exists():
+        raise FileNotFoundError(src)
+    return _copy_results(src, _require_db_path(db_path))
@@ -0,0 +1,231 @@
+"""
+A database of the state of the files of a local Dandiset.
+
+``dandi upload`` and ``dandi download`` each work out the state of the files
+of a local Dandiset anew: digests are cached keyed by absolute paths, and
+nothing records which asset on the Archive a file was uploaded as or
+downloaded from.  A `LocalState` records, for each file of a Dandiset as of
+the last time ``dandi upload`` or ``dandi download`` handled it, its ``stat``
+fingerprint, its dandi-etag, and the identifier of the remote asset it
+corresponds to; ``dandi organize`` and ``dandi move`` carry the records of
+the files they move over to their new paths.  The recorded values of a file
+are only reported while its fingerprint is unchanged.
+
+The state is an SQLite database at :file:`.dandi/state.sqlite` in the root of
+the Dandiset (next to :file:`dandiset.yaml`).  It is only used if it exists
+or if the ``DANDI_LOCAL_STATE`` environment variable is set to a nonempty
+value (in which case it is created as needed).  Setting ``DANDI_CACHE`` to
+``ignore`` disables it, and setting it to ``clear`` causes all recorded
+values to be disregarded (and replaced).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import sqlite3
+import stat
+from threading import Lock
+
+from .. import get_logger
+from ..consts import dandiset_metadata_file
+
+lgr = get_logger()
+
+#: The environment variable enabling the creation of local state databases
+ENVVAR = "DANDI_LOCAL_STATE"
+
+#: The path of the database relative to the root of a Dandiset
+STATE_PATH = ".dandi/state.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    dandi_etag TEXT,
+    remote_asset_id TEXT
+)
+"""
+
+#: The columns of the ``files`` table that record values for a file
+_FIELDS = ("dandi_etag", "remote_asset_id")
+
+
+@dataclass
+class FileState:
+    """The recorded state of a file of a Dandiset"""
+
+    #: The ``/``-separated path of the file relative to the Dandiset
+    path: str
+    #: The ``stat`` fingerprint of the file (see `file_fingerprint()`)
+    fingerprint: str
+    dandi_etag: str | None = None
+    #: The identifier of the asset on the Archive that the file was last
+    #: uploaded as or downloaded from
+    remote_asset_id: str | None = None
+
+
+def file_fingerprint(path: str | Path) -> str | None:
+    """
+    Return a fingerprint of the regular file at ``path`` based on its
+    ``stat`` tuple, or `None` if it is not a regular file (or a symlink to
+    one).  The fingerprint is preserved when the file is renamed.
+    """
+    try:
+        s = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(s.st_mode):
+        return None
+    return f"{s.st_size}:{s.st_mtime_ns}:{s.st_ino}:{s.st_dev}"
+
+
+class LocalState:
+    """
+    The recorded state of the files of the Dandiset at ``dandiset_path``,
+    stored in the SQLite database at ``db_path``
+    """
+
+    _instances: dict[Path, LocalState] = {}
+    _instances_lock = Lock()
+
+    def __init__(self, dandiset_path: str | Path, db_path: str | Path) -> None:
+        self.dandiset_path = Path(dandiset_path)
+        self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    @classmethod
+    def for_dandiset(cls, dandiset_path: str | Path | None) -> LocalState | None:
+        """
+        Return the state of the Dandiset at ``dandiset_path``, or `None` if
+        there is no Dandiset there or the state is not in use for it
+        """
+        if dandiset_path is None or os.environ.get("DANDI_CACHE") == "ignore":
+            return None
+        dandiset_path = Path(os.path.realpath(dandiset_path))
+        db_path = dandiset_path / STATE_PATH
+        if (
+            not (db_path.exists() or os.environ.get(ENVVAR))
+            or not (dandiset_path / dandiset_metadata_file).is_file()
+        ):
+            return None
+        with cls._instances_lock:
+            try:
+                return cls._instances[dandiset_path]
+            except KeyError:
+                state = cls._instances[dandiset_path] = cls(dandiset_path, db_path)
+                return state
+
+    def _execute(self, sql: str, params: tuple | list = ()) -> list[tuple]:
+        with self._lock:
+            if self._conn is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                # Long timeout, as the database may be written to by several
+                # processes at once
+                conn = sqlite3.connect(
+                    self.db_path, timeout=60, check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_SCHEMA)
+                self._conn = conn
+            with self._conn:
+                return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _filepath(self, path: str) -> Path:
+        return self.dandiset_path / path
+
+    def get(self, path: str) -> FileState | None:
+        """
+        Return the recorded state of the file at the ``/``-separated path
+        ``path`` relative to the Dandiset, or `None` if nothing is recorded
+        for it or it changed since
+        """
+        if os.environ.get("DANDI_CACHE") == "clear":
+            return None
+        fp = file_fingerprint(self._filepath(path))
+        if fp is None:
+            return None
+        try:
+            rows = self._execute(
+                f"SELECT {', '.join(_FIELDS)} FROM files"
+                " WHERE path = ? AND fingerprint = ?",
+                (path, fp),
+            )
+        except sqlite3.Error as e:
+            lgr.debug("Failed to read local state of %s: %s", path, e)
+            return None
+        if not rows:
+            return None
+        return FileState(path=path, fingerprint=fp, **dict(zip(_FIELDS, rows[0])))
+
+    def update(self, path: str, **values: str | None) -> None:
+        """
+        Record values (given as keyword arguments named after the fields of
+        `FileState`) for the file at the ``/``-separated path ``path``
+        relative to the Dandiset.  If the file changed since values were last
+        recorded for it, those are discarded.
+        """
+        unknown = set(values) - set(_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown local state fields: {', '.join(sorted(unknown))}")
+        fp = file_fingerprint(self._filepath(path))
+        try:
+            if fp is None:
+                self._execute("DELETE FROM files WHERE path = ?", (path,))
+                return
+            # Values recorded for an earlier state of the file are discarded
+            names = list(values)
+            self._execute(
+                f"INSERT INTO files (path, fingerprint{''.join(', ' + n for n in names)})"
+                f" VALUES (?, ?{', ?' * len(names)})"
+                " ON CONFLICT (path) DO UPDATE SET "
+                + ", ".join(
+                    [f"{n} = excluded.{n}" for n in ["fingerprint", *names]]
+                    + [
+                        f"{n} = CASE WHEN fingerprint = excluded.fingerprint"
+                        f" THEN {n} END"
+                        for n in _FIELDS
+                        if n not in values
+                    ]
+                ),
+                (path, fp, *values.values()),
+            )
+        except sqlite3.Error as e:
+            lgr.debug("Failed to record local state of %s: %s", path, e)
+
+    def rename(self, src: str, dest: str) -> None:
+        """
+        Record that the file or directory at the ``/``-separated path ``src``
+        relative to the Dandiset was moved to ``dest``
+        """
+        try:
+            self._execute("DELETE FROM files WHERE path = ?", (dest,))
+            self._execute(
+                "UPDATE files SET path = ? || substr(path, ?)"
+                " WHERE path = ? OR substr(path, 1, ?) = ?",
+                (dest, len(src) + 1, src, len(src) + 1, src + "/"),
+            )
+        except sqlite3.Error as e:
+            lgr.debug("Failed to record move of %s to %s: %s", src, dest, e)
+
+    def remove(self, path: str) -> None:
+        """
+        Forget the file, or all files in the directory, at the
+        ``/``-separated path ``path`` relative to the Dandiset
+        """
+        try:
+            self._execute(
+                "DELETE FROM files WHERE path = ? OR substr(path, 1, ?) = ?",
+                (path, len(path) + 1, path + "/"),
+            )
+        except sqlite3.Error as e:
+            lgr.debug("Failed to forget local state of %s: %s", path, e)
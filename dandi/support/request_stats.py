@@ -0,0 +1,212 @@
+"""
+Lightweight instrumentation of the HTTP requests made by dandi-cli.
+
+When enabled (by setting the :envvar:`DANDI_REQUEST_STATS` environment
+variable to a file path, or ``-`` for stderr, or via the ``--request-stats``
+option of the ``dandi`` command), every response received by a
+`~dandi.dandiapi.RESTFullAPIClient` session is tallied per HTTP method, host,
+and endpoint template, recording the number of requests, a histogram of
+latencies (time until the response headers were received), the number of
+retries, the response status codes, and the numbers of bytes sent & received
+(as reported by the ``Content-Length`` headers).  The tallies can then be
+dumped as JSON with `dump()`.
+
+When disabled, no hooks are installed, and so there is no overhead.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import os
+import re
+import sys
+from threading import Lock
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from .. import get_logger
+
+lgr = get_logger()
+
+#: Upper bounds (in seconds) of the latency histogram buckets; latencies above
+#: the last bound are counted in an overflow bucket
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+#: Maximum number of path components kept in an endpoint template
+MAX_TEMPLATE_PARTS = 8
+
+_PART_TEMPLATES = [
+    (
+        re.compile(
+            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
+        ),
+        "{uuid}",
+    ),
+    (re.compile(r"^\d+$"), "{n}"),
+    (re.compile(r"^\d+\.\d{6}\.\d{4}$"), "{version}"),
+    (re.compile(r"^[0-9a-f]{3}$"), "{xxx}"),
+    (re.compile(r"^[0-9a-f]{32,}$", re.I), "{digest}"),
+]
+
+
+def endpoint_template(path: str) -> str:
+    """
+    Convert a URL path to a template by replacing the components that
+    identify specific resources (UUIDs, numeric IDs, version IDs, hash
+    prefixes, digests) with placeholders and truncating overly long paths
+    (e.g., of Zarr entries)
+    """
+    parts = []
+    for p in path.split("/"):
+        for rgx, repl in _PART_TEMPLATES:
+            if rgx.fullmatch(p):
+                p = repl
+                break
+        parts.append(p)
+    if len(parts) > MAX_TEMPLATE_PARTS + 1:
+        parts = parts[: MAX_TEMPLATE_PARTS + 1] + ["..."]
+    return "/".join(parts) or "/"
+
+
+@dataclass
+class EndpointStats:
+    """Tallies of requests made to a single endpoint"""
+
+    count: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    status_codes: Counter[int] = field(default_factory=Counter)
+
+    def add(
+        self, latency: float, status: int, bytes_sent: int, bytes_received: int
+    ) -> None:
+        self.count += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                break
+        else:
+            i = len(LATENCY_BUCKETS)
+        self.latency_histogram[i] += 1
+        self.status_codes[status] += 1
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={b}" for b in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        return {
+            "count": self.count,
+            "retries": self.retries,
+            "status_codes": {str(k): v for k, v in sorted(self.status_codes.items())},
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": {
+                "total": round(self.latency_total, 6),
+                "mean": (
+                    round(self.latency_total / self.count, 6) if self.count else None
+                ),
+                "max": round(self.latency_max, 6),
+                "histogram": {
+                    lbl: n for lbl, n in zip(labels, self.latency_histogram) if n
+                },
+            },
+        }
+
+
+class RequestStats:
+    """Thread-safe collection of `EndpointStats` keyed by method, host & endpoint"""
+
+    def __init__(self, output: str | None = None) -> None:
+        #: Where to dump the statistics: a file path, ``"-"`` for stderr, or
+        #: `None` if instrumentation is disabled
+        self.output = output
+        self._stats: dict[tuple[str, str, str], EndpointStats] = {}
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.output is not None
+
+    def enable(self, output: str) -> None:
+        self.output = output
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def _get(self, method: str, url: str) -> EndpointStats:
+        u = urlsplit(url)
+        key = (method.upper(), f"{u.scheme}://{u.netloc}", endpoint_template(u.path))
+        try:
+            return self._stats[key]
+        except KeyError:
+            return self._stats.setdefault(key, EndpointStats())
+
+    def response_hook(
+        self, r: requests.Response, *_args: Any, **_kwargs: Any
+    ) -> requests.Response:
+        """A ``requests`` response hook that records the response"""
+        req = r.request
+        try:
+            bytes_sent = int(req.headers.get("Content-Length", 0))
+        except ValueError:
+            bytes_sent = 0
+        try:
+            bytes_received = int(r.headers.get("Content-Length", 0))
+        except ValueError:
+            bytes_received = 0
+        with self._lock:
+            self._get(req.method or "?", req.url or "").add(
+                latency=r.elapsed.total_seconds(),
+                status=r.status_code,
+                bytes_sent=bytes_sent,
+                bytes_received=bytes_received,
+            )
+        return r
+
+    def instrument(self, session: requests.Session) -> None:
+        """Install the response hook on ``session`` if instrumentation is enabled"""
+        if self.enabled and self.response_hook not in session.hooks["response"]:
+            session.hooks["response"].append(self.response_hook)
+
+    def record_retry(self, method: str, url: str) -> None:
+        if self.enabled:
+            with self._lock:
+                self._get(method, url).retries += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": [
+                    {"method": method, "host": host, "endpoint": endpoint}
+                    | st.as_dict()
+                    for (method, host, endpoint), st in sorted(self._stats.items())
+                ]
+            }
+
+    def dump(self) -> None:
+        """Write the collected statistics as JSON to the configured output"""
+        if self.output is None:
+            return
+        data = json.dumps(self.as_dict(), indent=2)
+        if self.output == "-":
+            print(data, file=sys.stderr)
+        else:
+            with open(self.output, "w") as fp:
+                print(data, file=fp)
+            lgr.info("Request statistics saved in %s", self.output)
+
+
+#: The process-wide request statistics collector
+request_stats = RequestStats(os.environ.get("DANDI_REQUEST_STATS") or None)
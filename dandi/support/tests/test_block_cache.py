@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ..block_cache import BlockCache
+
+DATA = bytes(range(256)) * 4
+
+
+class Fetcher:
+    def __init__(self, data: bytes = DATA) -> None:
+        self.data = data
+        self.requests: list[tuple[int, int]] = []
+
+    def __call__(self, start: int, end: int) -> bytes:
+        self.requests.append((start, end))
+        return self.data[start:end]
+
+
+def test_block_cache(tmp_path: Path) -> None:
+    cache = BlockCache(tmp_path / "blocks.sqlite", block_size=100)
+    fetch = Fetcher()
+    with cache.open("blob1", len(DATA), fetch) as fp:
+        fp.seek(150)
+        assert fp.read(100) == DATA[150:250]
+        assert fetch.requests == [(100, 300)]
+        fp.seek(-24, 2)
+        assert fp.read() == DATA[-24:]
+        assert fp.read() == b""
+        fp.seek(0)
+        assert fp.read() == DATA
+        # Blocks 0 & 3-9 are fetched in one request each
+        assert fetch.requests == [(100, 300), (1000, 1024), (0, 100), (300, 1000)]
+        stats = fp.raw.stats  # type: ignore[attr-defined]
+        assert stats.block_size == 100
+        assert stats.misses == 11
+        assert stats.bytes_fetched == len(DATA)
+
+    # A different process (simulated by a new BlockCache instance) reads the
+    # same blob from the cache:
+    fetch2 = Fetcher()
+    cache2 = BlockCache(tmp_path / "blocks.sqlite", block_size=100)
+    with cache2.open("blob1", len(DATA), fetch2) as fp:
+        assert fp.read() == DATA
+        assert fp.raw.stats.hits == 11  # type: ignore[attr-defined]
+    assert fetch2.requests == []
+
+    # Other blobs & block sizes are cached separately
+    fetch3 = Fetcher(DATA[::-1])
+    with cache.open("blob2", len(DATA), fetch3) as fp:
+        assert fp.read() == DATA[::-1]
+    with BlockCache(tmp_path / "blocks.sqlite", block_size=64).open(
+        "blob1", len(DATA), fetch2
+    ) as fp:
+        assert fp.read() == DATA
+    assert fetch2.requests == [(0, len(DATA))]
+
+
+def test_block_cache_lru(tmp_path: Path) -> None:
+    cache = BlockCache(tmp_path / "blocks.sqlite", block_size=100, max_size=300)
+    fetch = Fetcher()
+    with cache.open("blob", len(DATA), fetch) as fp:
+        for i in [0, 1, 2, 0, 3]:
+            fp.seek(i * 100)
+            fp.read(1)
+            # Defeat the BufferedReader's buffer
+            fp.seek(len(DATA))
+    assert fetch.requests == [(0, 100), (100, 200), (200, 300), (300, 400)]
+    fetch.requests.clear()
+    with cache.open("blob", len(DATA), fetch) as fp:
+        # Block 1 was the least recently used one and has been evicted
+        for i in [0, 2, 3, 1]:
+            fp.seek(i * 100)
+            fp.read(1)
+            fp.seek(len(DATA))
+    assert fetch.requests == [(100, 200)]
+
+
+def test_block_cache_short_read(tmp_path: Path) -> None:
+    cache = BlockCache(tmp_path / "blocks.sqlite", block_size=100)
+    with cache.open("blob", len(DATA), Fetcher(DATA[:50])) as fp:
+        with pytest.raises(OSError):
+            fp.read()
+    with cache.open("blob", len(DATA), Fetcher()) as fp:
+        assert fp.read() == DATA
+
+
+def test_block_cache_from_environ(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("DANDI_BLOCK_CACHE", raising=False)
+    assert BlockCache.from_environ() is None
+    monkeypatch.setenv("DANDI_BLOCK_CACHE", str(tmp_path / "blocks.sqlite"))
+    monkeypatch.setenv("DANDI_BLOCK_CACHE_BLOCK_SIZE", "1024")
+    cache = BlockCache.from_environ()
+    assert cache is not None
+    assert cache.block_size == 1024
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+import shutil
+import sqlite3
+from typing import NoReturn
+
+import pytest
+
+from ..content_cache import (
+    ContentCache,
+    dumps_json,
+    export_content_cache,
+    import_content_cache,
+    loads_json,
+)
+from ..digests import get_digest
+from ... import pynwb_utils
+from ...metadata import nwb
+from ...misctypes import (
+    DUMMY_DANDI_ETAG,
+    Digest,
+    LocalReadableFile,
+    RemoteReadableAsset,
+)
+from ...validate._types import (
+    Origin,
+    OriginType,
+    Scope,
+    Severity,
+    ValidationResult,
+    Validator,
+)
+
+
+def test_content_cache(tmp_path: Path) -> None:
+    db = tmp_path / "cache.sqlite"
+    cache = ContentCache("test", tokens=["1.0"], db_path=db)
+    with pytest.raises(KeyError):
+        cache.get("abc")
+    cache.set("abc", {"a": [1, 2]})
+    cache.set("abc", "other", args=[True])
+    assert cache.get("abc") == {"a": [1, 2]}
+    assert cache.get("abc", args=[True]) == "other"
+    with pytest.raises(KeyError):
+        ContentCache("test", tokens=["2.0"], db_path=db).get("abc")
+    with pytest.raises(KeyError):
+        ContentCache("other", tokens=["1.0"], db_path=db).get("abc")
+
+    exported = tmp_path / "exported.sqlite"
+    assert export_content_cache(exported, db_path=db) == 2
+    db2 = tmp_path / "cache2.sqlite"
+    assert import_content_cache(exported, db_path=db2) == 2
+    assert ContentCache("test", tokens=["1.0"], db_path=db2).get("abc") == {"a": [1, 2]}
+
+
+def test_json_roundtrip() -> None:
+    value = {
+        "session_start_time": datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "experimenter": ("Alice", "Bob"),
+        "keywords": ["a", 1, 2.5, None, True],
+        "external_file_objects": [
+            {"id": "x", "external_files": [PurePosixPath("video.mp4")]}
+        ],
+    }
+    assert loads_json(dumps_json(value)) == value
+    with pytest.raises(TypeError):
+        dumps_json({"x": object()})
+    with pytest.raises(TypeError):
+        dumps_json({1: "x"})
+
+
+def test_content_cache_unencodable(tmp_path: Path) -> None:
+    db = tmp_path / "cache.sqlite"
+    cache = ContentCache("test", db_path=db)
+    cache.set("abc", {"x": object()})
+    with pytest.raises(KeyError):
+        cache.get("abc")
+    # A result that cannot be decoded (e.g., stored in an older format) is
+    # treated as missing
+    cache.set("abc", "value")
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE results SET value = ?", ("not json",))
+    conn.close()
+    with pytest.raises(KeyError):
+        cache.get("abc")
+
+
+def test_content_cache_get_digest(
+    simple1_nwb: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ContentCache("test", db_path=tmp_path / "cache.sqlite")
+    etag = get_digest(simple1_nwb, digest="dandi-etag")
+    assert cache.get_digest(simple1_nwb) == etag
+    assert cache.get_digest(LocalReadableFile(simple1_nwb)) == etag
+    remote = RemoteReadableAsset(
+        url="https://example.com/blob", size=0, mtime=None, name="file.nwb"
+    )
+    assert cache.get_digest(remote) is None
+    assert cache.get_digest(remote, Digest.dandi_etag(etag)) == etag
+    assert cache.get_digest(remote, DUMMY_DANDI_ETAG) is None
+    assert cache.get_digest(remote, Digest.dandi_etag("0" * 32 + "-1")) is None
+    assert cache.get_digest(remote, Digest.dandi_zarr("0" * 32 + "-0--0")) is None
+    monkeypatch.setenv("DANDI_CACHE", "ignore")
+    assert cache.get_digest(remote, Digest.dandi_etag(etag)) is None
+
+
+def test_content_cache_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DANDI_CONTENT_CACHE", raising=False)
+    cache = ContentCache("test")
+    assert not cache.enabled
+    with pytest.raises(ValueError):
+        export_content_cache("exported.sqlite")
+
+
+def test_content_cache_moved_file(
+    simple1_nwb: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DANDI_CONTENT_CACHE", str(tmp_path / "cache.sqlite"))
+    # A fresh copy, for which the path-keyed caches hold no results
+    path = tmp_path / "file.nwb"
+    shutil.copy(simple1_nwb, path)
+    metadata = nwb._get_nwb_metadata(LocalReadableFile(path))
+    errors = pynwb_utils.validate(path)
+
+    moved = tmp_path / "moved" / "file.nwb"
+    moved.parent.mkdir()
+    shutil.copy(path, moved)
+
+    def fail(*_args: object, **_kwargs: object) -> NoReturn:
+        raise AssertionError("Cached result not used")
+
+    monkeypatch.setattr(nwb, "NWBMetadataSession", fail)
+    monkeypatch.setattr(pynwb_utils, "_validate", fail)
+    assert nwb._get_nwb_metadata(LocalReadableFile(moved)) == metadata
+    moved_errors = pynwb_utils.validate(moved)
+    assert [e.id for e in moved_errors] == [e.id for e in errors]
+    assert all(e.path == moved for e in moved_errors)
+
+    # A remote copy of the file, whose etag is reported by the server
+    remote = RemoteReadableAsset(
+        url="https://example.com/blob",
+        size=simple1_nwb.stat().st_size,
+        mtime=None,
+        name="file.nwb",
+    )
+    digest = Digest.dandi_etag(get_digest(simple1_nwb, digest="dandi-etag"))
+    assert nwb._get_nwb_metadata(remote, digest) == metadata
+
+
+def test_content_cache_validation_results(
+    simple1_nwb: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DANDI_CONTENT_CACHE", str(tmp_path / "cache.sqlite"))
+    # A fresh copy, for which the path-keyed cache holds no results
+    path = tmp_path / "file.nwb"
+    shutil.copy(simple1_nwb, path)
+    result = ValidationResult(
+        origin=Origin(
+            type=OriginType.VALIDATION,
+            validator=Validator.pynwb,
+            validator_version="1.0",
+        ),
+        severity=Severity.ERROR,
+        id="pynwb.GENERIC",
+        scope=Scope.FILE,
+        origin_result=ValueError("not stored"),
+        path=path,
+        message="first line\nsecond line",
+    )
+    monkeypatch.setattr(pynwb_utils, "_validate", lambda *_args: [result])
+    assert pynwb_utils.validate(path) == [result]
+
+    def fail(*_args: object, **_kwargs: object) -> NoReturn:
+        raise AssertionError("Cached result not used")
+
+    monkeypatch.setattr(pynwb_utils, "_validate", fail)
+    moved = tmp_path / "moved.nwb"
+    shutil.copy(path, moved)
+    (cached,) = pynwb_utils.validate(moved)
+    assert cached.path == moved
+    assert cached.origin_result is None
+    assert cached.model_dump(exclude={"path"}) == result.model_dump(exclude={"path"})
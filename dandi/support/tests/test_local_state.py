@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ..local_state import ENVVAR, STATE_PATH, LocalState
+from ...consts import dandiset_metadata_file
+from ...move import MoveExisting, MoveWorkOn, move
+
+
+@pytest.fixture
+def dandiset_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(ENVVAR, "1")
+    monkeypatch.delenv("DANDI_CACHE", raising=False)
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000027'\n")
+    (tmp_path / "sub-1").mkdir()
+    (tmp_path / "sub-1" / "a.txt").write_text("a\n")
+    (tmp_path / "sub-1" / "b.txt").write_text("b\n")
+    (tmp_path / "c.txt").write_text("c\n")
+    return tmp_path
+
+
+def bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+
+
+def test_for_dandiset(
+    tmp_path: Path, dandiset_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert LocalState.for_dandiset(tmp_path / "sub-1") is None
+    state = LocalState.for_dandiset(dandiset_path)
+    assert state is not None
+    assert LocalState.for_dandiset(dandiset_path) is state
+    monkeypatch.setenv("DANDI_CACHE", "ignore")
+    assert LocalState.for_dandiset(dandiset_path) is None
+
+
+def test_for_dandiset_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(ENVVAR, raising=False)
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000027'\n")
+    assert LocalState.for_dandiset(tmp_path) is None
+    (tmp_path / STATE_PATH).parent.mkdir()
+    (tmp_path / STATE_PATH).touch()
+    assert LocalState.for_dandiset(tmp_path) is not None
+
+
+def test_get_update(dandiset_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = LocalState.for_dandiset(dandiset_path)
+    assert state is not None
+    assert state.get("c.txt") is None
+    state.update("c.txt", dandi_etag="etag")
+    fstate = state.get("c.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag == "etag"
+    assert fstate.remote_asset_id is None
+    state.update("c.txt", remote_asset_id="asset1")
+    fstate = state.get("c.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag == "etag"
+    assert fstate.remote_asset_id == "asset1"
+    monkeypatch.setenv("DANDI_CACHE", "clear")
+    assert state.get("c.txt") is None
+    monkeypatch.delenv("DANDI_CACHE")
+    # Values recorded for an earlier state of a file are discarded
+    (dandiset_path / "c.txt").write_text("changed\n")
+    bump_mtime(dandiset_path / "c.txt")
+    assert state.get("c.txt") is None
+    state.update("c.txt", dandi_etag="etag2")
+    fstate = state.get("c.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag == "etag2"
+    assert fstate.remote_asset_id is None
+    with pytest.raises(TypeError):
+        state.update("c.txt", etag="etag")
+    # Records of files that no longer exist are deleted
+    (dandiset_path / "c.txt").unlink()
+    state.update("c.txt", dandi_etag="etag2")
+    (dandiset_path / "c.txt").write_text("changed\n")
+    bump_mtime(dandiset_path / "c.txt")
+    state.update("c.txt", remote_asset_id="asset2")
+    fstate = state.get("c.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag is None
+
+
+def test_rename_remove(dandiset_path: Path) -> None:
+    state = LocalState.for_dandiset(dandiset_path)
+    assert state is not None
+    for p in ["c.txt", "sub-1/a.txt", "sub-1/b.txt"]:
+        state.update(p, dandi_etag=p)
+    (dandiset_path / "sub-1").rename(dandiset_path / "sub-2")
+    state.rename("sub-1", "sub-2")
+    fstate = state.get("sub-2/a.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag == "sub-1/a.txt"
+    state.remove("sub-2")
+    assert state.get("sub-2/a.txt") is None
+    assert state.get("sub-2/b.txt") is None
+    assert state.get("c.txt") is not None
+
+
+def test_move_record_state(
+    dandiset_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    state = LocalState.for_dandiset(dandiset_path)
+    assert state is not None
+    state.update("sub-1/a.txt", dandi_etag="etag", remote_asset_id="asset1")
+    state.update("sub-1/b.txt", dandi_etag="etag2")
+    monkeypatch.chdir(dandiset_path)
+    move("sub-1/a.txt", dest="c2.txt", work_on=MoveWorkOn.LOCAL, devel_debug=True)
+    assert state.get("sub-1/a.txt") is None
+    fstate = state.get("c2.txt")
+    assert fstate is not None
+    assert fstate.dandi_etag == "etag"
+    assert fstate.remote_asset_id == "asset1"
+    move(
+        "c.txt",
+        dest="sub-1/b.txt",
+        work_on=MoveWorkOn.LOCAL,
+        existing=MoveExisting.OVERWRITE,
+        devel_debug=True,
+    )
+    assert state.get("sub-1/b.txt") is None
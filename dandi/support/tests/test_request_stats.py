@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import responses
+
+from ..request_stats import endpoint_template, request_stats
+from ...dandiapi import RESTFullAPIClient
+
+
+@pytest.mark.parametrize(
+    "path,template",
+    [
+        ("/api/dandisets/000027/", "/api/dandisets/{n}/"),
+        (
+            "/api/dandisets/000027/versions/0.210831.2033/assets/",
+            "/api/dandisets/{n}/versions/{version}/assets/",
+        ),
+        (
+            "/api/assets/2dbaf0fd-5003-4a0a-b4c0-bc8cdbdb3826/download/",
+            "/api/assets/{uuid}/download/",
+        ),
+        (
+            "/blobs/2db/af0/2dbaf0fd-5003-4a0a-b4c0-bc8cdbdb3826",
+            "/blobs/{xxx}/{xxx}/{uuid}",
+        ),
+        (
+            "/zarr/2dbaf0fd-5003-4a0a-b4c0-bc8cdbdb3826/a/b/c/d/e/f/0/0",
+            "/zarr/{uuid}/a/b/c/d/e/f/...",
+        ),
+        ("", "/"),
+    ],
+)
+def test_endpoint_template(path: str, template: str) -> None:
+    assert endpoint_template(path) == template
+
+
+@responses.activate
+def test_request_stats(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(request_stats, "output", None)
+    # Disabled instrumentation does not install any hooks:
+    with RESTFullAPIClient("https://test.nil") as client:
+        assert client.session.hooks["response"] == []
+    outfile = tmp_path / "stats.json"
+    monkeypatch.setattr(request_stats, "output", str(outfile))
+    monkeypatch.setattr(request_stats, "_stats", {})
+    responses.add(responses.GET, "https://test.nil/api/assets/1/", status=503)
+    responses.add(
+        responses.GET,
+        "https://test.nil/api/assets/1/",
+        json={"foo": "bar"},
+        headers={"Content-Length": "14"},
+    )
+    responses.add(responses.PUT, "https://test.nil/api/assets/2/", json={})
+    with RESTFullAPIClient("https://test.nil/api") as client:
+        assert client.get("/assets/1/") == {"foo": "bar"}
+        client.put("/assets/2/", data=b"12345")
+    request_stats.dump()
+    data = json.loads(outfile.read_text())
+    get_stats, put_stats = data["requests"]
+    assert get_stats["method"] == "GET"
+    assert get_stats["host"] == "https://test.nil"
+    assert get_stats["endpoint"] == "/api/assets/{n}/"
+    assert get_stats["count"] == 2
+    assert get_stats["retries"] == 1
+    assert get_stats["status_codes"] == {"200": 1, "503": 1}
+    assert get_stats["bytes_received"] == 14
+    assert sum(get_stats["latency"]["histogram"].values()) == 2
+    assert put_stats["method"] == "PUT"
+    assert put_stats["count"] == 1
+    assert put_stats["retries"] == 0
+    assert put_stats["bytes_sent"] == 5
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from threading import Thread
+import time
+
+import pytest
+import requests
+
+from ..throttle import HostThrottle, get_host_throttle
+from ...exceptions import CircuitOpenError
+
+
+def mkresponse(status: int, retry_after: str | None = None) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status
+    if retry_after is not None:
+        r.headers["Retry-After"] = retry_after
+    return r
+
+
+def test_get_host_throttle() -> None:
+    t = get_host_throttle("https://test.nil/api/foo/")
+    assert t.host == "https://test.nil"
+    assert get_host_throttle("https://test.nil/bar") is t
+    assert get_host_throttle("https://other.nil/api/foo/") is not t
+
+
+def test_retry_after_pauses_all_threads() -> None:
+    throttle = HostThrottle("https://test.nil")
+    with throttle.slot():
+        throttle.record_response(mkresponse(429, "1"))
+    waited: list[float] = []
+
+    def request() -> None:
+        start = time.monotonic()
+        with throttle.slot():
+            waited.append(time.monotonic() - start)
+
+    threads = [Thread(target=request) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(waited) == 3
+    assert all(w >= 0.8 for w in waited)
+
+
+def test_concurrency_reduction_and_recovery() -> None:
+    throttle = HostThrottle("https://test.nil")
+    slots = [throttle.slot() for _ in range(8)]
+    for s in slots:
+        s.__enter__()
+    throttle.record_response(mkresponse(503))
+    for s in slots:
+        s.__exit__(None, None, None)
+    assert throttle.limit == 4
+    assert throttle.ceiling == 8
+    # A further throttling response halves the limit again:
+    throttle.record_response(mkresponse(429))
+    assert throttle.limit == 2
+    # Successful requests gradually restore the original concurrency:
+    for _ in range(100):
+        throttle.record_success()
+    assert throttle.limit is None
+
+
+def test_circuit_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    throttle = HostThrottle("https://test.nil", failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        throttle.record_response(mkresponse(500))
+    throttle.record_success()
+    for _ in range(2):
+        throttle.record_response(mkresponse(500))
+    # Not tripped, as the failures were not consecutive:
+    with throttle.slot():
+        pass
+    throttle.record_failure()
+    with pytest.raises(CircuitOpenError):
+        with throttle.slot():
+            pass
+    # After the reset timeout, a single probe request is allowed through:
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    with throttle.slot():
+        with pytest.raises(CircuitOpenError):
+            with throttle.slot():
+                pass
+        throttle.record_response(mkresponse(200))
+    assert throttle.opened_at is None
+    with throttle.slot():
+        pass
@@ -0,0 +1,203 @@
+"""
+Per-host throttling state shared among all threads of the process.
+
+Each request made through a `~dandi.dandiapi.RESTFullAPIClient` goes through
+the `HostThrottle` for the request's host, which:
+
+- pauses all new requests to the host once any response asks for it via a
+  ``Retry-After`` header (as sent with 429 and 503 responses when the server
+  is overloaded);
+
+- upon such throttling, halves the number of requests allowed to be in flight
+  to the host at once, after which the limit is raised again gradually (by
+  about one request per round of successful requests) until the original
+  concurrency is restored;
+
+- acts as a circuit breaker: after `CIRCUIT_BREAKER_THRESHOLD` consecutive
+  failed requests (retryable error statuses or connection errors) the circuit
+  "opens", and requests fail immediately with `CircuitOpenError` for
+  `CIRCUIT_BREAKER_RESET` seconds.  After that, a single probe request is let
+  through; if it succeeds the circuit closes again, otherwise it stays open
+  for another period.  As `CircuitOpenError` is a `requests.ConnectionError`,
+  callers' usual retry logic applies to it, but retried attempts do not reach
+  the host while the circuit is open.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import math
+from threading import Condition, Lock
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+from .. import get_logger
+from ..consts import CIRCUIT_BREAKER_RESET, CIRCUIT_BREAKER_THRESHOLD, RETRY_STATUSES
+from ..exceptions import CircuitOpenError
+from ..utils import get_retry_after
+
+lgr = get_logger()
+
+
+class HostThrottle:
+    """Rate-limiting & circuit-breaking state for a single host"""
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        #: Time (per `time.monotonic()`) until which new requests are paused
+        self.paused_until = 0.0
+        #: Number of requests currently in flight
+        self.in_flight = 0
+        #: Maximum number of requests allowed in flight, or `None` if unlimited
+        self.limit: float | None = None
+        #: Concurrency at the time of the last throttling, to which the limit
+        #: recovers
+        self.ceiling = 0
+        #: Number of consecutive failed requests
+        self.failures = 0
+        #: Time (per `time.monotonic()`) at which the circuit was opened, or
+        #: `None` if it is closed
+        self.opened_at: float | None = None
+        self._probing = False
+        self._cond = Condition(Lock())
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Wait until a request may be sent to the host and hold a slot among the
+        in-flight requests while it is made
+
+        :raises CircuitOpenError: if the circuit breaker is open
+        """
+        probe = False
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.opened_at is not None:
+                    if now - self.opened_at < self.reset_timeout or self._probing:
+                        raise CircuitOpenError(
+                            f"Too many failed requests to {self.host}; not sending"
+                            " more requests for now"
+                        )
+                    lgr.info("Sending probe request to %s", self.host)
+                    self._probing = probe = True
+                    break
+                if now < self.paused_until:
+                    self._cond.wait(self.paused_until - now)
+                elif self.limit is not None and self.in_flight >= self.limit:
+                    self._cond.wait()
+                else:
+                    break
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                if probe:
+                    self._probing = False
+                self._cond.notify_all()
+
+    def record_response(self, r: requests.Response) -> None:
+        """Update the state based on a response received from the host"""
+        if r.status_code in RETRY_STATUSES:
+            retry_after = get_retry_after(r)
+            with self._cond:
+                if retry_after is not None and retry_after > 0:
+                    self.paused_until = max(
+                        self.paused_until, time.monotonic() + retry_after
+                    )
+                    lgr.debug(
+                        "Pausing requests to %s for %d seconds as instructed by"
+                        " %d response",
+                        self.host,
+                        retry_after,
+                        r.status_code,
+                    )
+                if r.status_code in (429, 503):
+                    self._reduce_concurrency()
+                self._record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self) -> None:
+        with self._cond:
+            self.failures = 0
+            if self.opened_at is not None:
+                lgr.info("Requests to %s succeed again; closing circuit", self.host)
+                self.opened_at = None
+            if self.limit is not None:
+                self.limit += 1 / self.limit
+                if self.limit >= self.ceiling:
+                    self.limit = None
+            self._cond.notify_all()
+
+    def record_failure(self) -> None:
+        """Record a failure to get a response from the host at all"""
+        with self._cond:
+            self._record_failure()
+
+    def _record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                lgr.warning(
+                    "%d consecutive requests to %s failed; pausing all requests to"
+                    " it for %d seconds",
+                    self.failures,
+                    self.host,
+                    self.reset_timeout,
+                )
+            self.opened_at = time.monotonic()
+        self._cond.notify_all()
+
+    def _reduce_concurrency(self) -> None:
+        current = self.in_flight if self.limit is None else math.floor(self.limit)
+        if self.limit is None:
+            self.ceiling = max(current, 1)
+        self.limit = max(1, current // 2)
+        lgr.debug(
+            "Reducing number of concurrent requests to %s to %d", self.host, self.limit
+        )
+
+    def send(
+        self, func: Callable[..., requests.Response], *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Call ``func(*args, **kwargs)`` to make a request to the host while
+        holding a slot, and record the outcome
+        """
+        with self.slot():
+            try:
+                r = func(*args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.record_failure()
+                raise
+            self.record_response(r)
+            return r
+
+
+_throttles: dict[str, HostThrottle] = {}
+_throttles_lock = Lock()
+
+
+def get_host_throttle(url: str) -> HostThrottle:
+    """Return the process-wide `HostThrottle` for the host of ``url``"""
+    u = urlsplit(url)
+    host = f"{u.scheme}://{u.netloc}"
+    with _throttles_lock:
+        try:
+            return _throttles[host]
+        except KeyError:
+            return _throttles.setdefault(host, HostThrottle(host))
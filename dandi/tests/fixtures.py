@@ -70,6 +70,19 @@ def capture_all_logs(caplog: pytest.LogCaptureFixture) -> None:
     caplog.set_level(logging.DEBUG, logger="dandi")
 
 
+@pytest.fixture(autouse=True)
+def validation_store_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """
+    Give each test its own validation stores, as tests validating the same
+    files may configure the validators differently
+    """
+    d = tmp_path_factory.mktemp("validation_store")
+    monkeypatch.setenv("DANDI_VALIDATION_STORE", str(d))
+    return d
+
+
 # TODO: move into some common fixtures.  We might produce a number of files
 #       and also carry some small ones directly in git for regression testing
 @pytest.fixture(scope="session")
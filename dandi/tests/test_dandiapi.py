@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import builtins
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import logging
 from pathlib import Path
 import random
 import re
 from shutil import rmtree
+from threading import Thread
 from typing import Any
 
 import anys
@@ -32,6 +34,7 @@ from ..dandiapi import (
     RemoteAsset,
     RemoteBlobAsset,
     RemoteZarrAsset,
+    RESTFullAPIClient,
     Version,
 )
 from ..download import download
@@ -863,6 +866,30 @@ def test_asset_as_readable_open(new_dandiset: SampleDandiset, tmp_path: Path) ->
         fp.close()
 
 
+def test_asset_as_readable_open_block_cache(
+    new_dandiset: SampleDandiset, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DANDI_BLOCK_CACHE", str(tmp_path / "blocks.sqlite"))
+    monkeypatch.setenv("DANDI_BLOCK_CACHE_BLOCK_SIZE", "4")
+    p = tmp_path / "foo.txt"
+    p.write_bytes(b"This is test text.\n")
+    d = new_dandiset.dandiset
+    d.upload_raw_asset(p, {"path": "foo.txt"})
+    (asset,) = d.get_assets()
+    assert isinstance(asset, RemoteBlobAsset)
+    r = asset.as_readable()
+    assert r.blob_id == asset.blob
+    for cached in [False, True]:
+        with r.open() as fp:
+            fp.seek(5)
+            assert fp.read(7) == b"is test"
+            fp.seek(0)
+            assert fp.read() == b"This is test text.\n"
+            stats = fp.raw.stats  # type: ignore[attr-defined]
+            # Everything is fetched on the first read & cached for the second
+            assert (stats.hits > 0, stats.misses > 0) == (cached, not cached)
+
+
 @pytest.mark.parametrize(
     ("instance_name", "expected_env_var_name"),
     [
@@ -879,3 +906,55 @@ def test_get_api_key_env_var(instance_name: str, expected_env_var_name: str) ->
         )
     )
     assert dandi_api_client.api_key_env_var == expected_env_var_name
+
+
+def test_connection_pool_resize_and_stats() -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *_args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        base = f"http://127.0.0.1:{server.server_port}"
+        with RESTFullAPIClient(base, pool_maxsize=2) as client:
+            assert client.pool_maxsize == 2
+            client.set_pool_maxsize(1)
+            assert client.pool_maxsize == 2
+            client.set_pool_maxsize(16)
+            assert client.pool_maxsize == 16
+            for _ in range(3):
+                assert client.get("/info/") == {}
+            (stats,) = client.get_pool_stats()
+            assert stats.host == f"http://127.0.0.1:{server.server_port}"
+            assert stats.maxsize == 16
+            assert stats.requests == 3
+            assert stats.misses == 1
+            assert stats.hits == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_set_pool_maxsize_storage() -> None:
+    instance = DandiInstance(
+        name="example", gui="https://example.com", api="https://api.example.com"
+    )
+    with DandiAPIClient(dandi_instance=instance) as client:
+        client.set_pool_maxsize(12)
+        # The storage client is not created just to be resized ...
+        assert client._storage is None
+        # ... but is sized accordingly once it is created
+        assert client.storage.pool_maxsize == 12
+        client.set_pool_maxsize(20)
+        assert client.storage.pool_maxsize == 20
@@ -16,7 +16,7 @@ from shutil import rmtree
 import time
 from unittest import mock
 
-from dandischema.models import ID_PATTERN
+from dandischema.models import ID_PATTERN, get_schema_version
 import numpy as np
 import pytest
 from pytest_mock import MockerFixture
@@ -24,11 +24,13 @@ import requests
 from requests.exceptions import HTTPError
 import responses
 import zarr
+from zarr_checksum.tree import ZarrChecksumTree
 
 from .fixtures import SampleDandiset, SampleDandisetFactory
 from .skip import mark
 from .test_helpers import TWO_ARRAY_ZARR_LAYOUT, assert_dirtrees_eq, zarr_format_of
-from ..consts import DRAFT, SyncMode, dandiset_metadata_file
+from ..consts import DRAFT, SyncMode, dandiset_metadata_file, known_instances
+from ..dandiapi import BaseRemoteAsset, DandiAPIClient
 from ..dandiarchive import DandisetURL
 from ..download import (
     DownloadDirectory,
@@ -38,11 +40,14 @@ from ..download import (
     PathType,
     ProgressCombiner,
     PYOUTHelper,
+    StorageURLCache,
     _check_attempts_and_sleep,
+    _prune_zarr,
     download,
 )
 from ..exceptions import NotFoundError
-from ..support.digests import Digester
+from ..files import LocalAsset, find_dandi_files
+from ..support.digests import Digester, get_zarr_checksum
 from ..utils import list_paths, yaml_load
 
 
@@ -395,6 +400,78 @@ def test_download_sync_zarr(
     assert not (dspath / "sample.zarr").exists()
 
 
+def test_delete_for_sync(tmp_path: Path) -> None:
+    dl = Downloader(
+        url=DandisetURL(
+            instance=known_instances["dandi"], dandiset_id="000027", version_id=DRAFT
+        ),
+        output_dir=tmp_path,
+        existing=DownloadExisting.ERROR,
+        get_metadata=True,
+        get_assets=True,
+        preserve_tree=False,
+        jobs_per_zarr=None,
+        on_error="raise",
+    )
+    dspath = tmp_path / "000027"
+    for p in [
+        dandiset_metadata_file,
+        "a",
+        "a-b.txt",
+        "a.txt",
+        "b/a.txt",
+        "b/c/d.txt",
+        "b.txt",
+        "bids/.bidsignore",
+        "bids/dataset_description.json",
+        "bids/sub-01/.bidsignore",
+        "bids.txt",
+        "data.zarr/.zgroup",
+        "data.zarr/0/0",
+        "sub/.hidden",
+        "sub/dandiset.yaml",
+        "sub/x.nwb.dandidownload/x.nwb",
+        "z/.bidsignore",
+        "dotdandi.zarr/.dandi/x",
+        "nested.zarr/a/b/0",
+    ]:
+        (dspath / p).parent.mkdir(parents=True, exist_ok=True)
+        (dspath / p).write_text("content\n")
+    (dspath / "empty.zarr").mkdir()
+    (dspath / "emptydirs.zarr" / "a" / "b").mkdir(parents=True)
+    (dspath / "emptydirs.zarr" / "c").mkdir()
+    (dspath / "b-link").symlink_to("b", target_is_directory=True)
+    dl.asset_download_paths.update(["a.txt", "b/c/d.txt", "bids.txt", "gone.txt"])
+    local = dl.list_local_assets()
+    assert local == [
+        "a",
+        "a-b.txt",
+        "a.txt",
+        "b.txt",
+        "b/a.txt",
+        "b/c/d.txt",
+        "bids.txt",
+        "bids/.bidsignore",
+        "bids/dataset_description.json",
+        "bids/sub-01/.bidsignore",
+        "data.zarr",
+        "nested.zarr",
+        "sub/dandiset.yaml",
+    ]
+    # The same assets as found by `find_dandi_files()`, except for the
+    # contents of unfinished downloads
+    assert {
+        df.path
+        for df in find_dandi_files(dspath, dandiset_path=dspath, allow_all=True)
+        if isinstance(df, LocalAsset)
+    } == {*local, "sub/x.nwb.dandidownload/x.nwb"}
+    expected = [
+        dspath / p for p in local if p not in ("a.txt", "b/c/d.txt", "bids.txt")
+    ]
+    assert dl.delete_for_sync(local) == expected
+    assert dl.delete_for_sync() == expected
+
+
 @responses.activate
 def test_download_no_blobDateModified(
     text_dandiset: SampleDandiset, tmp_path: Path
@@ -523,6 +600,40 @@ def test_download_zarr_deletes_orphan_files(
     )
 
 
+@pytest.mark.parametrize("verify", [True, False])
+def test_prune_zarr(tmp_path: Path, verify: bool) -> None:
+    zarr_root = tmp_path / "sample.zarr"
+    remote = ["0/0", "0/1", "1/sub/0", ".zgroup", "zarr.json"]
+    for p in [
+        *remote,
+        "0/orphan",
+        "orphan",
+        "2/3/orphan",
+        "2/4/orphan",
+        ".git/config",
+        "1/sub/.datalad/x",
+    ]:
+        (zarr_root / p).parent.mkdir(parents=True, exist_ok=True)
+        (zarr_root / p).write_text(f"{p}\n")
+    (zarr_root / "empty").mkdir()
+    checksum_tree = ZarrChecksumTree() if verify else None
+    if checksum_tree is not None:
+        # As if "0/0" had been downloaded
+        checksum_tree.add_leaf(
+            Path("0/0"), 4, Digester(["md5"])(zarr_root / "0/0")["md5"]
+        )
+    statuses = list(_prune_zarr(zarr_root, set(remote), checksum_tree, {"0/0"}, jobs=4))
+    assert statuses == [{"status": "deleting extra files"}]
+    assert sorted(
+        p.relative_to(zarr_root).as_posix() for p in zarr_root.rglob("*") if p.is_file()
+    ) == sorted([*remote, ".git/config", "1/sub/.datalad/x"])
+    assert not (zarr_root / "2").exists()
+    assert not (zarr_root / "empty").exists()
+    if checksum_tree is not None:
+        assert str(checksum_tree.process()) == get_zarr_checksum(zarr_root)
+    assert list(_prune_zarr(zarr_root, set(remote), None, set(), jobs=4)) == []
+
+
 def test_download_different_zarr(tmp_path: Path, zarr_dandiset: SampleDandiset) -> None:
     dd = tmp_path / zarr_dandiset.dandiset_id
     dd.mkdir()
@@ -1380,3 +1491,107 @@ def test__check_attempts_and_sleep_retries(status_code: int) -> None:
         mock_sleep.assert_called_once()
         # and we do not sleep really
         assert not mock_sleep.call_args.args[0]
+
+
+def _mock_test_server() -> DandiAPIClient:
+    responses.add(
+        responses.GET,
+        "https://test.nil/server-info",
+        json={
+            "schema_version": get_schema_version(),
+            "version": "0.0.0",
+            "services": {
+                "api": {"url": "https://test.nil/api"},
+            },
+            "cli-minimal-version": "0.0.0",
+            "cli-bad-versions": [],
+        },
+    )
+    return DandiAPIClient("https://test.nil/api")
+
+
+def _mock_blob_asset(client: DandiAPIClient, n: int) -> BaseRemoteAsset:
+    return BaseRemoteAsset.from_base_data(
+        client,
+        {
+            "asset_id": f"asset-{n}",
+            "blob": f"blob-{n}",
+            "path": f"file{n}.txt",
+            "size": 5,
+            "created": "2021-01-01T00:00:00Z",
+            "modified": "2021-01-01T00:00:00Z",
+        },
+    )
+
+
+@responses.activate
+def test_storage_url_cache_prefetch() -> None:
+    client = _mock_test_server()
+    assets = [_mock_blob_asset(client, n) for n in range(3)]
+    # Storage URL available in metadata:
+    responses.add(
+        responses.GET,
+        "https://test.nil/api/assets/asset-0/",
+        json={
+            "contentUrl": [
+                "https://test.nil/api/assets/asset-0/download/",
+                "https://storage.nil/blobs/blob-0",
+            ]
+        },
+    )
+    # Storage URL must be determined by following the redirect:
+    responses.add(
+        responses.GET,
+        "https://test.nil/api/assets/asset-1/",
+        json={"contentUrl": ["https://test.nil/api/assets/asset-1/download/"]},
+    )
+    responses.add(
+        responses.HEAD,
+        "https://test.nil/api/assets/asset-1/download/",
+        status=302,
+        headers={"Location": "https://storage.nil/blobs/blob-1?signature=abc"},
+    )
+    responses.add(responses.GET, "https://test.nil/api/assets/asset-2/", status=404)
+    cache = StorageURLCache(batch_size=2)
+    prefetched = list(cache.prefetch(iter(assets)))
+    assert [a for a, _ in prefetched] == assets
+    assert isinstance(prefetched[0][1], dict)
+    assert isinstance(prefetched[1][1], dict)
+    assert isinstance(prefetched[2][1], NotFoundError)
+    assert cache.get(assets[0]) == "https://storage.nil/blobs/blob-0"
+    assert cache.get(assets[1]) == "https://storage.nil/blobs/blob-1?signature=abc"
+    assert cache.get(assets[2]) is None
+    # Cached URLs are not resolved again:
+    list(cache.prefetch([assets[1]]))
+    responses.assert_call_count("https://test.nil/api/assets/asset-1/download/", 1)
+
+
+@responses.activate
+def test_download_file_iter_storage_url() -> None:
+    client = _mock_test_server()
+    client.session.headers["Authorization"] = "token secret"
+    asset = _mock_blob_asset(client, 0)
+    responses.add(responses.GET, "https://storage.nil/blobs/blob-0", body=b"hello")
+    downloader = asset.get_download_file_iter(
+        storage_url="https://storage.nil/blobs/blob-0"
+    )
+    assert b"".join(downloader(0)) == b"hello"
+    responses.assert_call_count("https://storage.nil/blobs/blob-0", 1)
+    assert "Authorization" not in responses.calls[-1].request.headers
+
+
+@responses.activate
+def test_download_file_iter_storage_url_fallback() -> None:
+    client = _mock_test_server()
+    asset = _mock_blob_asset(client, 0)
+    responses.add(responses.GET, "https://storage.nil/blobs/blob-0", status=403)
+    responses.add(
+        responses.GET, "https://test.nil/api/assets/asset-0/download/", body=b"hello"
+    )
+    downloader = asset.get_download_file_iter(
+        storage_url="https://storage.nil/blobs/blob-0"
+    )
+    assert b"".join(downloader(0)) == b"hello"
+    # Once rejected, the storage URL is not tried again:
+    assert b"".join(downloader(0)) == b"hello"
+    responses.assert_call_count("https://storage.nil/blobs/blob-0", 1)
@@ -3,17 +3,21 @@ from __future__ import annotations
 from operator import attrgetter
 import os
 from pathlib import Path
+import shutil
 import subprocess
+import time
+from typing import Any
 from unittest.mock import ANY
 
 from dandischema.models import get_schema_version
+import h5py
 import numpy as np
 import pytest
 import zarr
 
 from .fixtures import SampleDandiset
 from .test_helpers import TWO_ARRAY_ZARR_LAYOUT, zarr_format_of
-from .. import get_logger
+from .. import get_logger, pynwb_utils
 from ..consts import ZARR_MIME_TYPE, dandiset_metadata_file
 from ..dandiapi import AssetType, RemoteZarrAsset
 from ..exceptions import UnknownAssetError
@@ -27,9 +31,12 @@ from ..files import (
     VideoAsset,
     ZarrAsset,
     ZarrBIDSAsset,
+    bases,
     dandi_file,
     find_dandi_files,
 )
+from ..files import zarr as zarr_mod
+from ..pynwb_utils import NWBMetadataSession
 
 lgr = get_logger()
 
@@ -311,6 +318,80 @@ def test_find_dandi_files_with_bids(tmp_path: Path) -> None:
         assert asset.bids_dataset_description is bidsdd
 
 
+def test_find_dandi_files_breadth_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mkpaths(
+        tmp_path,
+        dandiset_metadata_file,
+        "a/b/c/d.nwb",
+        "a/b/e.nwb",
+        "a/f.nwb",
+        "g/h.zarr/.zattrs",
+        "g/i/j.nwb",
+        "k.nwb",
+        "empty/",
+    )
+
+    def found() -> list[tuple[type, Path]]:
+        return [
+            (type(df), df.filepath)
+            for df in find_dandi_files(tmp_path, dandiset_path=tmp_path)
+        ]
+
+    files = found()
+    # Files are yielded breadth-first however many threads scan directories
+    depths = [len(fp.relative_to(tmp_path).parts) for _, fp in files]
+    assert depths == sorted(depths)
+    assert sorted(files, key=lambda f: f[1]) == [
+        (NWBAsset, tmp_path / "a" / "b" / "c" / "d.nwb"),
+        (NWBAsset, tmp_path / "a" / "b" / "e.nwb"),
+        (NWBAsset, tmp_path / "a" / "f.nwb"),
+        (ZarrAsset, tmp_path / "g" / "h.zarr"),
+        (NWBAsset, tmp_path / "g" / "i" / "j.nwb"),
+        (NWBAsset, tmp_path / "k.nwb"),
+    ]
+    monkeypatch.setattr("dandi.files._SCAN_THREADS", 1)
+    assert found() == files
+
+
+def test_find_dandi_files_symlinked_dir(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    mkpaths(tmp_path, dandiset_metadata_file, "real/a.nwb")
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    files = [df.filepath for df in find_dandi_files(tmp_path, dandiset_path=tmp_path)]
+    assert files == [tmp_path / "real" / "a.nwb"]
+    assert "Ignoring unsupported symbolic link to directory" in caplog.text
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(1800)
+def test_find_dandi_files_benchmark(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Time finding the files in a tree of 1M entries (1000 directories of 999
+    NWB files each) with directories scanned by one thread and by several
+    """
+    for i in range(1000):
+        d = tmp_path / f"sub-{i:04d}"
+        d.mkdir()
+        for j in range(999):
+            (d / f"sub-{i:04d}_{j:03d}.nwb").touch()
+    timings: dict[int, float] = {}
+    for threads in [1, 8]:
+        monkeypatch.setattr("dandi.files._SCAN_THREADS", threads)
+        start = time.perf_counter()
+        n = sum(1 for _ in find_dandi_files(tmp_path, dandiset_path=tmp_path))
+        timings[threads] = time.perf_counter() - start
+        assert n == 999_000
+    print(
+        "Time to find 999,000 files: "
+        + ", ".join(f"{t} thread(s): {s:.2f}s" for t, s in timings.items())
+    )
+
+
 # This test sometimes fails and sometimes passes when running on NFS.
 @pytest.mark.flaky(reruns=10)
 def test_dandi_file_zarr_with_excluded_dotfiles(tmp_path: Path) -> None:
@@ -378,6 +459,112 @@ def test_validate_simple3_no_subject_id(simple3_nwb: Path) -> None:
     assert errmsgs == ["subject_id is missing."]
 
 
+def test_validate_nwb_opens_file_once(
+    simple3_nwb: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "simple3.nwb"
+    shutil.copy(simple3_nwb, path)
+    opened: list[Any] = []
+
+    class CountingFile(h5py.File):
+        def __init__(self, name: Any, *args: Any, **kwargs: Any) -> None:
+            opened.append(name)
+            super().__init__(name, *args, **kwargs)
+
+    monkeypatch.setattr(h5py, "File", CountingFile)
+    errors = dandi_file(path).get_validation_errors()
+    assert [e.message for e in errors] == ["subject_id is missing."]
+    assert [Path(p) for p in opened if isinstance(p, (str, Path))] == [path]
+
+
+def test_validate_nwb_loads_inspector_config_once(
+    simple3_nwb: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import nwbinspector
+
+    calls = []
+    load_config = nwbinspector.load_config
+
+    def counting_load_config(*args: Any, **kwargs: Any) -> Any:
+        calls.append(kwargs)
+        return load_config(*args, **kwargs)
+
+    monkeypatch.setattr(nwbinspector, "load_config", counting_load_config)
+    monkeypatch.setattr(bases, "_nwbinspector_checks", None)
+    for _ in range(2):
+        errors = dandi_file(simple3_nwb).get_validation_errors()
+        assert [e.id for e in errors] == ["NWBI.check_subject_id_exists"]
+    assert calls == [{"filepath_or_keyword": "dandi"}]
+
+
+@pytest.mark.parametrize("fixture", ["simple1_nwb", "simple3_nwb", "simple4_nwb"])
+def test_inspect_nwbfile_shared(request: pytest.FixtureRequest, fixture: str) -> None:
+    """Inspecting the file loaded for validation gives the same messages"""
+    from nwbinspector import Importance, inspect_nwbfile, load_config
+
+    path = request.getfixturevalue(fixture)
+    expected = list(
+        inspect_nwbfile(
+            nwbfile_path=path,
+            skip_validate=True,
+            config=load_config(filepath_or_keyword="dandi"),
+            importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+        )
+    )
+    with NWBMetadataSession(path) as session:
+        pynwb_utils._validate(str(path), False, session)
+        messages = bases._inspect_nwbfile(path, session)
+    assert messages == expected
+
+
+@pytest.mark.benchmark
+def test_validate_nwb_benchmark(
+    simple1_nwb: Path, simple2_nwb: Path, simple3_nwb: Path, simple4_nwb: Path
+) -> None:
+    """
+    Time validating each test NWB file with PyNWB & nwbinspector separately
+    (as before) and with both sharing a single opening of the file
+    """
+    from nwbinspector import Importance, inspect_nwbfile, load_config
+
+    def separate(path: Path) -> None:
+        pynwb_utils._validate(str(path), False)
+        list(
+            inspect_nwbfile(
+                nwbfile_path=path,
+                skip_validate=True,
+                config=load_config(filepath_or_keyword="dandi"),
+                importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+            )
+        )
+
+    def combined(path: Path) -> None:
+        with NWBMetadataSession(path) as session:
+            pynwb_utils._validate(str(path), False, session)
+            bases._inspect_nwbfile(path, session)
+
+    paths = [simple1_nwb, simple2_nwb, simple3_nwb, simple4_nwb]
+    timings: dict[str, float] = {}
+    for name, func in [("separate", separate), ("combined", combined)]:
+        # Warm up the caches of namespaces & validators:
+        for p in paths:
+            func(p)
+        best = []
+        for p in paths:
+            ts = []
+            for _ in range(5):
+                start = time.perf_counter()
+                func(p)
+                ts.append(time.perf_counter() - start)
+            best.append(min(ts))
+        timings[name] = sum(best) / len(best)
+    print(
+        "Mean time per file: "
+        + ", ".join(f"{name}: {t * 1000:.1f}ms" for name, t in timings.items())
+    )
+    assert timings["combined"] < timings["separate"]
+
+
 def test_validate_bogus(tmp_path):
     """
     Notes
@@ -570,6 +757,81 @@ def test_validate_zarr_deep_via_excluded_dotfiles(tmp_path: Path) -> None:
     assert zf.get_validation_errors() == []
 
 
+def test_validate_zarr3_single_walk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    The format, the depth, and the metadata of a Zarr V3 store are obtained
+    from a single walk, reading each zarr.json outside of arrays once
+    """
+    zarr_path = tmp_path / "foo.zarr"
+    group = zarr.open_group(zarr_path, mode="w", zarr_format=3)
+    for i in range(3):
+        sub = group.create_group(f"g{i}")
+        sub.create_array("arr", shape=(10,), chunks=(5,), dtype="i4")[:] = np.arange(10)
+    mkpaths(zarr_path, "g0/a/b/c/d/e/f/g/h.txt")
+    zf = dandi_file(zarr_path)
+    assert isinstance(zf, ZarrAsset)
+
+    def fail(*_args: Any) -> Any:
+        raise AssertionError("Tree walked more than once")
+
+    monkeypatch.setattr(zarr_mod, "get_zarr_format_version", fail)
+    monkeypatch.setattr(ZarrAsset, "_is_too_deep", fail)
+    read: list[Path] = []
+    read_text = Path.read_text
+
+    def counting_read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+        read.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert [e.id for e in zf.get_validation_errors()] == [
+        "dandi_zarr.tree_depth_exceeded"
+    ]
+    assert sorted(read) == sorted(zarr_path.glob("**/zarr.json"))
+    assert len(read) == 7
+
+
+@pytest.mark.benchmark
+def test_validate_zarr3_arrays_benchmark(tmp_path: Path) -> None:
+    """
+    Time validating a Zarr V3 store with 200 arrays by opening the arrays one
+    after another (as before) and concurrently
+    """
+    import tensorstore as ts
+
+    zarr_path = tmp_path / "pyramid.zarr"
+    group = zarr.open_group(zarr_path, mode="w", zarr_format=3)
+    for i in range(200):
+        group.create_array(f"{i}", shape=(64, 64), chunks=(16, 16), dtype="u2")
+    paths = zarr_mod._scan_zarr_tree(zarr_path).zarr3_arrays
+    assert len(paths) == 200
+
+    def sequential() -> None:
+        for p in paths:
+            spec = {"driver": "zarr3", "kvstore": {"driver": "file", "path": str(p)}}
+            ts.open(spec, read=True, write=False).result()
+
+    def concurrent() -> None:
+        assert zarr_mod._ts_validate_zarr3_arrays(paths) == []
+
+    timings: dict[str, float] = {}
+    for name, func in [("sequential", sequential), ("concurrent", concurrent)]:
+        func()
+        ts_ = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            ts_.append(time.perf_counter() - start)
+        timings[name] = min(ts_)
+    print(
+        "Time to open 200 arrays: "
+        + ", ".join(f"{name}: {t * 1000:.1f}ms" for name, t in timings.items())
+    )
+    assert timings["concurrent"] < timings["sequential"]
+
+
 VALID_STORES_PATH = "data/zarr3_stores/valid_stores"
 
 
@@ -55,6 +55,7 @@ from ..metadata.util import (
     timedelta2duration,
 )
 from ..misctypes import DUMMY_DANDI_ETAG
+from ..pynwb_utils import get_object_id
 from ..utils import ensure_datetime
 
 METADATA_DIR = Path(__file__).with_name("data") / "metadata"
@@ -79,6 +80,7 @@ def test_get_metadata(simple1_nwb: Path, simple1_nwb_metadata: dict[str, Any]) -
     # we do not populate any subject fields in our simple1_nwb
     for f in metadata_nwb_subject_fields:
         target_metadata[f] = None
+    target_metadata["object_id"] = get_object_id(simple1_nwb)
     metadata = get_metadata(simple1_nwb)
     # we also load nwb_version field, so it must not be degenerate and ATM
     # it is 2.X.Y. And since I don't know how to query pynwb on what
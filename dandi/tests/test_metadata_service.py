@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ..metadata.nwb import get_metadata, nwb2asset
+from ..metadata.service import MetadataService
+from ..misctypes import DUMMY_DANDI_ETAG, LocalReadableFile
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_metadata(
+    simple1_nwb: Path, simple2_nwb: Path, tmp_path: Path, jobs: int
+) -> None:
+    missing = tmp_path / "missing.nwb"
+    readable = LocalReadableFile(simple2_nwb)
+    paths: list[Path | LocalReadableFile] = [simple1_nwb, readable, missing]
+    with MetadataService(jobs=jobs) as service:
+        results = dict(service.iter_metadata(paths))
+    assert results[simple1_nwb] == get_metadata(simple1_nwb)
+    assert results[readable] == get_metadata(simple2_nwb)
+    assert isinstance(results[missing], FileNotFoundError)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_iter_assets(simple1_nwb: Path, simple2_nwb: Path, jobs: int) -> None:
+    with MetadataService(jobs=jobs) as service:
+        results = dict(
+            service.iter_assets(
+                [(simple1_nwb, DUMMY_DANDI_ETAG), (simple2_nwb, DUMMY_DANDI_ETAG)]
+            )
+        )
+    for path in [simple1_nwb, simple2_nwb]:
+        expected = nwb2asset(path, digest=DUMMY_DANDI_ETAG)
+        asset = results[path]
+        assert not isinstance(asset, Exception)
+        # Generated in a different process at a different time:
+        exclude = {"dateModified", "wasGeneratedBy"}
+        assert asset.model_dump(exclude=exclude) == expected.model_dump(
+            exclude=exclude
+        )
+
+
+def test_service_reuses_workers(simple1_nwb: Path) -> None:
+    with MetadataService(jobs=2) as service:
+        pids = {service.submit(_getpid).result() for _ in range(4)}
+        assert service.get_metadata(simple1_nwb).result() == get_metadata(
+            simple1_nwb
+        )
+        pids.update(service.submit(_getpid).result() for _ in range(4))
+    assert len(pids) <= 2
+
+
+def _getpid() -> int:
+    import os
+
+    return os.getpid()
@@ -12,11 +12,13 @@ import pytest
 import ruamel.yaml
 
 from .xfail import mark_xfail_windows_python313_posixsubprocess
+from .. import pynwb_utils
 from ..cli.cmd_organize import organize
 from ..consts import dandiset_metadata_file
 from ..organize import (
     CopyMode,
     FileOperationMode,
+    _assign_obj_id,
     _sanitize_value,
     create_dataset_yml_template,
     create_unique_filenames_from_metadata,
@@ -243,6 +245,19 @@ def test_ambiguous(
     )
 
 
+def test_assign_obj_id_from_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(_path: Any) -> NoReturn:
+        raise AssertionError("File reopened to get its object_id")
+
+    monkeypatch.setattr(pynwb_utils, "get_object_id", fail)
+    metadata = [
+        {"path": "a.nwb", "dandi_path": "sub-1/sub-1.nwb", "object_id": "abc"},
+        {"path": "b.nwb", "dandi_path": "sub-1/sub-1.nwb", "object_id": "def"},
+    ]
+    _assign_obj_id(metadata, {"sub-1/sub-1.nwb"})
+    assert [r["obj_id"] for r in metadata] == [get_obj_id("abc"), get_obj_id("def")]
+
+
 def test_ambiguous_probe1() -> None:
     base = dict(subject_id="1", session="2", extension="nwb")
     # fake filenames should be ok since we never should get to reading them for object_id
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+from collections import Counter, OrderedDict
 from collections.abc import Callable
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import re
+import time
 from typing import Any, NoReturn
 
+from dateutil.tz import tzutc
+import h5py
+from hdmf.common import DynamicTable
 import numpy as np
+import pynwb
 from pynwb import NWBHDF5IO, NWBFile, TimeSeries
+from pynwb.file import Subject
+from pynwb.image import ImageSeries
+import pytest
 
-from ..pynwb_utils import _sanitize_nwb_version, nwb_has_external_links
+from .. import pynwb_utils
+from ..misctypes import LocalReadableFile
+from ..pynwb_utils import (
+    NWBMetadataSession,
+    _get_h5py_metadata,
+    _get_pynwb_metadata,
+    _H5pyMetadataUnsupported,
+    _sanitize_nwb_version,
+    get_neurodata_types,
+    get_nwb_version,
+    get_object_id,
+    nwb_has_external_links,
+)
 
 
 def test_pynwb_io(simple1_nwb: Path) -> None:
@@ -103,3 +124,306 @@ def test_nwb_has_external_links(tmp_path):
 
     assert not nwb_has_external_links(filename1)
     assert nwb_has_external_links(filename4)
+
+
+def test_nwb_metadata_session(
+    simple1_nwb: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = {
+        "nwb_version": get_nwb_version(simple1_nwb),
+        **_get_pynwb_metadata(simple1_nwb),
+        "nd_types": get_neurodata_types(simple1_nwb),
+        "object_id": get_object_id(simple1_nwb),
+    }
+    object_id = get_object_id(simple1_nwb)
+    opened = []
+
+    def open_readable(r):
+        opened.append(r)
+        return r.open()
+
+    monkeypatch.setattr(pynwb_utils, "open_readable", open_readable)
+    r = LocalReadableFile(simple1_nwb)
+    with NWBMetadataSession(r) as session:
+        assert session.get_metadata() == expected
+        assert session.get_object_id() == object_id
+        assert not session.has_external_links()
+    assert opened == [r]
+    with pytest.raises(RuntimeError):
+        session.h5file
+
+
+def make_rich_nwb(path: Path) -> Path:
+    nwbfile = NWBFile(
+        session_description="rich session",
+        identifier="rich123",
+        session_start_time=datetime(2020, 1, 2, 3, 4, 5, tzinfo=tzutc()),
+        experimenter=["Last, First", "Other, Person"],
+        keywords=["k1", "k2"],
+        related_publications="doi:10.1000/xyz",
+        lab="lab",
+        institution="institution",
+        experiment_description="description",
+        session_id="session1",
+        subject=Subject(
+            subject_id="mouse001",
+            age="P90D",
+            sex="M",
+            species="Mus musculus",
+            date_of_birth=datetime(2019, 10, 4, tzinfo=tzutc()),
+            genotype="wt",
+            strain="C57BL/6J",
+        ),
+    )
+    device = nwbfile.create_device("probe0")
+    group = nwbfile.create_electrode_group(
+        "shank0", description="shank", location="CA1", device=device
+    )
+    for _ in range(3):
+        nwbfile.add_electrode(group=group, location="CA1")
+    nwbfile.add_acquisition(
+        TimeSeries(
+            name="ts", data=np.arange(10.0), unit="V", timestamps=np.linspace(1, 20, 10)
+        )
+    )
+    nwbfile.add_acquisition(
+        ImageSeries(
+            name="video",
+            external_file=["video.mp4", "notes.txt"],
+            format="external",
+            starting_frame=[0, 0],
+            timestamps=[0.0, 1.0],
+        )
+    )
+    nwbfile.add_trial(start_time=0.5, stop_time=2.0)
+    nwbfile.add_trial(start_time=3.0, stop_time=25.0)
+    nwbfile.add_unit(spike_times=[])
+    nwbfile.add_unit(spike_times=[1.0, 2.0])
+    nwbfile.add_unit(spike_times=[0.2, 30.0])
+    module = nwbfile.create_processing_module("behavior", "behavior")
+    module.add(
+        TimeSeries(
+            name="pos", data=np.arange(5.0), unit="m", starting_time=2.0, rate=0.1
+        )
+    )
+    events = DynamicTable(name="events", description="events")
+    events.add_column(name="timestamp", description="event times")
+    events.add_column(name="duration", description="event durations")
+    events.add_row(timestamp=3.0, duration=2.0)
+    events.add_row(timestamp=40.0, duration=30.0)
+    module.add(events)
+    with NWBHDF5IO(path, "w") as io:
+        io.write(nwbfile)
+    return path
+
+
+def assert_h5py_metadata_parity(path: Path) -> None:
+    expected = _get_pynwb_metadata(path)
+    with h5py.File(path, "r") as h5file:
+        assert _get_h5py_metadata(h5file) == expected
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["simple1_nwb", "simple2_nwb", "simple3_nwb", "simple4_nwb", "simple5_nwb"],
+)
+def test_h5py_metadata_parity(request: pytest.FixtureRequest, fixture: str) -> None:
+    assert_h5py_metadata_parity(request.getfixturevalue(fixture))
+
+
+def test_h5py_metadata_parity_rich(tmp_path: Path) -> None:
+    path = make_rich_nwb(tmp_path / "rich.nwb")
+    assert_h5py_metadata_parity(path)
+    with NWBMetadataSession(path) as session:
+        metadata = session.get_metadata()
+    assert metadata["number_of_electrodes"] == 3
+    assert metadata["number_of_units"] == 3
+    assert metadata["experimenter"] == ("Last, First", "Other, Person")
+    assert metadata["external_file_objects"][0]["external_files"] == [
+        PurePosixPath("video.mp4")
+    ]
+    assert (
+        metadata["session_end_time"] - metadata["session_start_time"]
+    ).total_seconds() == 70.0
+
+
+def test_h5py_metadata_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = make_rich_nwb(tmp_path / "rich.nwb")
+    # Pretend that the hdmf-common types (e.g., DynamicTable) come from an
+    # extension
+    monkeypatch.setattr(pynwb_utils, "_H5PY_METADATA_NAMESPACES", frozenset({"core"}))
+    with h5py.File(path, "r") as h5file:
+        with pytest.raises(_H5pyMetadataUnsupported):
+            _get_h5py_metadata(h5file)
+    with NWBMetadataSession(path) as session:
+        metadata = session.get_metadata()
+    with NWBMetadataSession(path, fast=False) as session:
+        assert metadata == session.get_metadata()
+
+
+def test_cached_namespaces(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pynwb_utils, "_namespace_cache", OrderedDict())
+    path1 = make_rich_nwb(tmp_path / "rich1.nwb")
+    path2 = make_rich_nwb(tmp_path / "rich2.nwb")
+    # Make the second file invalid
+    with h5py.File(path2, "r+") as h5file:
+        del h5file["acquisition/ts/data"].attrs["unit"]
+    with h5py.File(path1, "r") as h5file1, h5py.File(path2, "r") as h5file2:
+        assert pynwb_utils._get_type_map(h5file1) is pynwb_utils._get_type_map(h5file2)
+        assert pynwb_utils._get_validator_maps(
+            h5file1
+        ) is pynwb_utils._get_validator_maps(h5file2)
+    with NWBMetadataSession(path1, fast=False) as session:
+        assert session.get_metadata()["number_of_units"] == 3
+    for path in [path1, path2]:
+        errors = pynwb_utils._validate_with_cached_namespaces(str(path))
+        assert list(map(str, errors)) == list(map(str, pynwb.validate(path=path)))
+    assert errors
+
+
+def test_cached_namespaces_bounded(
+    simple1_nwb: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(pynwb_utils, "_namespace_cache", OrderedDict())
+    monkeypatch.setattr(pynwb_utils, "_NAMESPACE_CACHE_SIZE", 2)
+    with h5py.File(simple1_nwb, "r") as h5file:
+        for key in ["a", "b", "a", "c"]:
+            pynwb_utils._cached_by_specifications((key,), h5file, lambda: key)
+    assert [k[0] for k in pynwb_utils._namespace_cache] == ["a", "c"]
+
+
+def scan_neurodata_types_by_values(grp: h5py.Group) -> list[Any]:
+    # Straightforward walk of the hierarchy via the high-level h5py API, as a
+    # reference for the results of `_scan_neurodata_types()`
+    out = []
+    if "neurodata_type" in grp.attrs:
+        out.append(grp.attrs["neurodata_type"])
+    for v in grp.values():
+        if isinstance(v, h5py.Group):
+            out += scan_neurodata_types_by_values(v)
+    return out
+
+
+def make_deep_hierarchy(path: Path, depth: int = 30, width: int = 40) -> Path:
+    with h5py.File(path, "w") as h5file:
+        h5file.attrs["neurodata_type"] = "NWBFile"
+        grp = h5file
+        for i in range(depth):
+            for j in range(width):
+                sub = grp.create_group(f"leaf{j}")
+                sub.attrs["neurodata_type"] = f"Type{j % 7}"
+                sub.create_dataset("data", data=np.arange(3))
+            grp = grp.create_group(f"level{i}")
+            grp.attrs["neurodata_type"] = "Level"
+        h5file["general/device"] = h5py.SoftLink("/level0/leaf1")
+        h5file["general/loop"] = h5py.SoftLink("/general")
+        h5file["general/dangling"] = h5py.SoftLink("/nonexistent")
+    return path
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["simple1_nwb", "simple2_nwb", "simple3_nwb", "simple4_nwb", "simple5_nwb"],
+)
+def test_scan_neurodata_types(request: pytest.FixtureRequest, fixture: str) -> None:
+    with h5py.File(request.getfixturevalue(fixture), "r") as h5file:
+        assert pynwb_utils._scan_neurodata_types(h5file) == Counter(
+            scan_neurodata_types_by_values(h5file)
+        )
+
+
+def test_scan_neurodata_types_rich(tmp_path: Path) -> None:
+    path = make_rich_nwb(tmp_path / "rich.nwb")
+    with h5py.File(path, "r") as h5file:
+        counts = pynwb_utils._scan_neurodata_types(h5file)
+        assert counts == Counter(scan_neurodata_types_by_values(h5file))
+    # The Device is reached both directly & via the ElectrodeGroup's link
+    assert counts["Device"] == 2
+    assert get_neurodata_types(path) == [
+        f"{name} ({n})" if n > 1 else name
+        for name, n in sorted(counts.items())
+        if name != "NWBFile"
+    ]
+
+
+def test_scan_neurodata_types_deep(tmp_path: Path) -> None:
+    path = make_deep_hierarchy(tmp_path / "deep.h5")
+    with h5py.File(path, "r") as h5file:
+        counts = pynwb_utils._scan_neurodata_types(h5file)
+    assert counts["Level"] == 30
+    # The device link is followed, but not the loop or the dangling link
+    assert sum(counts[f"Type{i}"] for i in range(7)) == 30 * 40 + 1
+    with h5py.File(path, "r+") as h5file:
+        del h5file["general/loop"], h5file["general/dangling"]
+        assert counts == Counter(scan_neurodata_types_by_values(h5file))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("depth,width", [(30, 40), (100, 200)])
+def test_scan_neurodata_types_benchmark(
+    tmp_path: Path, depth: int, width: int
+) -> None:
+    path = make_deep_hierarchy(tmp_path / "deep.h5", depth=depth, width=width)
+    with h5py.File(path, "r+") as h5file:
+        # The reference walk does not guard against loops
+        del h5file["general/loop"], h5file["general/dangling"]
+    timings = {}
+    for name, scan in [
+        ("values", lambda f: Counter(scan_neurodata_types_by_values(f))),
+        ("low-level", pynwb_utils._scan_neurodata_types),
+    ]:
+        # Reopen the file each time, so that neither scan benefits from
+        # h5py's caches being warmed up by the other
+        with h5py.File(path, "r") as h5file:
+            start = time.perf_counter()
+            counts = scan(h5file)
+            timings[name] = time.perf_counter() - start
+        assert counts["Level"] == depth
+    print(
+        f"Scanning {depth}x{width} hierarchy: "
+        + ", ".join(f"{name}: {t:.3f}s" for name, t in timings.items())
+    )
+    assert timings["low-level"] < timings["values"]
+
+
+def test_nwb_metadata_session_retry_closes_io(
+    simple1_nwb: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = _get_pynwb_metadata(simple1_nwb)
+    ios: list[NWBHDF5IO] = []
+
+    class FlakyNWBHDF5IO(NWBHDF5IO):
+        def read(self) -> Any:
+            ios.append(self)
+            if len(ios) == 1:
+                raise KeyError("'ndx-missing' not a namespace")
+            return super().read()
+
+    monkeypatch.setattr(pynwb_utils, "NWBHDF5IO", FlakyNWBHDF5IO)
+    monkeypatch.setattr(NWBMetadataSession, "ndtypes_registry", {"ndx-missing": "json"})
+    with NWBMetadataSession(simple1_nwb, fast=False) as session:
+        assert session.get_pynwb_metadata() == expected
+        assert len(ios) == 2
+        assert not ios[0].is_open()
+        assert ios[1].is_open()
+    assert not ios[1].is_open()
+
+
+def test_nwb_metadata_session_walks_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = make_rich_nwb(tmp_path / "rich.nwb")
+    walks = []
+    scan_hierarchy = pynwb_utils._scan_hierarchy
+
+    def counting_scan(h5file: h5py.File) -> Any:
+        walks.append(h5file)
+        return scan_hierarchy(h5file)
+
+    monkeypatch.setattr(pynwb_utils, "_scan_hierarchy", counting_scan)
+    with NWBMetadataSession(path) as session:
+        metadata = session.get_metadata()
+    assert len(walks) == 1
+    assert metadata["nd_types"] == get_neurodata_types(path)
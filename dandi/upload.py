@@ -44,10 +44,13 @@ from .files import (
     DandisetMetadataFile,
     LocalAsset,
     LocalDirectoryAsset,
+    NWBAsset,
     ZarrAsset,
 )
+from .metadata.service import get_metadata_service
 from .misctypes import Digest
 from .support import pyout as pyouts
+from .support.local_state import FileState, LocalState
 from .support.pyout import naturalsize
 from .utils import ensure_datetime, path_is_subpath, pluralize
 from .validate._io import write_validation_jsonl
@@ -128,6 +131,9 @@ def upload(
         client = stack.enter_context(DandiAPIClient.for_dandi_instance(dandi_instance))
         client.check_schema_version()
         client.dandi_authenticate()
+        # Up to `jobs` files are uploaded at once, each in up to
+        # `jobs_per_file` threads
+        client.set_pool_maxsize((jobs or 5) * (jobs_per_file or 5))
 
         if os.environ.get("DANDI_DEVEL_INSTRUMENT_REQUESTS_SUPERLEN"):
             from requests.utils import super_len
@@ -258,6 +264,8 @@ def upload(
         upload_err: Exception | None = None
         validate_ok = True
 
+        state = LocalState.for_dandiset(dandiset.path)
+
         # TODO: we might want to always yield a full record so no field is not
         # provided to pyout to cause it to halt
         def process_path(dfile: DandiFile) -> Iterator[dict]:
@@ -274,6 +282,21 @@ def upload(
             """
             nonlocal upload_err, validate_ok
             strpath = str(dfile.filepath)
+            # The local state of Zarrs is not recorded
+            fstate: FileState | None = None
+            if isinstance(dfile, LocalAsset) and not isinstance(
+                dfile, LocalDirectoryAsset
+            ):
+                tracked_path: str | None = dfile.path
+            else:
+                tracked_path = None
+            if state is not None and tracked_path is not None:
+                fstate = state.get(tracked_path)
+
+            def record(**values: str | None) -> None:
+                if state is not None and tracked_path is not None:
+                    state.update(tracked_path, **values)
+
             try:
                 if not isinstance(dfile, LocalDirectoryAsset):
                     try:
@@ -354,10 +377,14 @@ def upload(
                     file_etag = None
                 else:
                     yield {"status": "digesting"}
-                    try:
-                        file_etag = dfile.get_digest()
-                    except Exception as exc:
-                        raise UploadError("failed to compute digest: %s" % str(exc))
+                    if fstate is not None and fstate.dandi_etag is not None:
+                        file_etag = Digest.dandi_etag(fstate.dandi_etag)
+                    else:
+                        try:
+                            file_etag = dfile.get_digest()
+                        except Exception as exc:
+                            raise UploadError("failed to compute digest: %s" % str(exc))
+                        record(dandi_etag=file_etag.value)
 
                 try:
                     extant = remote_dandiset.get_asset_by_path(dfile.path)
@@ -365,6 +392,20 @@ def upload(
                     extant = None
                 else:
                     assert extant is not None
+                    if (
+                        fstate is not None
+                        and fstate.remote_asset_id == extant.identifier
+                        and existing
+                        in (
+                            UploadExisting.SKIP,
+                            UploadExisting.OVERWRITE,
+                            UploadExisting.REFRESH,
+                        )
+                    ):
+                        # The file is unchanged since it was uploaded as (or
+                        # downloaded from) this very asset
+                        yield skip_file("file exists")
+                        return
                     replace, out = check_replace_asset(
                         local_asset=dfile,
                         remote_asset=extant,
@@ -384,9 +425,19 @@ def upload(
                 # ad-hoc for dandiset.yaml for now
                 yield {"status": "extracting metadata"}
                 try:
-                    metadata = dfile.get_metadata(
-                        digest=file_etag, ignore_errors=allow_any_path
-                    ).model_dump(mode="json", exclude_none=True)
+                    if isinstance(dfile, NWBAsset) and not devel_debug:
+                        # Extract in a worker process with pynwb loaded
+                        # instead of in this pyout thread
+                        bare_asset = dfile.get_metadata(
+                            digest=file_etag,
+                            ignore_errors=allow_any_path,
+                            metadata_service=get_metadata_service(jobs),
+                        )
+                    else:
+                        bare_asset = dfile.get_metadata(
+                            digest=file_etag, ignore_errors=allow_any_path
+                        )
+                    metadata = bare_asset.model_dump(mode="json", exclude_none=True)
                 except Exception as e:
                     raise UploadError("failed to extract metadata: %s" % str(e))
 
@@ -398,7 +449,10 @@ def upload(
                 for r in dfile.iter_upload(
                     remote_dandiset, metadata, jobs=jobs_per_file, replacing=extant
                 ):
-                    r.pop("asset", None)  # to keep pyout from choking
+                    # to keep pyout from choking
+                    uploaded_asset = r.pop("asset", None)
+                    if uploaded_asset is not None:
+                        record(remote_asset_id=uploaded_asset.identifier)
                     if r["status"] == "uploading":
                         uploaded_paths[strpath]["size"] = r.pop("current")
                         yield r
@@ -477,6 +531,7 @@ def upload(
                     rec.update(error_file(exc))
                 out(rec)
 
+        client.log_pool_stats()
         if not validate_ok:
             lgr.warning(
                 "One or more assets failed validation.  Consult the logfile for"
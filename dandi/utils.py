@@ -832,10 +832,11 @@ def is_page2_url(page1: str, page2: str) -> bool:
     return (url1, sorted(params1.items())) == (url2, sorted(params2.items()))
 
 
-def exclude_from_zarr(path: Path) -> bool:
+def exclude_from_zarr(path: PurePath | os.DirEntry[str]) -> bool:
     """
-    Returns `True` if the ``path`` is a file or directory that should be
-    excluded from consideration when located in a Zarr
+    Returns `True` if the ``path`` (which may also be an `os.DirEntry`) is a
+    file or directory that should be excluded from consideration when located
+    in a Zarr
     """
     return path.name in (".dandi", ".datalad", ".git", ".gitattributes", ".gitmodules")
 
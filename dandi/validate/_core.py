@@ -9,7 +9,11 @@ This module provides validation functionality for dandisets, including:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+import hashlib
 import os
 from pathlib import Path
 from typing import Any
@@ -26,7 +30,7 @@ from ._types import (
     Validator,
 )
 from ..consts import dandiset_metadata_file
-from ..files import find_dandi_files
+from ..files import DandiFile, NWBAsset, ZarrAsset, find_dandi_files
 from ..utils import find_parent_directory_containing
 
 BIDS_TO_DANDI = {
@@ -170,6 +174,7 @@ def validate(
     devel_debug: bool = False,
     allow_any_path: bool = False,
     missing_file_content: MissingFileContent = MissingFileContent.error,
+    jobs: int | None = None,
 ) -> Iterator[ValidationResult]:
     """Validate content
 
@@ -182,74 +187,360 @@ def validate(
       datalad dataset without fetched data).  ``error`` emits a concise error,
       ``skip`` skips the file with a warning, ``only-non-data`` skips
       content-dependent validators but still validates path layout.
+    jobs : int, optional
+      If greater than 1, validate the contents of files (e.g., with pynwb &
+      nwbinspector, or of Zarrs) in that many worker processes, while BIDS
+      validation (run once per BIDS dataset) proceeds in threads of the
+      current process.  The results are yielded in the same order as when
+      validating serially, each as soon as it and all results before it are
+      available.  The ``origin_result`` of results computed in worker
+      processes is not retained.
 
     Yields
     ------
     path, errors
       errors for a path
     """
-    # Archive of unique `ValidationResult` objects obtained through
-    # `DandiFile.get_validation_errors()`
-    # Note: This is needed to hold on to the unique `ValidationResult` objects
-    #   so that they don't get garbage collected, ensuring that the same ID in
-    #   `df_result_ids` is always associated with the same object.
-    df_results: list[ValidationResult] = []
-
-    # The ids of the objects in `df_results` obtain through the `id()` built-in function
-    df_result_ids: set[int] = set()
-
-    for p in paths:
-        p = os.path.abspath(p)
-        dandiset_path = find_parent_directory_containing(dandiset_metadata_file, p)
-        if dandiset_path is None:
-            yield ValidationResult(
-                id="DANDI.NO_DANDISET_FOUND",
-                origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
-                severity=Severity.ERROR,
-                scope=Scope.DANDISET,
-                path=Path(p),
-                message="Path is not inside a Dandiset",
+    # The results of validating a BIDS dataset are reported both for the
+    # dataset (by its `dataset_description.json`) and for the assets they
+    # pertain to; only the first report of each is yielded.
+    shared_filter = _SharedResultFilter()
+
+    def dandi_files() -> Iterator[DandiFile | ValidationResult]:
+        for p in paths:
+            p = os.path.abspath(p)
+            dandiset_path = find_parent_directory_containing(dandiset_metadata_file, p)
+            if dandiset_path is None:
+                yield ValidationResult(
+                    id="DANDI.NO_DANDISET_FOUND",
+                    origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                    severity=Severity.ERROR,
+                    scope=Scope.DANDISET,
+                    path=Path(p),
+                    message="Path is not inside a Dandiset",
+                )
+            yield from find_dandi_files(
+                p, dandiset_path=dandiset_path, allow_all=allow_any_path
+            )
+
+    if jobs is not None and jobs > 1:
+        file_results = _validate_parallel(
+            dandi_files(), schema_version, devel_debug, missing_file_content, jobs
+        )
+    else:
+        file_results = (
+            (
+                ([item], [])
+                if isinstance(item, ValidationResult)
+                else _validate_file(
+                    item, schema_version, devel_debug, missing_file_content
+                )
             )
-        for df in find_dandi_files(
-            p, dandiset_path=dandiset_path, allow_all=allow_any_path
+            for item in dandi_files()
+        )
+    for own, shared in file_results:
+        yield from own
+        for r in shared:
+            if shared_filter.is_new(r):
+                yield r
+
+
+#: The results of validating a file, split into those specific to it & those
+#: shared with its BIDS dataset
+_SplitResults = tuple[list[ValidationResult], list[ValidationResult]]
+
+
+class _SharedResultFilter:
+    """
+    Recognizes repeated reports of the results of validating a BIDS dataset,
+    each of which is reported at most twice: once for the dataset as a whole
+    and once for the asset it pertains to (in either order).  Results are
+    recognized by a hash of their content, which is forgotten once the
+    result's second report is seen, and so memory use is proportional to the
+    number of results awaiting their second report (at most ``maxsize``,
+    beyond which the oldest are forgotten) rather than to the number of
+    results reported.
+    """
+
+    def __init__(self, maxsize: int = 1 << 20) -> None:
+        self.maxsize = maxsize
+        self._pending: OrderedDict[bytes, None] = OrderedDict()
+
+    def is_new(self, r: ValidationResult) -> bool:
+        """Return whether ``r`` has not been reported yet"""
+        key = hashlib.blake2b(
+            r.model_dump_json().encode("utf-8"), digest_size=16
+        ).digest()
+        if key in self._pending:
+            del self._pending[key]
+            return False
+        self._pending[key] = None
+        if len(self._pending) > self.maxsize:
+            self._pending.popitem(last=False)
+        return True
+
+
+def _validate_file(
+    df: DandiFile,
+    schema_version: str | None,
+    devel_debug: bool,
+    missing_file_content: MissingFileContent,
+) -> _SplitResults:
+    """
+    Return the validation results for a single file, split into those
+    specific to it and those shared with its BIDS dataset (see
+    `_split_shared()`)
+    """
+    results = []
+    is_broken = _is_broken_symlink(df.filepath)
+    # Handle broken symlinks (missing file content)
+    if is_broken:
+        r = _handle_missing_content(df, missing_file_content)
+        if r is not None:
+            results.append(r)
+        if missing_file_content in (
+            MissingFileContent.skip,
+            MissingFileContent.error,
         ):
-            # Handle broken symlinks (missing file content)
-            if _is_broken_symlink(df.filepath):
+            return results, []
+        # only-non-data: fall through but pass the flag to validators
+    own, shared = _split_shared(
+        df,
+        _drop_content_dependent(
+            df.get_validation_errors(
+                schema_version=schema_version,
+                devel_debug=devel_debug,
+                missing_file_content=(missing_file_content if is_broken else None),
+            ),
+            is_broken,
+            missing_file_content,
+        ),
+    )
+    results.extend(own)
+    return results, shared
+
+
+def _split_shared(df: DandiFile, results: list[ValidationResult]) -> _SplitResults:
+    """
+    Split the results of validating ``df`` into those specific to it and
+    those of validating its BIDS dataset as a whole, which are reported both
+    for the dataset's :file:`dataset_description.json` and for the asset
+    they pertain to
+    """
+    # Avoid heavy import by importing within function:
+    from ..files.bids import BIDSAsset, BIDSDatasetDescriptionAsset
+
+    if isinstance(df, BIDSDatasetDescriptionAsset):
+        return [], results
+    elif isinstance(df, BIDSAsset):
+        shared_ids = {id(r) for r in BIDSAsset.get_validation_errors(df)}
+        own: list[ValidationResult] = []
+        shared: list[ValidationResult] = []
+        for r in results:
+            (shared if id(r) in shared_ids else own).append(r)
+        return own, shared
+    else:
+        return results, []
+
+
+def _drop_content_dependent(
+    results: list[ValidationResult],
+    is_broken: bool,
+    missing_file_content: MissingFileContent,
+) -> list[ValidationResult]:
+    # For broken-symlink files under only-non-data, suppress
+    # BIDS errors that require reading file content (e.g.
+    # NIFTI_HEADER_UNREADABLE).  The validator ran in full so
+    # real files still get those checks.
+    if is_broken and missing_file_content == MissingFileContent.only_non_data:
+        return [r for r in results if r.id not in _BIDS_CONTENT_DEPENDENT_CODES]
+    return results
+
+
+def _validate_in_worker(
+    df: DandiFile,
+    get_validation_errors: Callable[..., list[ValidationResult]],
+    schema_version: str | None,
+    devel_debug: bool,
+    missing_file_content: MissingFileContent | None,
+) -> list[ValidationResult]:
+    """
+    Run ``get_validation_errors(df, ...)`` (a file's own, non-BIDS
+    validators) in a worker process of `_validate_parallel()`
+    """
+    return [
+        # The original results of the validators are not necessarily
+        # picklable:
+        r.model_copy(update={"origin_result": None})
+        for r in get_validation_errors(
+            df,
+            schema_version=schema_version,
+            devel_debug=devel_debug,
+            missing_file_content=missing_file_content,
+        )
+    ]
+
+
+def _no_dataset_description() -> None:
+    """
+    Stand-in for the weak reference to the `BIDSDatasetDescriptionAsset` of a
+    BIDS asset sent to a worker process, where it is not needed
+    """
+    return None
+
+
+def _validate_parallel(
+    items: Iterator[DandiFile | ValidationResult],
+    schema_version: str | None,
+    devel_debug: bool,
+    missing_file_content: MissingFileContent,
+    jobs: int,
+) -> Iterator[_SplitResults]:
+    """
+    Validate files in parallel, yielding the results for each file in the
+    order of ``items``, split as by `_validate_file()`.  The contents of files
+    are validated in a pool of ``jobs`` worker processes.  Validation of
+    assets against their BIDS datasets cannot be moved to other processes
+    (the results for all assets in a dataset are computed at once and shared
+    via the `BIDSDatasetDescriptionAsset`), and so it is run in a pool of
+    threads instead.
+    """
+    # Avoid heavy import by importing within function:
+    from ..files.bids import (
+        BIDSAsset,
+        BIDSDatasetDescriptionAsset,
+        NWBBIDSAsset,
+        ZarrBIDSAsset,
+    )
+    from ..metadata.service import MetadataService
+
+    # Submit at most this many files ahead of the first one whose results have
+    # not been yielded yet:
+    window = 4 * jobs
+    pending: deque[
+        tuple[
+            list[ValidationResult],
+            Future[list[ValidationResult]] | None,
+            Future[_SplitResults] | None,
+            bool,
+        ]
+    ] = deque()
+
+    def drain(
+        n: int,
+    ) -> Iterator[_SplitResults]:
+        while len(pending) > n:
+            results, own, bids, is_broken = pending.popleft()
+            shared: list[ValidationResult] = []
+            if own is not None:
+                results.extend(
+                    _drop_content_dependent(
+                        own.result(), is_broken, missing_file_content
+                    )
+                )
+            if bids is not None:
+                bids_own, bids_shared = bids.result()
+                results.extend(
+                    _drop_content_dependent(bids_own, is_broken, missing_file_content)
+                )
+                shared = _drop_content_dependent(
+                    bids_shared, is_broken, missing_file_content
+                )
+            yield results, shared
+
+    def validate_bids(
+        df: BIDSAsset | BIDSDatasetDescriptionAsset,
+        _bidsdd: BIDSDatasetDescriptionAsset,
+        mfc: MissingFileContent | None,
+    ) -> _SplitResults:
+        # Assets only hold weak references to their datasets, which may be
+        # released by `find_dandi_files()` before the validation is run, and
+        # so the dataset is passed as well
+        if isinstance(df, (NWBBIDSAsset, ZarrBIDSAsset)):
+            return [], BIDSAsset.get_validation_errors(df)
+        else:
+            return _split_shared(
+                df,
+                df.get_validation_errors(
+                    schema_version=schema_version,
+                    devel_debug=devel_debug,
+                    missing_file_content=mfc,
+                ),
+            )
+
+    # Validation in worker processes benefits from them having pynwb
+    # imported & the NWB namespaces loaded, as `MetadataService` workers do
+    with (
+        MetadataService(jobs) as service,
+        ThreadPoolExecutor(max_workers=jobs) as threads,
+    ):
+        for item in items:
+            if isinstance(item, ValidationResult):
+                pending.append(([item], None, None, False))
+                yield from drain(window)
+                continue
+            df = item
+            results: list[ValidationResult] = []
+            is_broken = _is_broken_symlink(df.filepath)
+            if is_broken:
                 r = _handle_missing_content(df, missing_file_content)
                 if r is not None:
-                    r_id = id(r)
-                    if r_id not in df_result_ids:
-                        df_results.append(r)
-                        df_result_ids.add(r_id)
-                        yield r
+                    results.append(r)
                 if missing_file_content in (
                     MissingFileContent.skip,
                     MissingFileContent.error,
                 ):
+                    pending.append((results, None, None, False))
+                    yield from drain(window)
                     continue
-                # only-non-data: fall through but pass the flag to validators
-
-            is_broken = _is_broken_symlink(df.filepath)
-            for r in df.get_validation_errors(
-                schema_version=schema_version,
-                devel_debug=devel_debug,
-                missing_file_content=(missing_file_content if is_broken else None),
-            ):
-                # For broken-symlink files under only-non-data, suppress
-                # BIDS errors that require reading file content (e.g.
-                # NIFTI_HEADER_UNREADABLE).  The validator ran in full so
-                # real files still get those checks.
-                if (
-                    is_broken
-                    and missing_file_content == MissingFileContent.only_non_data
-                    and r.id in _BIDS_CONTENT_DEPENDENT_CODES
-                ):
-                    continue
-                r_id = id(r)
-                if r_id not in df_result_ids:
-                    df_results.append(r)
-                    df_result_ids.add(r_id)
-                    yield r
+            mfc = missing_file_content if is_broken else None
+            own: Future[list[ValidationResult]] | None
+            if isinstance(df, (NWBBIDSAsset, ZarrBIDSAsset)):
+                # Only the NWB/Zarr validation is done in the worker; the
+                # asset's dataset is not needed (nor picklable) there
+                no_ref: Any = _no_dataset_description
+                own = service.submit(
+                    _validate_in_worker,
+                    replace(df, bids_dataset_description_ref=no_ref),
+                    (
+                        NWBAsset.get_validation_errors
+                        if isinstance(df, NWBBIDSAsset)
+                        else ZarrAsset.get_validation_errors
+                    ),
+                    schema_version,
+                    devel_debug,
+                    mfc,
+                )
+            elif isinstance(df, (BIDSAsset, BIDSDatasetDescriptionAsset)):
+                # Validation of other BIDS assets (e.g., of their metadata)
+                # needs their dataset, and so it is done in a thread below
+                own = None
+            else:
+                own = service.submit(
+                    _validate_in_worker,
+                    df,
+                    type(df).get_validation_errors,
+                    schema_version,
+                    devel_debug,
+                    mfc,
+                )
+            bids: Future[_SplitResults] | None
+            if isinstance(df, (BIDSAsset, BIDSDatasetDescriptionAsset)):
+                bids = threads.submit(
+                    validate_bids,
+                    df,
+                    (
+                        df
+                        if isinstance(df, BIDSDatasetDescriptionAsset)
+                        else df.bids_dataset_description
+                    ),
+                    mfc,
+                )
+            else:
+                bids = None
+            pending.append((results, own, bids, is_broken))
+            yield from drain(window)
+        yield from drain(0)
 
 
 def _handle_missing_content(
@@ -2,18 +2,63 @@
 
 Provides functions for writing, appending, and loading validation results
 as JSONL (JSON Lines) files — one ValidationResult per line.
+
+Validation results can also be stored in an indexed validation log: an SQLite
+database holding each result as compressed JSON alongside indexed columns for
+its severity, ID, path, and validator.  Results can then be selected by those
+without reading (let alone parsing) the other results, which makes filtering
+a log of a large Dandiset much faster than with JSONL.  `iter_validation_log`
+reads either format, and `convert_validation_log` converts between them.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Iterator
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
+import re
+import sqlite3
+import zlib
+
+from ._types import Severity, ValidationResult
+
+#: The version of the format of indexed validation logs, stored as the
+#: database's ``user_version``
+INDEXED_LOG_VERSION = 1
+
+_INDEXED_LOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    seq INTEGER PRIMARY KEY,
+    severity INTEGER,
+    id TEXT NOT NULL,
+    path TEXT,
+    validator TEXT NOT NULL,
+    record BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_severity ON results (severity);
+CREATE INDEX IF NOT EXISTS results_id ON results (id);
+CREATE INDEX IF NOT EXISTS results_path ON results (path);
+CREATE INDEX IF NOT EXISTS results_validator ON results (validator);
+"""
 
-from ._types import ValidationResult
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+#: Preset dictionary for compressing the records of indexed validation logs,
+#: which are too short to compress well on their own.  Changing it requires
+#: changing `INDEXED_LOG_VERSION`.
+_RECORD_ZDICT = (
+    b'{"record_version":"1","id":"","origin":{"type":"VALIDATION",'
+    b'"validator":"nwbinspector","validator_version":"","standard":null,'
+    b'"standard_version":null,"standard_schema_version":null},"scope":"file",'
+    b'"severity":"WARNING","asset_paths":null,"within_asset_paths":null,'
+    b'"dandiset_path":null,"dataset_path":null,"message":null,"metadata":null,'
+    b'"path":null,"path_regex":null}'
+)
 
 
 def write_validation_jsonl(
-    results: list[ValidationResult],
+    results: Iterable[ValidationResult],
     path: str | Path,
     *,
     append: bool = False,
@@ -23,7 +68,7 @@ def write_validation_jsonl(
     Parameters
     ----------
     results
-        List of ValidationResult objects to write.
+        ValidationResult objects to write.
     path
         File path to write to.  Created if it does not exist.
     append
@@ -55,14 +100,230 @@ def load_validation_jsonl(paths: Iterable[str | Path]) -> list[ValidationResult]
     list[ValidationResult]
         All results from all files, in order.
     """
-    results: list[ValidationResult] = []
+    return list(iter_validation_jsonl(paths))
+
+
+def iter_validation_jsonl(paths: Iterable[str | Path]) -> Iterator[ValidationResult]:
+    """Lazily load validation results from one or more JSONL files.
+
+    Like `load_validation_jsonl`, but yields the results one at a time as
+    they are read.
+
+    Parameters
+    ----------
+    paths
+        Iterable of file paths to load from.
+
+    Yields
+    ------
+    ValidationResult
+        All results from all files, in order.
+    """
     for p in paths:
         p = Path(p)
         with p.open() as f:
             for line in f:
                 if line := line.strip():
-                    results.append(ValidationResult.model_validate_json(line))
-    return results
+                    yield ValidationResult.model_validate_json(line)
+
+
+def write_validation_index(
+    results: Iterable[ValidationResult],
+    path: str | Path,
+    *,
+    append: bool = False,
+) -> Path:
+    """Write validation results to an indexed validation log.
+
+    Parameters
+    ----------
+    results
+        ValidationResult objects to write.
+    path
+        File path to write to.  Created if it does not exist.
+    append
+        If True, append to an existing log instead of overwriting.
+
+    Returns
+    -------
+    Path
+        The path written to (as a Path object).
+    """
+    path = Path(path)
+    if not append:
+        path.unlink(missing_ok=True)
+    with closing(sqlite3.connect(path)) as conn, conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, INDEXED_LOG_VERSION):
+            raise ValueError(
+                f"{path}: unsupported indexed validation log version {version}"
+            )
+        conn.executescript(_INDEXED_LOG_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {INDEXED_LOG_VERSION}")
+        conn.executemany(
+            "INSERT INTO results (severity, id, path, validator, record)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    r.severity.value if r.severity is not None else None,
+                    r.id,
+                    r.purview,
+                    r.origin.validator.value,
+                    _compress_record(r),
+                )
+                for r in results
+            ),
+        )
+    return path
+
+
+def iter_validation_index(
+    path: str | Path,
+    *,
+    min_severity: Severity | None = None,
+    ignore: str | None = None,
+    ids: Collection[str] | None = None,
+    paths: Collection[str] | None = None,
+    validators: Collection[str] | None = None,
+) -> Iterator[ValidationResult]:
+    """Lazily load the matching results from an indexed validation log.
+
+    Only the records of matching results are read & parsed.
+
+    Parameters
+    ----------
+    path
+        The indexed validation log to load from.
+    min_severity
+        Only load results with at least this severity.
+    ignore
+        Do not load results whose IDs match this regular expression.
+    ids
+        Only load results with these IDs.
+    paths
+        Only load results with these purviews (see
+        `ValidationResult.purview`).
+    validators
+        Only load results from these validators (values of `Validator`).
+
+    Yields
+    ------
+    ValidationResult
+        The matching results, in the order they were written.
+    """
+    clauses: list[str] = []
+    params: list[str | int] = []
+    if min_severity is not None:
+        clauses.append("severity >= ?")
+        params.append(min_severity.value)
+    if ignore is not None:
+        clauses.append("NOT regexp(?, id)")
+        params.append(ignore)
+    for column, values in [("id", ids), ("path", paths), ("validator", validators)]:
+        if values is not None:
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+    query = "SELECT record FROM results"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " ORDER BY seq"
+    # Open read-only, so that a nonexistent log is not created:
+    with closing(
+        sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+    ) as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEXED_LOG_VERSION:
+            raise ValueError(
+                f"{path}: unsupported indexed validation log version {version}"
+            )
+        conn.create_function("regexp", 2, _regexp, deterministic=True)
+        for (record,) in conn.execute(query, params):
+            yield _decompress_record(record)
+
+
+def _compress_record(r: ValidationResult) -> bytes:
+    c = zlib.compressobj(zdict=_RECORD_ZDICT)
+    return c.compress(r.model_dump_json().encode("utf-8")) + c.flush()
+
+
+def _decompress_record(record: bytes) -> ValidationResult:
+    d = zlib.decompressobj(zdict=_RECORD_ZDICT)
+    return ValidationResult.model_validate_json(d.decompress(record) + d.flush())
+
+
+@lru_cache(maxsize=1024)
+def _regexp(pattern: str, s: str) -> bool:
+    return re.search(pattern, s) is not None
+
+
+def is_validation_index(path: str | Path) -> bool:
+    """Return whether the file at ``path`` is an indexed validation log."""
+    with open(path, "rb") as f:
+        return f.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+
+def iter_validation_log(
+    paths: Iterable[str | Path],
+    *,
+    min_severity: Severity | None = None,
+    ignore: str | None = None,
+) -> Iterator[ValidationResult]:
+    """Lazily load validation results from JSONL files & indexed logs.
+
+    Parameters
+    ----------
+    paths
+        Iterable of file paths to load from, in either format.
+    min_severity
+        Only load results with at least this severity.
+    ignore
+        Do not load results whose IDs match this regular expression.
+
+    Yields
+    ------
+    ValidationResult
+        The matching results from all files, in order.
+    """
+    for p in paths:
+        if is_validation_index(p):
+            yield from iter_validation_index(
+                p, min_severity=min_severity, ignore=ignore
+            )
+        else:
+            for r in iter_validation_jsonl([p]):
+                if min_severity is not None and (
+                    r.severity is None or r.severity < min_severity
+                ):
+                    continue
+                if ignore is not None and re.search(ignore, r.id):
+                    continue
+                yield r
+
+
+def convert_validation_log(src: str | Path, dest: str | Path) -> int:
+    """Convert a validation log between JSONL & the indexed format.
+
+    A JSONL file ``src`` is converted to an indexed validation log ``dest``,
+    and an indexed validation log to a JSONL file.
+
+    Returns
+    -------
+    int
+        The number of results converted.
+    """
+    n = 0
+
+    def counted(results: Iterable[ValidationResult]) -> Iterator[ValidationResult]:
+        nonlocal n
+        for r in results:
+            n += 1
+            yield r
+
+    if is_validation_index(src):
+        write_validation_jsonl(counted(iter_validation_index(src)), dest)
+    else:
+        write_validation_index(counted(iter_validation_jsonl([src])), dest)
+    return n
 
 
 def validation_companion_path(logfile: str | Path) -> Path:
@@ -0,0 +1,348 @@
+"""
+A persistent per-Dandiset store of validation results.
+
+``dandi validate`` and the pre-upload validation of ``dandi upload`` run the
+same validators (PyNWB & nwbinspector, Zarr checks, layout checks, the BIDS
+validator) on every file of a Dandiset every time they are invoked.  A
+`ValidationStore` keeps the results of the last validation of each file of a
+Dandiset, keyed by the file's path and a fingerprint of its identity (a
+``stat`` tuple for a file, and a digest of the ``stat`` tuples of all files
+within a directory for a Zarr or a BIDS dataset), so that validators need to
+be re-run only on files that changed since.  Results are additionally keyed
+by the versions of the libraries performing the validation, so that upgrading
+any of them invalidates the stored results.
+
+The store for a Dandiset is an SQLite database in the :file:`validation`
+directory of dandi-cli's user cache directory, or in the directory given by
+the ``DANDI_VALIDATION_STORE`` environment variable.  Setting ``DANDI_CACHE``
+to ``ignore`` disables the store, and setting it to ``clear`` causes all files
+to be validated anew (replacing the stored results).
+
+Results are stored as JSON, in the same form as validation logs (see
+`dandi.validate._io`), so the ``origin_result`` of results obtained from the
+store is `None`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Container, Sequence
+from contextlib import closing
+from functools import wraps
+import hashlib
+from importlib.metadata import PackageNotFoundError, version
+import json
+import os
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from typing import Any, TypeVar
+
+from ._types import MissingFileContent, ValidationResult
+from .. import __version__, get_logger
+
+lgr = get_logger()
+
+#: The environment variable giving the directory in which to keep the stores
+STORE_DIR_ENVVAR = "DANDI_VALIDATION_STORE"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    args TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (path, kind, args)
+)
+"""
+
+#: Distributions whose versions key the stored results
+_TOKEN_DISTRIBUTIONS = (
+    "dandischema",
+    "pynwb",
+    "hdmf",
+    "nwbinspector",
+    "zarr",
+    "bids-validator-deno",
+)
+
+_tokens: str | None = None
+
+
+def get_tokens() -> str:
+    """
+    Return the versions of dandi-cli & the validators, which must match for a
+    stored result to be used, as a JSON string
+    """
+    global _tokens
+    if _tokens is None:
+        versions: list[str | None] = [__version__]
+        for dist in _TOKEN_DISTRIBUTIONS:
+            try:
+                versions.append(version(dist))
+            except PackageNotFoundError:
+                versions.append(None)
+        _tokens = json.dumps(versions)
+    return _tokens
+
+
+def get_store_dir() -> Path:
+    """Return the directory in which the stores for all Dandisets are kept"""
+    d = os.environ.get(STORE_DIR_ENVVAR)
+    if d:
+        return Path(d)
+    # Avoid heavy import by importing within function:
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("dandi-cli", "dandi")) / "validation"
+
+
+def file_fingerprint(path: str | Path) -> str | None:
+    """
+    Return a fingerprint of the file at ``path`` based on its ``stat``
+    tuple, or `None` if it cannot be ``stat``-ed (e.g., a broken symlink)
+    """
+    try:
+        s = os.stat(path)
+    except OSError:
+        return None
+    return f"{s.st_size}:{s.st_mtime_ns}:{s.st_ino}:{s.st_dev}"
+
+
+def tree_fingerprint(path: str | Path, exclude: Container[str] = ()) -> str | None:
+    """
+    Return a fingerprint of the directory tree at ``path`` based on the paths
+    & ``stat`` tuples of all files & directories within it (other than the
+    entries of ``path`` itself named in ``exclude``), or `None` if it cannot
+    be walked
+    """
+    h = hashlib.sha256()
+    entries: list[str] = []
+    try:
+        for dirpath, dirnames, filenames in os.walk(path, onerror=_raise):
+            rel = os.path.relpath(dirpath, path)
+            if rel == "." and exclude:
+                dirnames[:] = [n for n in dirnames if n not in exclude]
+                filenames = [n for n in filenames if n not in exclude]
+            for name in dirnames + filenames:
+                p = os.path.join(dirpath, name)
+                fp = file_fingerprint(p)
+                # Broken symlinks are fingerprinted by their targets
+                if fp is None:
+                    fp = "->" + os.readlink(p)
+                entries.append(f"{os.path.join(rel, name)}\0{fp}")
+    except OSError:
+        return None
+    for e in sorted(entries):
+        h.update(e.encode("utf-8", "surrogateescape"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def _raise(e: OSError) -> None:
+    raise e
+
+
+def dump_results(results: list[ValidationResult]) -> str:
+    # As JSON Lines, like validation logs (see `dandi.validate._io`)
+    return "".join(f"{r.model_dump_json()}\n" for r in results)
+
+
+def load_results(text: str) -> list[ValidationResult]:
+    return [ValidationResult.model_validate_json(line) for line in text.splitlines()]
+
+
+class ValidationStore:
+    """
+    The validation results for the files of the Dandiset at ``dandiset_path``
+    as of their last validation, stored in the SQLite database at ``db_path``
+    """
+
+    _instances: dict[tuple[Path, Path], ValidationStore] = {}
+    _instances_lock = Lock()
+
+    def __init__(self, dandiset_path: str | Path, db_path: str | Path) -> None:
+        self.dandiset_path = Path(dandiset_path)
+        self.db_path = Path(db_path)
+        self._initialized = False
+        self._lock = Lock()
+
+    @classmethod
+    def for_dandiset(cls, dandiset_path: str | Path | None) -> ValidationStore | None:
+        """
+        Return the store for the Dandiset at ``dandiset_path``, or `None` if
+        there is no Dandiset or the store is disabled via ``DANDI_CACHE``
+        """
+        if dandiset_path is None or os.environ.get("DANDI_CACHE") == "ignore":
+            return None
+        dandiset_path = Path(os.path.realpath(dandiset_path))
+        store_dir = get_store_dir()
+        with cls._instances_lock:
+            try:
+                return cls._instances[store_dir, dandiset_path]
+            except KeyError:
+                key = hashlib.sha256(
+                    str(dandiset_path).encode("utf-8", "surrogateescape")
+                ).hexdigest()[:16]
+                store = cls(dandiset_path, store_dir / f"{key}.sqlite")
+                cls._instances[store_dir, dandiset_path] = store
+                return store
+
+    def _connect(self) -> sqlite3.Connection:
+        # Long timeout, as the database may be written to by several processes
+        # (e.g., parallel validation workers) at once
+        conn = sqlite3.connect(self.db_path, timeout=60)
+        with self._lock:
+            if not self._initialized:
+                conn.execute(_SCHEMA)
+                self._initialized = True
+        return conn
+
+    def get(
+        self, path: str | Path, kind: str, fingerprint: str, args: Sequence[Any] = ()
+    ) -> list[ValidationResult] | None:
+        """
+        Return the results stored for the file at ``path`` (validated as
+        ``kind`` with additional arguments ``args``) if its fingerprint was
+        ``fingerprint`` then, or `None` otherwise
+        """
+        if os.environ.get("DANDI_CACHE") == "clear" or not self.db_path.exists():
+            # With "clear", every file is validated anew, and its stored
+            # results are replaced.  (Deleting all stored results instead
+            # would race with other processes validating the same Dandiset.)
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM results"
+                    " WHERE path = ? AND kind = ? AND args = ?"
+                    " AND tokens = ? AND fingerprint = ?",
+                    (
+                        str(path),
+                        kind,
+                        json.dumps(list(args)),
+                        get_tokens(),
+                        fingerprint,
+                    ),
+                ).fetchone()
+            if row is None:
+                return None
+            return load_results(row[0])
+        except Exception as e:
+            lgr.debug("Failed to read stored validation results for %s: %s", path, e)
+            return None
+
+    def get_previous(
+        self, path: str | Path, kind: str, args: Sequence[Any] = ()
+    ) -> tuple[str, list[ValidationResult]] | None:
+        """
+        Return the fingerprint of the file at ``path`` (validated as ``kind``
+        with additional arguments ``args``) as of its last validation by the
+        current versions of the validators, along with the results thereof,
+        or `None` if there are no such results
+        """
+        if os.environ.get("DANDI_CACHE") == "clear" or not self.db_path.exists():
+            return None
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT fingerprint, value FROM results"
+                    " WHERE path = ? AND kind = ? AND args = ? AND tokens = ?",
+                    (str(path), kind, json.dumps(list(args)), get_tokens()),
+                ).fetchone()
+            if row is None:
+                return None
+            return row[0], load_results(row[1])
+        except Exception as e:
+            lgr.debug("Failed to read stored validation results for %s: %s", path, e)
+            return None
+
+    def set(
+        self,
+        path: str | Path,
+        kind: str,
+        fingerprint: str,
+        results: list[ValidationResult],
+        args: Sequence[Any] = (),
+    ) -> None:
+        """
+        Store the results of validating the file at ``path`` (as ``kind``,
+        with additional arguments ``args``), replacing any results stored
+        for an earlier state of the file
+        """
+        try:
+            text = dump_results(results)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        str(path),
+                        kind,
+                        json.dumps(list(args)),
+                        get_tokens(),
+                        fingerprint,
+                        text,
+                    ),
+                )
+        except Exception as e:
+            lgr.debug("Failed to store validation results for %s: %s", path, e)
+
+
+F = TypeVar("F", bound=Callable[..., list[ValidationResult]])
+
+
+def stored_validation(fingerprint: Callable[[Path], str | None]) -> Callable[[F], F]:
+    """
+    Decorator for the ``get_validation_errors()`` method of a `DandiFile`
+    class that answers calls from the `ValidationStore` of the file's Dandiset
+    when ``fingerprint(filepath)`` matches the fingerprint of the file as of
+    the stored results, and stores the results otherwise.  Calls with
+    ``devel_debug=True`` bypass the store.
+    """
+
+    def decorator(f: F) -> F:
+        @wraps(f)
+        def wrapper(
+            self: Any,
+            schema_version: str | None = None,
+            devel_debug: bool = False,
+            missing_file_content: MissingFileContent | None = None,
+        ) -> list[ValidationResult]:
+            store = (
+                None
+                if devel_debug
+                else ValidationStore.for_dandiset(self.dandiset_path)
+            )
+            fp = fingerprint(self.filepath) if store is not None else None
+            if store is None or fp is None:
+                return f(
+                    self,
+                    schema_version=schema_version,
+                    devel_debug=devel_debug,
+                    missing_file_content=missing_file_content,
+                )
+            # The results of a file's validation as one class (e.g., as an
+            # NWB file within a BIDS dataset) differ from those as another
+            kind = f"{type(self).__name__}.{f.__qualname__}"
+            args = [
+                schema_version,
+                None if missing_file_content is None else missing_file_content.value,
+            ]
+            results = store.get(self.filepath, kind, fp, args)
+            if results is None:
+                results = f(
+                    self,
+                    schema_version=schema_version,
+                    devel_debug=devel_debug,
+                    missing_file_content=missing_file_content,
+                )
+                store.set(self.filepath, kind, fp, results, args)
+            else:
+                lgr.debug("Using stored validation results for %s", self.filepath)
+            return results
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
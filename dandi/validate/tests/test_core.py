@@ -1,11 +1,17 @@
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 import json
 from pathlib import Path
+import time
 from typing import Any
+import weakref
 
 import pytest
 
+from .. import _core
 from .._core import validate
 from .._types import (
+    ORIGIN_VALIDATION_DANDI_LAYOUT,
     MissingFileContent,
     Origin,
     OriginType,
@@ -17,6 +23,8 @@ from .._types import (
 )
 from ... import __version__
 from ...consts import dandiset_metadata_file
+from ...files import DandiFile
+from ...files.bids import BIDSAsset, BIDSDatasetDescriptionAsset
 from ...tests.fixtures import BIDS_TESTDATA_SELECTION
 
 
@@ -310,3 +318,209 @@ def test_validate_broken_symlink_real_file_still_validated(tmp_path: Path) -> No
         assert (
             len(broken_pynwb) == 0
         ), f"policy={policy.value}: pynwb should not run on the broken symlink"
+
+
+def _summarize(
+    results: list[ValidationResult],
+) -> list[tuple[str, Severity | None, Path | None, str | None]]:
+    return [(r.id, r.severity, r.path, r.message) for r in results]
+
+
+def test_validate_jobs_nwb(organized_nwb_dir2: Path) -> None:
+    """Parallel validation yields the same results, in the same order"""
+    serial = list(validate(organized_nwb_dir2))
+    parallel = list(validate(organized_nwb_dir2, jobs=2))
+    assert _summarize(parallel) == _summarize(serial)
+
+
+@pytest.mark.parametrize("dataset", ["asl003", "ieeg_epilepsyNWB"])
+def test_validate_jobs_bids(bids_examples: Path, tmp_path: Path, dataset: str) -> None:
+    """
+    Parallel validation of BIDS datasets (validated once per dataset) yields
+    the same results, in the same order
+    """
+    serial = list(validate(bids_examples / dataset))
+    parallel = list(validate(bids_examples / dataset, jobs=2))
+    assert _summarize(parallel) == _summarize(serial)
+    # Dataset-level results are shared by the assets of the dataset and so
+    # are reported only once:
+    assert len({id(r) for r in parallel}) == len(parallel)
+
+
+def test_validate_jobs_generic_bids_asset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The non-BIDS validation of generic BIDS assets is also done in parallel mode"""
+    from dandi.files import GenericAsset, bids
+
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000001'\n")
+    (tmp_path / "dataset_description.json").write_text(
+        '{"Name": "Test", "BIDSVersion": "1.8.0"}'
+    )
+    (tmp_path / "participants.tsv").write_text("participant_id\nsub-01\n")
+
+    def mock_get_validation_errors(
+        self: GenericAsset, *_args: Any, **_kwargs: Any
+    ) -> list[ValidationResult]:
+        return [
+            ValidationResult(
+                id="DANDI.TEST",
+                origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                scope=Scope.FILE,
+                severity=Severity.WARNING,
+                path=self.filepath,
+                message="Test",
+            )
+        ]
+
+    monkeypatch.setattr(bids, "bids_validate", lambda *_args, **_kwargs: [])
+    monkeypatch.setattr(
+        GenericAsset, "get_validation_errors", mock_get_validation_errors
+    )
+    serial = list(validate(tmp_path))
+    assert [(r.id, r.path) for r in serial] == [
+        ("DANDI.TEST", tmp_path / "participants.tsv")
+    ]
+    assert _summarize(list(validate(tmp_path, jobs=2))) == _summarize(serial)
+
+
+@dataclass
+class _SyntheticDatasetDescription(BIDSDatasetDescriptionAsset):
+    """
+    A BIDS dataset whose validation produces ``n_results`` results for each
+    asset plus one for the dataset as a whole, without running any validator
+    """
+
+    n_results: int = 0
+    _synthetic_errors: dict[str, list[ValidationResult]] = field(default_factory=dict)
+
+    def get_validation_errors(
+        self, *_args: Any, **_kwargs: Any
+    ) -> list[ValidationResult]:
+        results = [_synthetic_result(self.bids_root, "dataset")]
+        for asset in self.dataset_files:
+            results.extend(self.get_asset_errors(asset))
+        return results
+
+    def get_asset_errors(self, asset: BIDSAsset) -> list[ValidationResult]:
+        # Like the actual `get_asset_errors()`, return the same objects on
+        # repeated calls for the same asset
+        return self._synthetic_errors.setdefault(
+            asset.path,
+            [_synthetic_result(asset.filepath, i) for i in range(self.n_results)],
+        ).copy()
+
+
+_SYNTHETIC_RESULT = ValidationResult(
+    id="DANDI.TEST",
+    origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+    scope=Scope.FILE,
+    severity=Severity.WARNING,
+    message="",
+)
+
+
+def _synthetic_result(path: Path, i: int | str) -> ValidationResult:
+    return _SYNTHETIC_RESULT.model_copy(update={"path": path, "message": f"Result {i}"})
+
+
+def _validate_synthetic(
+    dandiset_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    n_datasets: int,
+    n_assets: int,
+    n_results: int,
+    jobs: int | None = None,
+) -> Iterator[ValidationResult]:
+    """
+    Validate ``n_datasets`` synthetic BIDS datasets of ``n_assets`` assets
+    each, whose validation produces ``n_results`` results per asset, each
+    reported both for the dataset and for the asset
+    """
+
+    def find_dandi_files(*_args: Any, **_kwargs: Any) -> Iterator[DandiFile]:
+        for d in range(n_datasets):
+            path = f"ds{d}/dataset_description.json"
+            description = _SyntheticDatasetDescription(
+                filepath=dandiset_path / path,
+                path=path,
+                dandiset_path=dandiset_path,
+                n_results=n_results,
+            )
+            for a in range(n_assets):
+                path = f"ds{d}/sub-{a}/data.dat"
+                asset = BIDSAsset(
+                    filepath=dandiset_path / path,
+                    path=path,
+                    dandiset_path=dandiset_path,
+                    bids_dataset_description_ref=weakref.ref(description),
+                )
+                description.dataset_files.append(asset)
+            yield description
+            yield from description.dataset_files
+
+    monkeypatch.setattr(_core, "find_dandi_files", find_dandi_files)
+    return validate(dandiset_path, jobs=jobs)
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_validate_shared_results_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int | None
+) -> None:
+    """Results reported for both a BIDS dataset & its assets are yielded once"""
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000001'\n")
+    results = list(_validate_synthetic(tmp_path, monkeypatch, 2, 3, 4, jobs=jobs))
+    assert [(r.path, r.message) for r in results] == [
+        (p, f"Result {i}")
+        for d in range(2)
+        for p, i in [(tmp_path / f"ds{d}", "dataset")]
+        + [
+            (tmp_path / f"ds{d}" / f"sub-{a}" / "data.dat", i)
+            for a in range(3)
+            for i in range(4)
+        ]
+    ]
+
+
+def test_shared_result_filter_bounded() -> None:
+    shared_filter = _core._SharedResultFilter(maxsize=10)
+    results = [_synthetic_result(Path("foo"), i) for i in range(20)]
+    assert all(shared_filter.is_new(r) for r in results)
+    assert len(shared_filter._pending) == 10
+    # Repeated reports of the most recent results are recognized ...
+    assert not any(shared_filter.is_new(r) for r in results[10:])
+    # ... as is an equal but distinct object
+    assert shared_filter.is_new(results[0].model_copy())
+    assert not shared_filter.is_new(results[0].model_copy())
+    assert len(shared_filter._pending) == 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.timeout(1800)
+def test_validate_shared_results_memory_benchmark(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Validate synthetic BIDS datasets producing 1M and then 10M results in
+    total (each reported twice) & check that the memory used does not grow
+    with their number
+    """
+    import resource
+
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000001'\n")
+    maxrss: list[int] = []
+    for n_datasets in (100, 1000):
+        start = time.perf_counter()
+        n = sum(
+            1 for _ in _validate_synthetic(tmp_path, monkeypatch, n_datasets, 100, 50)
+        )
+        elapsed = time.perf_counter() - start
+        # In KiB on Linux:
+        maxrss.append(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        assert n == n_datasets * (100 * 50 + 1)
+        print(
+            f"{2 * n_datasets * 100 * 50} results reported, {n} yielded in"
+            f" {elapsed:.1f}s; peak RSS: {maxrss[-1] / 1024:.1f} MiB"
+        )
+    # Keeping the yielded results would take gigabytes:
+    assert maxrss[1] - maxrss[0] < 64 * 1024
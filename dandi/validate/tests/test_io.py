@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+import time
+from typing import Any
 
 import pytest
 
 from dandi.validate._io import (
+    convert_validation_log,
+    is_validation_index,
+    iter_validation_index,
+    iter_validation_log,
     load_validation_jsonl,
     validation_companion_path,
+    write_validation_index,
     write_validation_jsonl,
 )
 from dandi.validate._types import (
@@ -114,3 +121,109 @@ class TestCompanionPath:
         """String input is accepted."""
         companion = validation_companion_path("/tmp/test.log")
         assert companion == Path("/tmp/test_validation.jsonl")
+
+
+class TestIndexedLog:
+    RESULTS = [
+        _make_result("A.one", Severity.ERROR),
+        _make_result("A.two", Severity.WARNING),
+        _make_result("B.one", Severity.HINT),
+        _make_result("A.one", Severity.CRITICAL),
+    ]
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        out = tmp_path / "results.vlog"
+        assert write_validation_index(self.RESULTS, out) == out
+        assert is_validation_index(out)
+        assert list(iter_validation_index(out)) == self.RESULTS
+        # Overwriting & appending:
+        write_validation_index(self.RESULTS[:1], out)
+        write_validation_index(self.RESULTS[1:], out, append=True)
+        assert list(iter_validation_index(out)) == self.RESULTS
+
+    def test_filters(self, tmp_path: Path) -> None:
+        out = write_validation_index(self.RESULTS, tmp_path / "results.vlog")
+
+        def ids(**kwargs: Any) -> list[tuple[str, Severity | None]]:
+            return [(r.id, r.severity) for r in iter_validation_index(out, **kwargs)]
+
+        assert ids(min_severity=Severity.ERROR) == [
+            ("A.one", Severity.ERROR),
+            ("A.one", Severity.CRITICAL),
+        ]
+        assert ids(ignore=r"\.one$") == [("A.two", Severity.WARNING)]
+        assert ids(min_severity=Severity.WARNING, ignore="^A.o") == [
+            ("A.two", Severity.WARNING)
+        ]
+        assert ids(ids=["B.one", "A.two"]) == [
+            ("A.two", Severity.WARNING),
+            ("B.one", Severity.HINT),
+        ]
+        assert ids(paths=["/tmp/B.one.nwb"]) == [("B.one", Severity.HINT)]
+        assert ids(validators=["dandi"]) == ids()
+        assert ids(validators=["nwbinspector"]) == []
+
+    def test_lazy(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Only the records of matching results are parsed"""
+        out = write_validation_index(self.RESULTS, tmp_path / "results.vlog")
+        parsed: list[bytes] = []
+        model_validate_json = ValidationResult.model_validate_json
+
+        def counting_validate_json(data: bytes) -> ValidationResult:
+            parsed.append(data)
+            return model_validate_json(data)
+
+        monkeypatch.setattr(
+            ValidationResult, "model_validate_json", counting_validate_json
+        )
+        results = list(iter_validation_index(out, min_severity=Severity.CRITICAL))
+        assert [r.severity for r in results] == [Severity.CRITICAL]
+        assert len(parsed) == 1
+
+    def test_iter_validation_log(self, tmp_path: Path) -> None:
+        jsonl = write_validation_jsonl(self.RESULTS[:2], tmp_path / "a.jsonl")
+        index = write_validation_index(self.RESULTS[2:], tmp_path / "b.vlog")
+        assert not is_validation_index(jsonl)
+        assert list(iter_validation_log([jsonl, index])) == self.RESULTS
+        assert [
+            r.severity
+            for r in iter_validation_log(
+                [jsonl, index], min_severity=Severity.WARNING, ignore="two"
+            )
+        ] == [Severity.ERROR, Severity.CRITICAL]
+
+    def test_convert(self, tmp_path: Path) -> None:
+        jsonl = write_validation_jsonl(self.RESULTS, tmp_path / "a.jsonl")
+        index = tmp_path / "b.vlog"
+        assert convert_validation_log(jsonl, index) == len(self.RESULTS)
+        assert list(iter_validation_index(index)) == self.RESULTS
+        jsonl2 = tmp_path / "c.jsonl"
+        assert convert_validation_log(index, jsonl2) == len(self.RESULTS)
+        assert jsonl2.read_text() == jsonl.read_text()
+
+    @pytest.mark.benchmark
+    def test_filter_benchmark(self, tmp_path: Path) -> None:
+        """
+        Time loading the errors among 200k results from a JSONL file & from an
+        indexed validation log
+        """
+        results = [
+            _make_result(
+                f"T.{i % 100}", Severity.ERROR if i % 100 == 0 else Severity.HINT
+            )
+            for i in range(200_000)
+        ]
+        jsonl = write_validation_jsonl(results, tmp_path / "results.jsonl")
+        index = write_validation_index(results, tmp_path / "results.vlog")
+        timings: dict[str, float] = {}
+        for name, path in [("jsonl", jsonl), ("indexed", index)]:
+            start = time.perf_counter()
+            errors = list(iter_validation_log([path], min_severity=Severity.ERROR))
+            timings[name] = time.perf_counter() - start
+            assert len(errors) == 2000
+        print(
+            f"Sizes: JSONL: {jsonl.stat().st_size / 2**20:.1f} MiB,"
+            f" indexed: {index.stat().st_size / 2**20:.1f} MiB; loading errors:"
+            + ", ".join(f" {name}: {t:.2f}s" for name, t in timings.items())
+        )
+        assert timings["indexed"] < timings["jsonl"]
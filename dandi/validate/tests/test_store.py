@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import shutil
+from typing import Any
+
+import pytest
+
+from .._core import validate
+from .._store import ValidationStore, file_fingerprint, tree_fingerprint
+from .._types import ORIGIN_VALIDATION_DANDI_LAYOUT, Scope, Severity, ValidationResult
+from ...consts import dandiset_metadata_file
+from ...files import bases, bids
+
+
+def _summarize(results: list[ValidationResult]) -> list[tuple]:
+    return [(r.id, r.severity, r.path, r.message) for r in results]
+
+
+@pytest.fixture
+def nwb_dandiset(organized_nwb_dir2: Path, tmp_path: Path) -> Path:
+    ds = tmp_path / "dandiset"
+    shutil.copytree(organized_nwb_dir2, ds)
+    return ds
+
+
+def test_validate_nwb_stored(
+    nwb_dandiset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inspected: list[Path] = []
+    inspect_nwbfile = bases._inspect_nwbfile
+
+    def counting_inspect(filepath: Path, *args: Any) -> list:
+        inspected.append(filepath)
+        return inspect_nwbfile(filepath, *args)
+
+    monkeypatch.setattr(bases, "_inspect_nwbfile", counting_inspect)
+    nwbs = sorted(nwb_dandiset.glob("*/*.nwb"))
+    assert len(nwbs) == 2
+
+    first = list(validate(nwb_dandiset))
+    assert sorted(inspected) == nwbs
+    inspected.clear()
+
+    # Nothing changed, so nothing is validated anew
+    assert _summarize(list(validate(nwb_dandiset))) == _summarize(first)
+    assert inspected == []
+
+    # Only the modified file is validated anew
+    st = nwbs[0].stat()
+    os.utime(nwbs[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _summarize(list(validate(nwb_dandiset))) == _summarize(first)
+    assert inspected == [nwbs[0]]
+
+
+@pytest.mark.parametrize("envvar", ["ignore", "clear"])
+def test_validate_nwb_store_dandi_cache(
+    nwb_dandiset: Path, monkeypatch: pytest.MonkeyPatch, envvar: str
+) -> None:
+    list(validate(nwb_dandiset))
+    inspected: list[Path] = []
+    inspect_nwbfile = bases._inspect_nwbfile
+
+    def counting_inspect(filepath: Path, *args: Any) -> list:
+        inspected.append(filepath)
+        return inspect_nwbfile(filepath, *args)
+
+    monkeypatch.setattr(bases, "_inspect_nwbfile", counting_inspect)
+    monkeypatch.setenv("DANDI_CACHE", envvar)
+    list(validate(nwb_dandiset))
+    assert len(inspected) == 2
+
+
+def test_validation_store_tokens(
+    nwb_dandiset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = ValidationStore.for_dandiset(nwb_dandiset)
+    assert store is not None
+    assert ValidationStore.for_dandiset(nwb_dandiset) is store
+    path = nwb_dandiset / dandiset_metadata_file
+    fp = file_fingerprint(path)
+    assert fp is not None
+    result = ValidationResult(
+        id="DANDI.TEST",
+        origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+        scope=Scope.FILE,
+        severity=Severity.WARNING,
+        path=path,
+        message="Test",
+    )
+    assert store.get(path, "test", fp) is None
+    store.set(path, "test", fp, [result])
+    assert store.get(path, "test", fp) == [result]
+    assert store.get(path, "test", fp, ["other-args"]) is None
+    assert store.get(path, "test", "other-fingerprint") is None
+    # Results of other versions of the validators are not used:
+    monkeypatch.setattr("dandi.validate._store._tokens", '["other"]')
+    assert store.get(path, "test", fp) is None
+
+
+def test_tree_fingerprint(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("a")
+    fp = tree_fingerprint(tmp_path)
+    assert fp is not None
+    assert tree_fingerprint(tmp_path) == fp
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    fp2 = tree_fingerprint(tmp_path)
+    assert fp2 != fp
+    (tmp_path / "sub" / "b.txt").write_text("bb")
+    assert tree_fingerprint(tmp_path) != fp2
+    assert tree_fingerprint(tmp_path / "nonexistent") is None
+
+
+def test_validate_bids_stored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000001'\n")
+    (tmp_path / "dataset_description.json").write_text(
+        '{"Name": "Test", "BIDSVersion": "1.8.0"}'
+    )
+    (tmp_path / "sub-01" / "anat").mkdir(parents=True)
+    (tmp_path / "sub-01" / "anat" / "sub-01_T1w.nii.gz").write_bytes(b"")
+    calls: list[Path] = []
+
+    def mock_bids_validate(path: Path, **_kwargs: Any) -> list[ValidationResult]:
+        calls.append(path)
+        return [
+            ValidationResult(
+                id="BIDS.EMPTY_FILE",
+                origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                scope=Scope.FILE,
+                severity=Severity.ERROR,
+                path=path / "sub-01" / "anat" / "sub-01_T1w.nii.gz",
+                dataset_path=path,
+                message="Empty file",
+            )
+        ]
+
+    monkeypatch.setattr(bids, "bids_validate", mock_bids_validate)
+    first = list(validate(tmp_path))
+    assert [r.id for r in first] == ["BIDS.EMPTY_FILE"]
+    assert calls == [tmp_path]
+    assert _summarize(list(validate(tmp_path))) == _summarize(first)
+    assert calls == [tmp_path]
+    # A new file in the dataset invalidates the stored results
+    (tmp_path / "README").write_text("Test\n")
+    assert _summarize(list(validate(tmp_path))) == _summarize(first)
+    assert calls == [tmp_path, tmp_path]
+
+
+def _make_bids_dataset(root: Path) -> list[Path]:
+    (root / dandiset_metadata_file).write_text("identifier: '000001'\n")
+    (root / "dataset_description.json").write_text(
+        '{"Name": "Test", "BIDSVersion": "1.8.0"}'
+    )
+    (root / "participants.tsv").write_text("participant_id\nsub-01\nsub-02\n")
+    files = [
+        root / "sub-01" / "anat" / "sub-01_T1w.nii.gz",
+        root / "sub-02" / "ses-01" / "anat" / "sub-02_ses-01_T1w.nii.gz",
+        root / "sub-02" / "ses-02" / "anat" / "sub-02_ses-02_T1w.nii.gz",
+    ]
+    for f in files:
+        f.parent.mkdir(parents=True)
+        f.write_bytes(b"")
+    return files
+
+
+def _touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**9))
+
+
+def test_validate_bids_stored_incremental(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = _make_bids_dataset(tmp_path)
+    calls: list[list[str]] = []
+
+    def mock_bids_validate(path: Path, **_kwargs: Any) -> list[ValidationResult]:
+        # One result per file validated, plus one for the dataset as a whole
+        path = path.resolve()
+        validated = sorted(
+            p.relative_to(path).as_posix() for p in path.rglob("*") if p.is_file()
+        )
+        calls.append(validated)
+        return [
+            ValidationResult(
+                id="BIDS.TEST",
+                origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                scope=Scope.FILE if p else Scope.DATASET,
+                severity=Severity.ERROR,
+                path=path / p if p else None,
+                dataset_path=path,
+                message=p or "Dataset",
+            )
+            for p in ["", *validated]
+        ]
+
+    def summary() -> list[tuple]:
+        return sorted(_summarize(list(validate(tmp_path))), key=str)
+
+    monkeypatch.setattr(bids, "bids_validate", mock_bids_validate)
+    first = summary()
+    assert len(calls) == 1
+    assert summary() == first
+    assert len(calls) == 1
+
+    # Only the changed session is validated anew, along with the files its
+    # files may inherit from
+    _touch(files[1])
+    assert summary() == first
+    assert calls[-1] == [
+        dandiset_metadata_file,
+        "dataset_description.json",
+        "participants.tsv",
+        "sub-02/ses-01/anat/sub-02_ses-01_T1w.nii.gz",
+    ]
+
+    # A changed file of a subject outside of its sessions concerns all of them
+    (tmp_path / "sub-02" / "sub-02_sessions.tsv").write_text("session_id\n")
+    second = summary()
+    assert calls[-1] == [
+        dandiset_metadata_file,
+        "dataset_description.json",
+        "participants.tsv",
+        "sub-02/ses-01/anat/sub-02_ses-01_T1w.nii.gz",
+        "sub-02/ses-02/anat/sub-02_ses-02_T1w.nii.gz",
+        "sub-02/sub-02_sessions.tsv",
+    ]
+    assert len(second) == len(first) + 1
+
+    # Changes to top-level files or to the set of subjects require validating
+    # the whole dataset
+    _touch(tmp_path / "participants.tsv")
+    assert summary() == second
+    assert len(calls[-1]) == 7
+    (tmp_path / "sub-03").mkdir()
+    assert summary() == second
+    assert len(calls[-1]) == 7
+
+
+def test_validate_bids_incremental_real(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    files = _make_bids_dataset(tmp_path)
+    list(validate(tmp_path))
+    files[2].write_bytes(b"\0" * 352)
+    with caplog.at_level(logging.DEBUG, logger="dandi"):
+        incremental = sorted(_summarize(list(validate(tmp_path))), key=str)
+    assert "Validating 1 changed subjects/sessions" in caplog.text
+    monkeypatch.setenv("DANDI_CACHE", "clear")
+    assert sorted(_summarize(list(validate(tmp_path))), key=str) == incremental